@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+clean_text 벤치마크
+기존 4단계 정규식 방식과 단일 스캔 방식(clean_text, clean_lines)의 속도를 비교합니다.
+
+사용법:
+    PYTHONPATH=. python bench/bench_clean_text.py [--lines 200000] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import time
+from src.subtitle_processor import SubtitleProcessor
+
+VTT_TAG_REGEX = re.compile(r'<[^>]*>')
+URL_REGEX = re.compile(r'https?://\S+')
+MUSIC_TAG_REGEX = re.compile(r'\(.*?\)')
+EMOJI_REGEX = SubtitleProcessor.EMOJI_REGEX
+
+WORDS = ['안녕하세요', '여러분', '오늘은', '정말', '맛있는', '음식을', '먹어', '볼게요', '그래서', '이제',
+         'hello', 'everyone', 'today', 'we', 'are', 'going', 'to', 'cook', 'something', 'great']
+
+
+def legacy_clean_text(text: str) -> str:
+    """기존 clean_text (정규식 4회 적용)"""
+    text = VTT_TAG_REGEX.sub('', text)
+    text = URL_REGEX.sub('', text)
+    text = MUSIC_TAG_REGEX.sub('', text)
+    text = EMOJI_REGEX.sub('', text)
+    return text.strip()
+
+
+def make_auto_caption_lines(count: int, seed: int = 0) -> list:
+    """YouTube 자동 생성 자막과 비슷한 줄 목록 생성 (단어별 타임스탬프 태그, 이모지, URL, 음악 태그 포함)"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        words = rng.sample(WORDS, rng.randint(3, 8))
+        kind = rng.random()
+        if kind < 0.5:
+            tagged = ''.join(
+                f'<00:{i // 60 % 60:02d}:{i % 60:02d}.{rng.randint(0, 999):03d}><c> {w}</c>' for w in words[1:]
+            )
+            lines.append(words[0] + tagged)
+        elif kind < 0.85:
+            lines.append(' '.join(words))
+        elif kind < 0.92:
+            lines.append(' '.join(words) + ' 😀🎉')
+        elif kind < 0.97:
+            lines.append('(음악) ' + ' '.join(words) + ' (웃음)')
+        else:
+            lines.append(' '.join(words) + ' https://example.com/' + words[0])
+    return lines
+
+
+def make_rolling_vtt(lines: list) -> str:
+    """
+    YouTube 자동 생성 자막 형식의 VTT 생성
+    큐마다 이전 줄(태그 없음)과 새 줄(단어별 태그)이 함께 들어가는 롤링 구조입니다.
+    """
+    out = ['WEBVTT', 'Kind: captions', 'Language: ko', '']
+    prev = ''
+    for i, line in enumerate(lines):
+        start, end = i * 2000, i * 2000 + 1990
+        out.append(f"{start // 3600000:02d}:{start // 60000 % 60:02d}:{start // 1000 % 60:02d}.{start % 1000:03d} --> "
+                   f"{end // 3600000:02d}:{end // 60000 % 60:02d}:{end // 1000 % 60:02d}.{end % 1000:03d} align:start position:0%")
+        out.append(prev)
+        out.append(line)
+        out.append('')
+        prev = legacy_clean_text(line)
+    return '\n'.join(out)
+
+
+def legacy_parse_vtt(vtt_text: str) -> list:
+    """기존 parse_vtt (모든 텍스트 줄을 legacy_clean_text로 정리)"""
+    time_blocks = []
+    current_time = None
+    current_text = ''
+    for raw_line in vtt_text.split('\n'):
+        line = raw_line.strip()
+        if not line or line.startswith('WEBVTT') or line.startswith('Kind:') or line.startswith('Language:'):
+            continue
+        match = SubtitleProcessor.TIME_REGEX.match(line)
+        if match:
+            if current_time is not None and current_text:
+                time_blocks.append({'time': current_time, 'text': current_text})
+            current_time = SubtitleProcessor.simplify_timestamp(match.group(1))
+            current_text = ''
+        else:
+            current_text = legacy_clean_text(line)
+    if current_time is not None and current_text:
+        time_blocks.append({'time': current_time, 'text': current_text})
+    return time_blocks
+
+
+def measure(func, repeat: int) -> float:
+    """repeat번 실행 중 가장 빠른 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='clean_text 단일 스캔 방식 벤치마크')
+    parser.add_argument('--lines', type=int, default=200000, help='생성할 자막 줄 수 (기본값: 200000)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수, 가장 빠른 값 사용 (기본값: 3)')
+    args = parser.parse_args()
+
+    lines = make_auto_caption_lines(args.lines)
+    expected = [legacy_clean_text(line) for line in lines]
+    assert [SubtitleProcessor.clean_text(line) for line in lines] == expected, 'clean_text 결과가 다릅니다'
+    assert SubtitleProcessor.clean_lines(lines) == expected, 'clean_lines 결과가 다릅니다'
+
+    results = [
+        ('legacy (4-pass)', measure(lambda: [legacy_clean_text(line) for line in lines], args.repeat)),
+        ('clean_text', measure(lambda: [SubtitleProcessor.clean_text(line) for line in lines], args.repeat)),
+        ('clean_lines', measure(lambda: SubtitleProcessor.clean_lines(lines), args.repeat)),
+    ]
+
+    print_table(f"clean_text: 자막 {len(lines):,}줄", results, len(lines), '줄/초')
+
+    vtt_text = make_rolling_vtt(lines)
+    processor = SubtitleProcessor()
+    assert processor.parse_vtt(vtt_text) == legacy_parse_vtt(vtt_text), 'parse_vtt 결과가 다릅니다'
+    results = [
+        ('legacy parse_vtt', measure(lambda: legacy_parse_vtt(vtt_text), args.repeat)),
+        ('parse_vtt', measure(lambda: processor.parse_vtt(vtt_text), args.repeat)),
+    ]
+    print_table(f"parse_vtt: 롤링 자동 자막 {len(lines):,}큐 ({len(vtt_text) / 1024 / 1024:.1f} MB)",
+                results, len(lines), '큐/초')
+
+
+def print_table(title: str, results: list, count: int, unit: str):
+    """첫 번째 결과를 기준으로 속도 향상 표 출력"""
+    baseline = results[0][1]
+    print(title)
+    print("-" * 60)
+    print(f"{'방식':<20}{'시간(ms)':>12}{unit:>14}{'속도 향상':>12}")
+    print("-" * 60)
+    for name, seconds in results:
+        print(f"{name:<20}{seconds * 1000:>12.1f}{count / seconds:>14,.0f}{baseline / seconds:>11.2f}x")
+    print("-" * 60)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+롤링 오버랩 제거 방식 비교 벤치마크
+process()의 prefix(기존)와 partial(부분 겹침 제거) 모드의 결과 크기와 시간을 합성 코퍼스로 비교합니다.
+
+사용법:
+    PYTHONPATH=. python bench/bench_overlap.py [--kinds auto,overlap] [--duration 1h] [--min-overlap 10]
+"""
+
+import time
+import argparse
+
+from src.subtitle_processor import SubtitleProcessor
+from bench.corpus import KINDS, make_vtt, parse_duration, format_duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description='롤링 오버랩 제거 방식(prefix/partial) 비교')
+    parser.add_argument('--kinds', default=','.join(KINDS), help=f"코퍼스 종류 (기본값: {','.join(KINDS)})")
+    parser.add_argument('--duration', default='1h', help='영상 길이 (기본값: 1h)')
+    parser.add_argument('--min-overlap', type=int, default=SubtitleProcessor.MIN_OVERLAP_CHARS,
+                        help=f"partial 모드 최소 겹침 길이 (기본값: {SubtitleProcessor.MIN_OVERLAP_CHARS})")
+    parser.add_argument('--seed', type=int, default=0, help='코퍼스 seed (기본값: 0)')
+    args = parser.parse_args()
+
+    processor = SubtitleProcessor()
+    duration = parse_duration(args.duration)
+    print(f"코퍼스 길이 {format_duration(duration)}, 최소 겹침 {args.min_overlap}자")
+    print("-" * 78)
+    print(f"{'코퍼스':<10}{'prefix(자)':>14}{'partial(자)':>14}{'감소율':>10}{'prefix(ms)':>14}{'partial(ms)':>14}")
+    print("-" * 78)
+
+    for kind in [kind.strip() for kind in args.kinds.split(',') if kind.strip()]:
+        vtt_text = make_vtt(kind, duration, args.seed)
+        sizes, times = {}, {}
+        for mode in SubtitleProcessor.OVERLAP_MODES:
+            start = time.perf_counter()
+            transcript = processor.process(vtt_text, overlap=mode, min_overlap=args.min_overlap) or ''
+            times[mode] = time.perf_counter() - start
+            sizes[mode] = len(transcript)
+
+        drop = 1 - sizes['partial'] / sizes['prefix'] if sizes['prefix'] else 0.0
+        print(f"{kind:<10}{sizes['prefix']:>14,}{sizes['partial']:>14,}{drop:>10.1%}"
+              f"{times['prefix'] * 1000:>14.1f}{times['partial'] * 1000:>14.1f}")
+    print("-" * 78)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+SubtitleProcessor 단계별 벤치마크
+합성 코퍼스(bench/corpus.py)로 parse_vtt, clean_text, remove_rolling_overlap, process의
+시간·처리량(큐/초)·최대 메모리를 측정하고, 저장해 둔 기준값과 비교합니다. 네트워크를 사용하지 않습니다.
+
+사용법:
+    PYTHONPATH=. python bench/bench_processor.py
+    PYTHONPATH=. python bench/bench_processor.py --kinds auto,manual --durations 10m,1h --save bench/baseline.json
+    PYTHONPATH=. python bench/bench_processor.py --baseline bench/baseline.json --fail-on-regression
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from src.subtitle_processor import SubtitleProcessor
+from bench.corpus import KINDS, make_vtt, parse_duration, format_duration
+
+STAGES = ('parse_vtt', 'parse_vtt_store', 'clean_text', 'remove_rolling_overlap', 'process')
+DEFAULT_DURATIONS = '10m,1h,4h,12h'
+
+
+def count_cues(vtt_text: str) -> int:
+    """타임스탬프 줄 수"""
+    return sum(1 for line in vtt_text.split('\n') if SubtitleProcessor.TIME_REGEX.match(line.strip()))
+
+
+def text_lines(vtt_text: str) -> List[str]:
+    """헤더와 타임스탬프를 뺀 자막 텍스트 줄 (clean_text 단계 입력)"""
+    lines = []
+    for raw_line in vtt_text.split('\n'):
+        line = raw_line.strip()
+        if (not line or line.startswith('WEBVTT') or line.startswith('Kind:') or
+                line.startswith('Language:') or SubtitleProcessor.TIME_REGEX.match(line)):
+            continue
+        lines.append(line)
+    return lines
+
+
+def build_stages(processor: SubtitleProcessor, vtt_text: str) -> Dict[str, Callable]:
+    """단계 이름 -> 인자 없는 측정 함수 (앞 단계 결과는 미리 만들어 둠)"""
+    lines = text_lines(vtt_text)
+    blocks = processor.parse_vtt(vtt_text)
+    clean_text = processor.clean_text
+    return {
+        'parse_vtt': lambda: processor.parse_vtt(vtt_text),
+        'parse_vtt_store': lambda: processor.parse_vtt(vtt_text, as_store=True),
+        'clean_text': lambda: [clean_text(line) for line in lines],
+        'remove_rolling_overlap': lambda: processor.remove_rolling_overlap(blocks),
+        'process': lambda: processor.process(vtt_text),
+    }
+
+
+def measure_time(func: Callable, repeat: int) -> float:
+    """repeat번 실행 중 가장 빠른 시간(초, 첫 실행은 워밍업으로 버림)"""
+    func()
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_peak_memory(func: Callable) -> int:
+    """
+    한 번 실행하는 동안 새로 할당된 메모리의 최댓값(바이트)
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 따로 실행합니다.
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+
+def run(kinds: List[str], durations: List[int], stages: List[str], repeat: int, seed: int) -> Dict[str, Dict]:
+    """모든 (종류, 길이, 단계) 조합을 측정해 '종류/길이/단계' 키의 결과 dict 반환"""
+    processor = SubtitleProcessor()
+    results = {}
+    for kind in kinds:
+        for duration in durations:
+            vtt_text = make_vtt(kind, duration, seed)
+            cues = count_cues(vtt_text)
+            size_mb = len(vtt_text.encode('utf-8')) / 1024 / 1024
+            print(f"📦 {kind}/{format_duration(duration)}: {cues:,}큐, {size_mb:.1f} MB")
+
+            funcs = build_stages(processor, vtt_text)
+            for stage in stages:
+                seconds = measure_time(funcs[stage], repeat)
+                peak = measure_peak_memory(funcs[stage])
+                results[f"{kind}/{format_duration(duration)}/{stage}"] = {
+                    'seconds': round(seconds, 6),
+                    'cues': cues,
+                    'cues_per_sec': round(cues / seconds) if seconds else None,
+                    'peak_mb': round(peak / 1024 / 1024, 3),
+                }
+    return results
+
+
+def print_results(results: Dict[str, Dict], baseline: Dict[str, Dict] = None, threshold: float = 0.1) -> List[str]:
+    """
+    결과 표 출력 (기준값이 있으면 시간·메모리 비율도 출력)
+
+    Returns:
+        기준값보다 threshold 이상 느려지거나 메모리를 더 쓴 항목 키 목록
+    """
+    regressions = []
+    header = f"{'코퍼스/단계':<40}{'시간(ms)':>11}{'큐/초':>12}{'최대 메모리(MB)':>16}"
+    if baseline:
+        header += f"{'시간 비율':>11}{'메모리 비율':>12}"
+    print("=" * len(header))
+    print(header)
+    print("=" * len(header))
+
+    for key, result in results.items():
+        cps = f"{result['cues_per_sec']:,}" if result['cues_per_sec'] else '-'
+        row = f"{key:<40}{result['seconds'] * 1000:>11.1f}{cps:>12}{result['peak_mb']:>16.2f}"
+        base = (baseline or {}).get(key)
+        if base:
+            time_ratio = result['seconds'] / base['seconds'] if base['seconds'] else 1.0
+            mem_ratio = result['peak_mb'] / base['peak_mb'] if base['peak_mb'] else 1.0
+            regressed = time_ratio > 1 + threshold or mem_ratio > 1 + threshold
+            row += f"{time_ratio:>10.2f}x{mem_ratio:>11.2f}x"
+            if regressed:
+                row += "  ⚠️"
+                regressions.append(key)
+        elif baseline:
+            row += f"{'-':>11}{'-':>12}"
+        print(row)
+    print("=" * len(header))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SubtitleProcessor 단계별 오프라인 벤치마크')
+    parser.add_argument('--kinds', default=','.join(KINDS), help=f"코퍼스 종류 (기본값: {','.join(KINDS)})")
+    parser.add_argument('--durations', default=DEFAULT_DURATIONS, help=f"영상 길이 목록 (기본값: {DEFAULT_DURATIONS})")
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"측정할 단계 (기본값: {','.join(STAGES)})")
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수, 가장 빠른 값 사용 (기본값: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='코퍼스 seed (기본값: 0)')
+    parser.add_argument('--save', metavar='PATH', help='결과를 기준값 JSON으로 저장')
+    parser.add_argument('--baseline', metavar='PATH', help='비교할 기준값 JSON')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='기준값 대비 허용 증가율 (기본값: 0.1 = 10%%)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='기준값보다 나빠진 항목이 있으면 종료 코드 1')
+    args = parser.parse_args()
+
+    kinds = [kind.strip() for kind in args.kinds.split(',') if kind.strip()]
+    durations = [parse_duration(value) for value in args.durations.split(',') if value.strip()]
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    for stage in stages:
+        if stage not in STAGES:
+            parser.error(f"알 수 없는 단계: {stage} (지원: {', '.join(STAGES)})")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline_data = json.load(f)
+        baseline = baseline_data['results']
+        print(f"📏 기준값: {args.baseline} ({baseline_data['meta'].get('created_at', '?')})")
+
+    results = run(kinds, durations, stages, args.repeat, args.seed)
+    regressions = print_results(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({
+                'meta': {
+                    'created_at': datetime.now().isoformat(timespec='seconds'),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'repeat': args.repeat,
+                    'seed': args.seed,
+                },
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준값 저장: {args.save}")
+
+    if baseline:
+        if regressions:
+            print(f"⚠️ 기준값보다 {args.threshold:.0%} 이상 나빠진 항목 {len(regressions)}개")
+        else:
+            print("✅ 기준값 대비 성능 저하 없음")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+스로틀링 환경 처리량 벤치마크
+초당 허용량을 넘으면 HTTP 429를 돌려주는 로컬 가짜 서버에 여러 작업자가 요청을 보내,
+고정 속도 + 즉시 재시도(기존 방식)와 AdaptiveRateLimiter(AIMD + 지터 백오프)의 처리량을 비교합니다.
+네트워크 없이 실행됩니다.
+
+사용법:
+    PYTHONPATH=. python bench/bench_throttle.py [--server-rate 5] [--client-rate 20] [--workers 8] [--duration 10]
+"""
+
+import time
+import argparse
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.rate_limiter import AdaptiveRateLimiter, HostRateLimiter, TokenBucket
+from src.ytdlp_fetcher import YtDlpFetcher
+
+
+class ThrottlingServer(ThreadingHTTPServer):
+    """초당 rate개까지 200, 넘으면 429 (retry_after를 주면 Retry-After 헤더 포함)"""
+
+    daemon_threads = True
+
+    def __init__(self, rate: float, retry_after: float = 0.0):
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.bucket = TokenBucket(rate, burst=max(1, int(rate)))
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.counts = {'ok': 0, 'throttled': 0}
+
+    def admit(self) -> bool:
+        # 대기하지 않는 토큰 확인 (잔고가 없으면 거절하고 예약을 취소)
+        bucket = self.bucket
+        with bucket._lock:
+            now = time.monotonic()
+            bucket._tokens = min(bucket.capacity, bucket._tokens + (now - bucket._last) * bucket.rate)
+            bucket._last = now
+            if bucket._tokens >= 1:
+                bucket._tokens -= 1
+                return True
+            return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        admitted = server.admit()
+        with server.lock:
+            server.counts['ok' if admitted else 'throttled'] += 1
+        self.send_response(200 if admitted else 429)
+        if not admitted and server.retry_after:
+            self.send_header('Retry-After', f"{server.retry_after:g}")
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+def fetch(url: str):
+    """실제 조회처럼 HTTP 오류를 YtDlpFetcher.classify_error로 분류해 던짐"""
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.read()
+    except Exception as e:
+        raise YtDlpFetcher.classify_error(e) from e
+
+
+def run(mode: str, url: str, args) -> dict:
+    """duration초 동안 workers개 작업자가 작업을 하나씩 처리 (작업마다 최대 retries번 재시도)"""
+    if mode == 'aimd':
+        limiter = AdaptiveRateLimiter(args.client_rate, burst=args.workers, max_retries=args.retries,
+                                      backoff_base=args.backoff_base, backoff_max=args.backoff_max)
+    else:
+        limiter = HostRateLimiter(args.client_rate, burst=args.workers)
+    done = {'ok': 0, 'failed': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def worker():
+        while time.monotonic() < deadline:
+            ok = False
+            if mode == 'aimd':
+                try:
+                    limiter.call(url, lambda: fetch(url))
+                    ok = True
+                except Exception:
+                    pass
+            else:
+                # 기존 방식: 고정 속도로 보내고 실패하면 바로 다시 시도
+                for _ in range(args.retries + 1):
+                    limiter.acquire(url)
+                    try:
+                        fetch(url)
+                        ok = True
+                        break
+                    except Exception:
+                        continue
+            with lock:
+                done['ok' if ok else 'failed'] += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(args.workers)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    result = {'mode': mode, 'elapsed': elapsed, **done}
+    if mode == 'aimd':
+        stats = limiter.stats()
+        result['final_rate'] = next(iter(stats['rates'].values()), args.client_rate)
+        result['decreases'] = stats['decreases']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스로틀링 환경에서 고정 속도 재시도와 AIMD 속도 제한기 비교')
+    parser.add_argument('--server-rate', type=float, default=5.0, help='서버가 허용하는 초당 요청 수 (기본값: 5)')
+    parser.add_argument('--retry-after', type=float, default=0.0, help='429 응답의 Retry-After(초), 0이면 헤더 없음')
+    parser.add_argument('--client-rate', type=float, default=20.0, help='클라이언트 최대 초당 요청 수 (기본값: 20)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 작업자 수 (기본값: 8)')
+    parser.add_argument('--duration', type=float, default=10.0, help='방식별 실행 시간(초) (기본값: 10)')
+    parser.add_argument('--retries', type=int, default=3, help='작업당 최대 재시도 횟수 (기본값: 3)')
+    parser.add_argument('--backoff-base', type=float, default=0.2, help='백오프 시작 대기 시간(초) (기본값: 0.2)')
+    parser.add_argument('--backoff-max', type=float, default=5.0, help='최대 백오프(초) (기본값: 5)')
+    parser.add_argument('--modes', default='fixed,aimd', help='비교할 방식 (기본값: fixed,aimd)')
+    args = parser.parse_args()
+
+    print(f"서버 허용 {args.server_rate:g}/초, 클라이언트 최대 {args.client_rate:g}/초, "
+          f"작업자 {args.workers}개, 방식별 {args.duration:g}초")
+    print("-" * 84)
+    print(f"{'방식':<8}{'성공 작업':>10}{'실패 작업':>10}{'성공/초':>10}{'요청':>8}{'429':>8}"
+          f"{'429 비율':>10}{'최종 속도':>10}{'감소':>6}")
+    print("-" * 84)
+
+    for mode in [mode.strip() for mode in args.modes.split(',') if mode.strip()]:
+        server = ThrottlingServer(args.server_rate, args.retry_after)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/watch"
+        try:
+            result = run(mode, url, args)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        requests = server.counts['ok'] + server.counts['throttled']
+        throttled_share = server.counts['throttled'] / requests if requests else 0.0
+        final_rate = f"{result['final_rate']:.2f}" if 'final_rate' in result else '-'
+        decreases = result.get('decreases', '-')
+        print(f"{mode:<8}{result['ok']:>10,}{result['failed']:>10,}{result['ok'] / result['elapsed']:>10.2f}"
+              f"{requests:>8,}{server.counts['throttled']:>8,}{throttled_share:>10.1%}{final_rate:>10}{decreases:>6}")
+
+
+if __name__ == '__main__':
+    main()
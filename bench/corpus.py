@@ -0,0 +1,145 @@
+"""
+벤치마크용 합성 자막 코퍼스 생성기
+같은 (종류, 길이, seed)에 대해 항상 같은 VTT를 만들어 네트워크 없이 반복 측정할 수 있게 합니다.
+
+종류:
+    auto   - YouTube 자동 생성 자막 (단어별 타임스탬프 태그, 10ms 전환 큐가 있는 롤링 구조)
+    overlap - 다음 큐가 이전 큐의 끝 단어 몇 개를 반복하는 자동 자막 (라이브 다시보기 등)
+    manual - 수동 작성 자막 (1~2줄 큐, 가끔 <i> 태그와 (음악) 같은 효과음 표기)
+    emoji  - 이모지가 많은 수동 자막
+    url    - URL이 많은 수동 자막 (괄호 안 URL 포함)
+"""
+
+import random
+from typing import List
+from src.cue_store import CueStore
+
+KINDS = ('auto', 'overlap', 'manual', 'emoji', 'url')
+
+WORDS = ['안녕하세요', '여러분', '오늘은', '정말', '맛있는', '음식을', '먹어', '볼게요', '그래서', '이제',
+         '진짜', '이거', '한번', '보시면', '됩니다', '구독', '좋아요', '알림', '설정', '부탁드려요',
+         'hello', 'everyone', 'today', 'we', 'are', 'going', 'to', 'cook', 'something', 'great',
+         'so', 'let', 'me', 'show', 'you', 'how', 'this', 'works', 'okay', 'right']
+EMOJIS = ['😀', '😂', '🎉', '🔥', '❤', '👍', '✨', '🙏', '😭', '🎵', '☕', '⭐']
+SOUND_TAGS = ['(음악)', '(웃음)', '(박수)', '(Music)', '(Applause)']
+DOMAINS = ['example.com', 'youtu.be', 'www.youtube.com', 'blog.example.co.kr', 'shop.example.net']
+
+HEADER = ['WEBVTT', 'Kind: captions', 'Language: ko', '']
+
+
+def parse_duration(value: str) -> int:
+    """'10m', '1h', '90s', '600' 형식의 길이를 초로 변환"""
+    value = value.strip().lower()
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def format_duration(seconds: int) -> str:
+    """초를 '10m', '12h' 같은 짧은 표기로 변환"""
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    if seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
+
+
+def _timing(start_ms: int, end_ms: int, settings: str = '') -> str:
+    line = f"{CueStore.format_timestamp(start_ms, precise=True)} --> {CueStore.format_timestamp(end_ms, precise=True)}"
+    return f"{line} {settings}" if settings else line
+
+
+def _sentence(rng: random.Random, low: int = 3, high: int = 8) -> List[str]:
+    return rng.sample(WORDS, rng.randint(low, high))
+
+
+def _url(rng: random.Random) -> str:
+    return f"https://{rng.choice(DOMAINS)}/{rng.choice(WORDS)}?v={rng.randint(0, 10 ** 6)}"
+
+
+def _auto(rng: random.Random, duration_ms: int, carry_rate: float = 0.0) -> List[str]:
+    out = list(HEADER)
+    prev_line = ''
+    t = 0
+    while t < duration_ms:
+        words = _sentence(rng)
+        if prev_line and rng.random() < carry_rate:
+            # 이전 줄의 끝 단어 2~4개를 다시 보여 주며 시작
+            words = prev_line.split()[-rng.randint(2, 4):] + words
+        length = rng.randint(1500, 3500)
+        step = length // len(words)
+        tagged = words[0] + ''.join(
+            f"<{CueStore.format_timestamp(t + step * i, precise=True)}><c> {word}</c>"
+            for i, word in enumerate(words[1:], start=1)
+        )
+        new_line = ' '.join(words)
+        if rng.random() < 0.03:
+            new_line = f"{rng.choice(SOUND_TAGS)} {new_line}"
+            tagged = f"{rng.choice(SOUND_TAGS)} {tagged}"
+
+        # 단어가 하나씩 나타나는 큐
+        out.append(_timing(t, t + length, 'align:start position:0%'))
+        out.extend((prev_line, tagged, ''))
+        # 두 줄이 모두 고정된 10ms 전환 큐
+        out.append(_timing(t + length, t + length + 10, 'align:start position:0%'))
+        out.extend((prev_line, new_line, ''))
+
+        prev_line = new_line
+        t += length + 10
+    return out
+
+
+def _manual(rng: random.Random, duration_ms: int, emoji_rate: float = 0.02, url_rate: float = 0.01) -> List[str]:
+    out = list(HEADER)
+    t = 0
+    while t < duration_ms:
+        length = rng.randint(1800, 5000)
+        lines = []
+        for _ in range(rng.choice((1, 1, 2))):
+            words = _sentence(rng, 2, 7)
+            if rng.random() < emoji_rate:
+                for _ in range(rng.randint(1, 4)):
+                    words.insert(rng.randint(0, len(words)), rng.choice(EMOJIS))
+            if rng.random() < url_rate:
+                url = _url(rng)
+                words.append(f"(링크: {url})" if rng.random() < 0.3 else url)
+            line = ' '.join(words)
+            roll = rng.random()
+            if roll < 0.05:
+                line = f"<i>{line}</i>"
+            elif roll < 0.08:
+                line = f"{rng.choice(SOUND_TAGS)} {line}"
+            lines.append(line)
+
+        out.append(_timing(t, t + length))
+        out.extend(lines)
+        out.append('')
+        t += length + rng.randint(0, 400)
+    return out
+
+
+def make_vtt(kind: str, duration: int, seed: int = 0) -> str:
+    """
+    합성 VTT 생성
+
+    Args:
+        kind: KINDS 중 하나
+        duration: 영상 길이(초)
+        seed: 난수 seed (같은 인자면 항상 같은 결과)
+    """
+    rng = random.Random(f"{kind}:{duration}:{seed}")
+    duration_ms = duration * 1000
+    if kind == 'auto':
+        lines = _auto(rng, duration_ms)
+    elif kind == 'overlap':
+        lines = _auto(rng, duration_ms, carry_rate=0.6)
+    elif kind == 'manual':
+        lines = _manual(rng, duration_ms)
+    elif kind == 'emoji':
+        lines = _manual(rng, duration_ms, emoji_rate=0.7)
+    elif kind == 'url':
+        lines = _manual(rng, duration_ms, url_rate=0.5)
+    else:
+        raise ValueError(f"알 수 없는 코퍼스 종류: {kind} (지원: {', '.join(KINDS)})")
+    return '\n'.join(lines)
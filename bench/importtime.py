@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+import 시간 프로파일러
+새 파이썬 프로세스에서 `python -X importtime -c "import <모듈>"`을 실행해 stderr를 표로 정리하고,
+결과를 JSON Lines 기록 파일에 쌓아 콜드 스타트 초기화 시간의 변화를 추적합니다.
+
+사용법:
+    python bench/importtime.py [모듈 ...] [--runs 5] [--top 20] [--history bench/importtime_history.jsonl]
+
+예시:
+    python bench/importtime.py lambda_function
+    python bench/importtime.py lambda_function src.subtitle_processor --history .importtime.jsonl
+    python bench/importtime.py lambda_function --call "lambda_function.warm_up()"
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional
+
+LINE_REGEX = re.compile(r'^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)')
+CALL_MARKER = '--- importtime call ---'
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """
+    -X importtime 출력을 [{'module', 'self_us', 'cumulative_us', 'depth'}] 목록으로 변환
+    depth 0인 항목이 직접 import한 모듈입니다.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = LINE_REGEX.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                'module': module,
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': (len(indent) - 1) // 2,
+            })
+    return entries
+
+
+def own_entries(entries: List[Dict], module: str) -> List[Dict]:
+    """
+    인터프리터 시작 시 import되는 모듈(site 등)을 빼고 요청한 모듈의 import 트리만 남김
+    -X importtime은 import가 끝난 순서로 출력하므로, 요청한 모듈의 첫 최상위 항목 바로 앞
+    최상위 항목까지가 시작 단계입니다.
+    """
+    root = module.split('.')[0]
+    top_indexes = [i for i, entry in enumerate(entries) if entry['depth'] == 0]
+    for position, index in enumerate(top_indexes):
+        name = entries[index]['module']
+        if name == root or name.startswith(root + '.'):
+            start = top_indexes[position - 1] + 1 if position else 0
+            return entries[start:]
+    return entries
+
+
+def run_once(module: str, call: Optional[str] = None) -> Dict:
+    """새 프로세스에서 모듈을 import하고 (선택) call 문을 실행해 import 표와 call 시간(ms)을 반환"""
+    code = f"import {module}"
+    if call:
+        # call 중에 일어난 import는 import 시간에 넣지 않도록 stderr에 경계 표시
+        code += (f"\nimport sys, time\nsys.stderr.write({CALL_MARKER!r} + '\\n')\n_t = time.perf_counter()\n"
+                 f"{call}\nprint((time.perf_counter() - _t) * 1000)")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT_DIR, os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, cwd=ROOT_DIR, env=env
+    )
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not LINE_REGEX.match(line)]
+        raise RuntimeError(f"{module} 실행 실패:\n{errors[-1] if errors else proc.stderr.strip()}")
+
+    import_log = proc.stderr.split(CALL_MARKER)[0]
+    entries = own_entries(parse_importtime(import_log), module)
+    total_us = sum(entry['cumulative_us'] for entry in entries if entry['depth'] == 0)
+    call_ms = float(proc.stdout.strip().splitlines()[-1]) if call else None
+    return {'entries': entries, 'total_ms': total_us / 1000, 'call_ms': call_ms}
+
+
+def profile(module: str, runs: int, call: Optional[str] = None) -> Dict:
+    """runs번 실행해 전체 시간이 가장 짧은 실행을 대표값으로 사용 (디스크 캐시 등 잡음 제거)"""
+    results = [run_once(module, call) for _ in range(runs)]
+    best = min(results, key=lambda result: result['total_ms'])
+    best['runs_ms'] = [round(result['total_ms'], 1) for result in results]
+    if call:
+        best['call_ms'] = min(result['call_ms'] for result in results)
+    return best
+
+
+def print_table(module: str, result: Dict, top: int):
+    print(f"\n📦 {module}: import {result['total_ms']:.1f} ms (실행별: {result['runs_ms']})")
+    if result.get('call_ms') is not None:
+        print(f"   호출 후 초기화: {result['call_ms']:.1f} ms")
+    print("-" * 72)
+    print(f"{'모듈':<46}{'자체(ms)':>12}{'누적(ms)':>12}")
+    print("-" * 72)
+    ranked = sorted(result['entries'], key=lambda entry: entry['cumulative_us'], reverse=True)[:top]
+    for entry in ranked:
+        name = '  ' * entry['depth'] + entry['module']
+        print(f"{name[:46]:<46}{entry['self_us'] / 1000:>12.1f}{entry['cumulative_us'] / 1000:>12.1f}")
+    print("-" * 72)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=ROOT_DIR, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(path: str, module: str, result: Dict, call: Optional[str]):
+    record = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': sys.version.split()[0],
+        'module': module,
+        'total_ms': round(result['total_ms'], 1),
+        'call': call,
+        'call_ms': round(result['call_ms'], 1) if result.get('call_ms') is not None else None,
+        'top': [
+            {'module': entry['module'], 'cumulative_ms': round(entry['cumulative_us'] / 1000, 1)}
+            for entry in sorted(result['entries'], key=lambda entry: entry['cumulative_us'], reverse=True)[:10]
+        ],
+    }
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def print_history(path: str, module: str, limit: int = 10):
+    """기록 파일에서 같은 모듈의 최근 결과와 직전 대비 변화 출력"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return
+    records = [record for record in records if record['module'] == module][-limit:]
+    if len(records) < 2:
+        return
+
+    print(f"\n📈 {module} import 시간 추이 (최근 {len(records)}회)")
+    prev = None
+    for record in records:
+        change = f"{record['total_ms'] - prev:+.1f}" if prev is not None else ''
+        call_ms = f"  호출 {record['call_ms']:.1f} ms" if record.get('call_ms') is not None else ''
+        print(f"   {record['created_at']}  {record.get('revision') or '-':<9}{record['total_ms']:>9.1f} ms"
+              f"{change:>10}{call_ms}")
+        prev = record['total_ms']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='-X importtime 기반 import 시간 프로파일러')
+    parser.add_argument('modules', nargs='*', default=['lambda_function'], help='측정할 모듈 (기본값: lambda_function)')
+    parser.add_argument('--runs', type=int, default=5, help='모듈별 실행 횟수, 가장 빠른 값 사용 (기본값: 5)')
+    parser.add_argument('--top', type=int, default=20, help='표에 출력할 모듈 수 (기본값: 20)')
+    parser.add_argument('--call', help='import 후 실행해 시간을 잴 문장 (예: "lambda_function.warm_up()")')
+    parser.add_argument('--history', help='결과를 쌓을 JSON Lines 파일 (지정하면 추이도 출력)')
+    args = parser.parse_args()
+
+    for module in args.modules:
+        result = profile(module, max(1, args.runs), args.call)
+        print_table(module, result, args.top)
+        if args.history:
+            append_history(args.history, module, result, args.call)
+            print_history(args.history, module)
+
+
+if __name__ == '__main__':
+    main()
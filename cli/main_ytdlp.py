@@ -13,12 +13,22 @@ youtube-transcript-api보다 더 강력하고 안정적입니다.
 """
 
 import argparse
+import io
 import sys
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional
 from src.ytdlp_fetcher import YtDlpFetcher
 from src.subtitle_processor import SubtitleProcessor
+from src.cue_writers import CUE_FORMATS
+from src.rate_limiter import AdaptiveRateLimiter
+from src.result_cache import ResultCache, LocalDiskCacheBackend
+from src.info_cache import InfoCache
+from src.state_index import StateIndex
+from src.transcript_index import TranscriptIndex
+from src.metrics import StageTimer
 
 
 def sanitize_filename(filename: str) -> str:
@@ -35,7 +45,8 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
-def create_metadata_header(video_info: dict, pinned_comment: dict = None, description: str = None, processing_time_ms: float = 0) -> str:
+def create_metadata_header(video_info: dict, pinned_comment: dict = None, description: str = None, processing_time_ms: float = 0,
+                           subtitle: dict = None) -> str:
     """자막 파일 상단에 추가할 메타데이터 생성"""
     header = []
     header.append("="*80)
@@ -47,6 +58,8 @@ def create_metadata_header(video_info: dict, pinned_comment: dict = None, descri
     header.append(f"영상 길이: {video_info['duration_string']} ({video_info['duration']}초)")
     header.append(f"채널명: {video_info['uploader']}")
     header.append(f"업로드 날짜: {video_info['upload_date']}")
+    if subtitle:
+        header.append(f"자막 언어: {format_subtitle(subtitle)}")
     header.append(f"처리 시간: {processing_time_ms:.2f} ms")
 
     if pinned_comment:
@@ -67,36 +80,465 @@ def create_metadata_header(video_info: dict, pinned_comment: dict = None, descri
     return "\n".join(header)
 
 
-def print_available_subtitles(video_url: str):
-    """사용 가능한 자막 목록 출력"""
+SUBTITLE_KIND_LABELS = {'manual': '수동', 'auto': '자동 생성', 'translated': '자동 번역'}
+
+
+def format_subtitle(subtitle: dict) -> str:
+    """자막 언어와 종류 표시 (예: ko (수동))"""
+    kind = SUBTITLE_KIND_LABELS.get(subtitle.get('kind'))
+    return f"{subtitle['lang']} ({kind})" if kind else subtitle['lang']
+
+
+def language_priority(lang: str) -> Optional[str]:
+    """
+    --lang 값이 우선순위 목록(쉼표, 종류 지정, 패턴 포함)이면 그대로, 언어 코드 하나면 None 반환
+    언어 코드 하나일 때는 fetch_all_in_one의 기본 규칙(수동/자동 → 자동 번역)을 따릅니다.
+    """
+    return lang if any(ch in lang for ch in ',:*?[') else None
+
+
+def result_path(video_info: dict, args: argparse.Namespace, total: int, suffix: Optional[str] = None,
+                extension: str = 'txt') -> Path:
+    """
+    결과 파일 경로 (단일 URL이면 --output, 아니면 output/영상 제목.확장자)
+
+    Args:
+        suffix: 파일명 뒤에 붙일 구분자 (--all-tracks의 언어 코드, 예: 제목.en.txt)
+        extension: --output이 없을 때 사용할 확장자 (--format)
+    """
+    if args.output and total == 1:
+        # 단일 URL일 때만 --output 사용 가능
+        output_path = Path(args.output)
+        if suffix:
+            output_path = output_path.with_name(f"{output_path.stem}.{suffix}{output_path.suffix}")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return output_path
+
+    # 영상 제목으로 자동 저장 (output/ 디렉토리)
+    script_dir = Path('output')
+    script_dir.mkdir(exist_ok=True)
+
+    # 파일명 생성 (영상 제목)
+    safe_title = sanitize_filename(video_info['title'])
+    filename = f"{safe_title}.{suffix}.{extension}" if suffix else f"{safe_title}.{extension}"
+    return script_dir / filename
+
+
+def save_result(result: str, video_info: dict, args: argparse.Namespace, total: int,
+                log: Callable[[str], None] = print, suffix: Optional[str] = None):
+    """
+    처리 결과를 화면에 출력하거나 파일로 저장
+
+    Args:
+        suffix: 파일명 뒤에 붙일 구분자 (--all-tracks의 언어 코드, 예: 제목.en.txt)
+    """
+    if args.no_save:
+        # 화면에만 출력
+        log("\n" + "="*60)
+        log("처리된 자막:")
+        log("="*60)
+        log(result)
+        log("="*60)
+        return
+
+    # 파일 저장
+    output_path = result_path(video_info, args, total, suffix)
+    output_path.write_text(result, encoding='utf-8')
+    log(f"\n💾 파일 저장 완료: {output_path.absolute()}")
+
+
+def merge_options(args: argparse.Namespace) -> dict:
+    """시각이 있는 형식의 병합 조건 (--merge-window/--merge-chars가 없으면 --merge 개수 단위)"""
+    window_ms = int(args.merge_window * 1000) if args.merge_window else None
+    max_chars = args.merge_chars or None
+    max_count = args.merge if window_ms is None and max_chars is None else None
+    return {'window_ms': window_ms, 'max_chars': max_chars, 'max_count': max_count}
+
+
+def log_dedup(stats: dict, log: Callable[[str], None] = print):
+    """--dedup-window로 제거한 반복 줄 수 출력"""
+    if stats.get('dedup_removed'):
+        log(f"🧹 반복 줄 {stats['dedup_removed']}개 제거")
+
+
+def save_timed_result(vtt_text: str, video_info: dict, subtitle: dict, args: argparse.Namespace, total: int,
+                      log: Callable[[str], None] = print, suffix: Optional[str] = None, timer=None) -> int:
+    """
+    시각을 유지한 병합 큐를 --format(srt, vtt, jsonl) 형식으로 파일에 바로 쓰거나 화면에 출력
+
+    Returns:
+        기록한 큐 수
+    """
+    processor = SubtitleProcessor()
+    dedup_stats = {}
+    options = dict(
+        output_format=args.format, overlap=args.overlap, min_overlap=args.min_overlap, lang=subtitle['lang'],
+        fields={'video_id': video_info['video_id'], 'lang': subtitle['lang']}, dedup_window=args.dedup_window,
+        stats=dedup_stats, **merge_options(args)
+    )
+
+    if args.no_save:
+        buffer = io.StringIO()
+        count = processor.write_cues(vtt_text, buffer, **options)
+        log_dedup(dedup_stats, log)
+        log("\n" + "="*60)
+        log(f"처리된 자막 ({args.format}):")
+        log("="*60)
+        log(buffer.getvalue().rstrip('\n'))
+        log("="*60)
+        return count
+
+    output_path = result_path(video_info, args, total, suffix, extension=args.format)
+    start = time.perf_counter()
+    with open(output_path, 'w', encoding='utf-8') as fp:
+        count = processor.write_cues(vtt_text, fp, **options)
+    if timer is not None:
+        timer.add('cleaning', (time.perf_counter() - start) * 1000)
+    log_dedup(dedup_stats, log)
+    if not count:
+        # 빈 결과는 파일을 남기지 않음 (txt 형식과 동일)
+        output_path.unlink()
+        return 0
+    log(f"\n💾 파일 저장 완료: {output_path.absolute()} ({count}개 큐)")
+    return count
+
+
+def print_available_subtitles(subs: dict, log: Callable[[str], None] = print):
+    """사용 가능한 자막 목록 출력 (YtDlpFetcher.get_available_subtitles 결과)"""
+    if subs['manual']:
+        log("\n📝 수동 작성 자막:")
+        log("-" * 60)
+        for sub in subs['manual']:
+            formats = ', '.join(sub['formats']) if sub['formats'] else 'N/A'
+            log(f"  • {sub['name']} ({sub['lang']}) - 형식: {formats}")
+        log("-" * 60)
+
+    if subs['automatic']:
+        log("\n🤖 자동 생성 자막:")
+        log("-" * 60)
+        for sub in subs['automatic']:
+            formats = ', '.join(sub['formats']) if sub['formats'] else 'N/A'
+            kind = SUBTITLE_KIND_LABELS.get(sub.get('kind'), '')
+            log(f"  • {sub['name']} ({sub['lang']}, {kind}) - 형식: {formats}")
+        log("-" * 60)
+
+    if not subs['manual'] and not subs['automatic']:
+        log("\n❌ 사용 가능한 자막이 없습니다.")
+
+
+def list_url(idx: int, total: int, url: str, args: argparse.Namespace, fetcher: YtDlpFetcher,
+             info_cache: Optional[InfoCache] = None, log: Callable[[str], None] = print) -> Optional[bool]:
+    """
+    URL 하나의 자막 목록을 조회합니다 (--list).
+    영상이 여러 개면 --lang 우선순위로 받을 수 있는 트랙만 한 줄로 요약합니다.
+
+    Returns:
+        --lang 우선순위에 맞는 자막이 있으면 True, 없으면 False, 조회 실패 시 None
+    """
+    languages = language_priority(args.lang) or [args.lang, f"{args.lang}:translated"]
+
     try:
-        subs = YtDlpFetcher.get_available_subtitles(video_url)
-        
-        has_subs = False
-        
-        if subs['manual']:
-            has_subs = True
-            print("\n📝 수동 작성 자막:")
-            print("-" * 60)
-            for sub in subs['manual']:
-                formats = ', '.join(sub['formats']) if sub['formats'] else 'N/A'
-                print(f"  • {sub['name']} ({sub['lang']}) - 형식: {formats}")
-            print("-" * 60)
-        
-        if subs['automatic']:
-            has_subs = True
-            print("\n🤖 자동 생성 자막:")
-            print("-" * 60)
-            for sub in subs['automatic']:
-                formats = ', '.join(sub['formats']) if sub['formats'] else 'N/A'
-                print(f"  • {sub['name']} ({sub['lang']}) - 형식: {formats}")
-            print("-" * 60)
-        
-        if not has_subs:
-            print("\n❌ 사용 가능한 자막이 없습니다.")
-        
+        subs = fetcher.get_available_subtitles(url, info_cache=info_cache, languages=languages,
+                                               auto_generated=not args.no_auto)
     except Exception as e:
-        print(f"❌ 오류: {e}")
+        log(f"[{idx}/{total}] ❌ 오류: {url} - {e}")
+        return None
+
+    matched = ', '.join(format_subtitle(track) for track in subs['matched'])
+    if total == 1:
+        log(f"\n🎬 {subs['title']} ({subs['video_id']})")
+        print_available_subtitles(subs, log)
+        if matched:
+            log(f"\n✅ '{args.lang}' 우선순위로 받을 자막: {matched}")
+    else:
+        status = f"✅ {matched}" if matched else "❌ 자막 없음"
+        log(f"[{idx}/{total}] {status} | {subs['video_id']} | {subs['title']}")
+    return bool(subs['matched'])
+
+
+def list_urls(urls: list, args: argparse.Namespace, fetcher: YtDlpFetcher, info_cache: Optional[InfoCache] = None):
+    """
+    모든 URL의 자막 목록을 조회하고 요약합니다 (--list, 일괄 사전 필터링).
+    --list-output을 지정하면 --lang 우선순위에 맞는 자막이 있는 URL만 입력 순서대로 저장합니다.
+    """
+    total = len(urls)
+    start = time.time()
+
+    def run(item):
+        idx, url = item
+        buffer = []
+        return list_url(idx, total, url, args, fetcher, info_cache, log=buffer.append), buffer
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+        for found, buffer in executor.map(run, enumerate(urls, 1)):
+            print('\n'.join(buffer))
+            results.append(found)
+
+    if total > 1:
+        elapsed = time.time() - start
+        print(f"\n📊 자막 있음 {results.count(True)}개 / 없음 {results.count(False)}개 / "
+              f"실패 {results.count(None)}개 ({elapsed:.1f}초)")
+
+    if args.list_output:
+        matched_urls = [url for url, found in zip(urls, results) if found]
+        Path(args.list_output).write_text(''.join(f"{url}\n" for url in matched_urls), encoding='utf-8')
+        print(f"💾 자막이 있는 URL {len(matched_urls)}개 저장: {args.list_output}")
+
+
+def process_url(idx: int, total: int, url: str, args: argparse.Namespace, fetcher: YtDlpFetcher,
+                result_cache: Optional[ResultCache] = None,
+                log: Callable[[str], None] = print, timer: Optional[StageTimer] = None,
+                info_cache: Optional[InfoCache] = None, state: Optional[StateIndex] = None,
+                transcript_index: Optional[TranscriptIndex] = None) -> bool:
+    """
+    URL 하나를 조회, 처리, 저장합니다.
+
+    Args:
+        idx: 진행 표시용 순번 (1부터 시작)
+        total: 전체 URL 개수
+        url: YouTube 영상 URL 또는 video ID
+        args: 명령줄 인자
+        fetcher: 공유 YtDlpFetcher (세션 풀과 요청 속도 제한기 재사용)
+        result_cache: 처리 결과 캐시 (video ID, 언어, 자막 종류 단위)
+        log: 진행 로그 출력 함수 (병렬 처리 시 버퍼에 모았다가 순서대로 출력)
+        timer: 단계별 처리 시간을 모을 타이머 (모든 URL이 공유, 마지막에 요약 표 출력)
+        info_cache: 영상 정보 캐시 (적중하면 extract_info 없이 자막만 다운로드)
+        state: 처리 상태 인덱스 (성공하면 (video ID, --lang)을 기록)
+        transcript_index: 전문 검색 색인 (받은 자막을 큐 단위로 색인)
+
+    Returns:
+        성공 여부
+    """
+    log(f"\n[{idx}/{total}] 처리 중: {url}")
+    log("-" * 80)
+
+    # Video ID 추출
+    video_id = YtDlpFetcher.extract_video_id(url)
+    if not video_id:
+        log(f"❌ 오류: 유효하지 않은 YouTube URL - {url}")
+        return False
+
+    log(f"🎬 Video ID: {video_id}")
+
+    # 캐시에 결과가 있으면 YouTube 요청 없이 처리 (모든 트랙을 받을 때는 캐시 미사용)
+    auto_gen = not args.no_auto
+    use_cache = result_cache is not None and not args.all_tracks
+    cached = result_cache.get(video_id, args.lang, auto_gen) if use_cache else None
+    # 다른 댓글 모드로 조회한 항목은 고정 댓글 유무가 다르므로 다시 조회
+    if cached is not None and cached.get('comments') != args.comments:
+        log("🗃️  다른 댓글 모드로 저장된 캐시 항목이라 다시 조회합니다.")
+        cached = None
+
+    start_time = time.time()
+
+    try:
+        if cached is not None:
+            log("🗃️  캐시된 결과 사용 (YouTube 요청 없음)")
+            all_data = cached
+        else:
+            # 1. 한 번의 요청으로 모든 데이터 가져오기 (우선순위의 모든 자막 언어 후보 포함)
+            log("📋 영상 정보, 댓글, 자막 동시 조회 중...")
+            all_data = fetcher.fetch_all_in_one(
+                url, args.lang, auto_generated=auto_gen,
+                comments=args.comments, max_comments=args.max_comments, timer=timer,
+                languages=language_priority(args.lang), all_tracks=args.all_tracks,
+                info_cache=info_cache
+            )
+
+        video_info = all_data['video_info']
+        pinned_comment = all_data['pinned_comment']
+        vtt_text = all_data['vtt_text']
+
+        log(f"✅ 제목: {video_info['title']}")
+        log(f"   타입: {video_info['video_type'].upper()} | 길이: {video_info['duration_string']}")
+
+        if pinned_comment:
+            log("✅ 고정 댓글을 찾았습니다.")
+        elif args.comments != 'none':
+            log("💬 고정 댓글이 없습니다.")
+
+        stats = all_data.get('stats')
+        if stats:
+            # 요청 속도 제한과 스로틀링 백오프 대기 시간은 처리 시간에서 제외
+            start_time += stats.get('rate_wait_ms', 0.0) / 1000
+            if stats.get('retries'):
+                log(f"🔁 스로틀링/일시적 오류로 {stats['retries']}회 재시도")
+            if stats.get('rate_wait_ms', 0.0) >= 50:
+                log(f"⏳ 요청 속도 제한으로 {stats['rate_wait_ms'] / 1000:.2f}초 대기")
+            if args.comments != 'none':
+                log(f"   댓글 페이지 조회: {stats['comment_pages']}회")
+            if stats.get('info_cache_hit'):
+                log("🗂️  캐시된 영상 정보 사용 (extract_info 생략, 자막만 다운로드)")
+            if stats['session_reused']:
+                log(f"♻️  yt-dlp 세션 재사용 (초기화 {stats['session_init_saved_ms']:.2f} ms 절약)")
+            else:
+                log(f"🆕 yt-dlp 세션 생성 ({stats['session_init_ms']:.2f} ms)")
+            log(f"   조회 {stats['extract_ms']:.2f} ms (댓글 {stats['comment_ms']:.2f} ms) | "
+                f"자막 다운로드 {stats['subtitle_ms']:.2f} ms")
+
+        if not vtt_text:
+            log("❌ 자막을 가져올 수 없습니다.")
+            return False
+
+        if args.all_tracks:
+            tracks = all_data['subtitles']
+        else:
+            tracks = [{'lang': all_data.get('subtitle_lang') or args.lang,
+                       'kind': all_data.get('subtitle_kind'), 'vtt_text': vtt_text}]
+        log(f"🌐 자막 언어: {', '.join(format_subtitle(track) for track in tracks)}")
+        log("✅ 모든 데이터 조회 완료")
+
+        for track in tracks:
+            subtitle = {'lang': track['lang'], 'kind': track['kind']}
+            suffix = track['lang'] if args.all_tracks else None
+
+            # 원본 VTT 출력
+            if args.raw:
+                result = track['vtt_text']
+                log("\n" + "="*60)
+                log(f"원본 VTT ({format_subtitle(subtitle)}):")
+                log("="*60)
+            elif args.format != 'txt':
+                # 3. 시각을 유지한 병합 큐를 파일로 바로 씀 (메타데이터 헤더 없음)
+                log(f"\n⚙️  자막 처리 중... ({format_subtitle(subtitle)}, 형식: {args.format})")
+                result = None
+                if not save_timed_result(track['vtt_text'], video_info, subtitle, args, total, log, suffix, timer):
+                    log("❌ 자막 처리 결과가 비어있습니다.")
+                    return False
+                log("✅ 자막 처리 완료")
+
+                # 원본 VTT만 캐시 (transcript가 없으면 txt 형식은 다시 처리)
+                if use_cache and cached is None:
+                    result_cache.put(video_id, args.lang, auto_gen, {
+                        'video_info': video_info,
+                        'pinned_comment': pinned_comment,
+                        'vtt_text': vtt_text,
+                        'subtitle_lang': subtitle['lang'],
+                        'subtitle_kind': subtitle['kind'],
+                        'comments': args.comments,
+                        'overlap': args.overlap,
+                        'min_overlap': args.min_overlap,
+                        'dedup_window': args.dedup_window
+                    })
+            else:
+                # 3. 자막 처리
+                log(f"\n⚙️  자막 처리 중... ({format_subtitle(subtitle)}, 병합 개수: {args.merge})")
+                # 캐시된 transcript는 같은 오버랩·반복 줄 제거 설정으로 만든 경우에만 재사용
+                if (cached is not None and cached.get('transcript') and cached.get('overlap', 'prefix') == args.overlap
+                        and cached.get('min_overlap', SubtitleProcessor.MIN_OVERLAP_CHARS) == args.min_overlap
+                        and cached.get('dedup_window', 0) == args.dedup_window):
+                    processed_text = cached['transcript']
+                else:
+                    processor = SubtitleProcessor()
+                    dedup_stats = {}
+                    processed_text = processor.process(track['vtt_text'], args.merge, overlap=args.overlap,
+                                                       min_overlap=args.min_overlap, timer=timer,
+                                                       dedup_window=args.dedup_window, stats=dedup_stats)
+                    log_dedup(dedup_stats, log)
+
+                if not processed_text:
+                    log("❌ 자막 처리 결과가 비어있습니다.")
+                    return False
+
+                if use_cache and cached is None:
+                    result_cache.put(video_id, args.lang, auto_gen, {
+                        'video_info': video_info,
+                        'pinned_comment': pinned_comment,
+                        'vtt_text': vtt_text,
+                        'subtitle_lang': subtitle['lang'],
+                        'subtitle_kind': subtitle['kind'],
+                        'transcript': processed_text,
+                        'comments': args.comments,
+                        'overlap': args.overlap,
+                        'min_overlap': args.min_overlap,
+                        'dedup_window': args.dedup_window
+                    })
+
+                # 처리 시간 계산
+                end_time = time.time()
+                processing_time_ms = (end_time - start_time) * 1000
+
+                # 메타데이터 헤더 추가
+                description_text = video_info.get('description')
+                metadata_header = create_metadata_header(video_info, pinned_comment, description_text,
+                                                         processing_time_ms, subtitle)
+                result = metadata_header + "\n" + processed_text
+
+                log("✅ 자막 처리 완료")
+
+            if transcript_index:
+                count = transcript_index.index_vtt(video_info['video_id'], track['lang'], track['vtt_text'],
+                                                   SubtitleProcessor(), title=video_info['title'],
+                                                   overlap=args.overlap, min_overlap=args.min_overlap,
+                                                   dedup_window=args.dedup_window)
+                log(f"🔎 검색 색인: {count}개 큐" if count else "🔎 검색 색인: 변경 없음")
+
+            # 4. 결과 출력 또는 저장 (시각 형식은 위에서 이미 저장)
+            if result is not None:
+                save_result(result, video_info, args, total, log, suffix)
+
+                # 통계 출력
+                line_count = len(result.strip().split('\n'))
+                char_count = len(result)
+                log(f"📊 통계: {line_count}줄, {char_count}자")
+
+        if state:
+            state.mark(video_id, args.lang)
+        return True
+
+    except Exception as e:
+        log(f"❌ 오류 발생: {e}")
+        return False
+
+
+def expand_urls(urls: list, args: argparse.Namespace, fetcher: YtDlpFetcher,
+                state: Optional[StateIndex] = None) -> list:
+    """
+    재생목록/채널 URL을 영상 URL 목록으로 펼치고, 상태 인덱스에 처리 기록이 있는 영상을 뺍니다.
+    재생목록/채널은 평면 추출로 목록만 가져오므로 영상별 요청이 없습니다.
+
+    Returns:
+        새로 처리할 영상 URL 목록 (입력 순서, 중복 없음)
+    """
+    max_age = args.refresh_after * 3600 if args.refresh_after is not None else None
+    known = (lambda video_id: state.is_processed(video_id, args.lang, max_age)) if state else None
+
+    expanded = []
+    for url in urls:
+        if not YtDlpFetcher.is_collection_url(url):
+            expanded.append(url)
+            continue
+
+        try:
+            collection = fetcher.list_collection_entries(url, max_entries=args.max_entries, known=known,
+                                                         stop_after_known=args.stop_after_known)
+        except Exception as e:
+            print(f"❌ 오류: {url} - {e}")
+            continue
+
+        stats = collection['stats']
+        known_count = sum(entry['known'] for entry in collection['entries'])
+        stopped = ", 처리한 영상이 이어져 중단" if stats['stopped_early'] else ""
+        print(f"📚 {collection['title']}: {stats['listed']}개 조회 (이미 처리 {known_count}개{stopped}, "
+              f"{stats['list_ms'] / 1000:.1f}초)")
+        expanded.extend(entry['url'] for entry in collection['entries'] if not entry['known'])
+
+    # 재생목록끼리 겹치거나 같은 영상을 여러 형식으로 넣은 경우 한 번만 처리
+    unique, seen = [], set()
+    for url in expanded:
+        video_id = YtDlpFetcher.extract_video_id(url) or url
+        if video_id not in seen:
+            seen.add(video_id)
+            unique.append(url)
+
+    if state:
+        video_ids = [YtDlpFetcher.extract_video_id(url) for url in unique]
+        processed = state.processed_ids([video_id for video_id in video_ids if video_id], args.lang, max_age)
+        if processed:
+            print(f"⏭️  이미 처리한 영상 {len(processed)}개 건너뜀 (상태 인덱스: {args.state_db})")
+        unique = [url for url, video_id in zip(unique, video_ids) if video_id not in processed]
+    return unique
 
 
 def main():
@@ -108,8 +550,11 @@ def main():
   %(prog)s "https://www.youtube.com/watch?v=xxxxx"
   %(prog)s "https://www.youtube.com/shorts/xxxxx" --lang ko
   %(prog)s "xxxxx" --lang en --merge 5
+  %(prog)s "xxxxx" --lang "ko,ko-*,en,ko:translated"
   %(prog)s "https://youtu.be/xxxxx" --output result.txt
   %(prog)s "xxxxx" --list
+  %(prog)s --batch urls.txt --list --lang ko --list-output has_ko.txt
+  %(prog)s "https://www.youtube.com/@channel" --state-db state.sqlite --stop-after-known 30
         """
     )
     
@@ -129,14 +574,40 @@ def main():
         '-l', '--lang',
         type=str,
         default='ko',
-        help='자막 언어 코드 (기본값: ko)'
+        help='자막 언어 코드 또는 우선순위 목록 (예: ko,ko-*,en,ko:translated, 기본값: ko)'
+    )
+
+    parser.add_argument(
+        '--all-tracks',
+        action='store_true',
+        help='우선순위 목록의 모든 자막 트랙을 언어별 파일로 저장 (예: 제목.en.txt)'
     )
     
     parser.add_argument(
         '-m', '--merge',
         type=int,
         default=3,
-        help='병합할 자막 블록 개수 (기본값: 3)'
+        help='병합할 자막 블록 개수, --format srt/vtt/jsonl에서 --merge-window/--merge-chars가 없을 때 사용 (기본값: 3)'
+    )
+
+    parser.add_argument(
+        '-f', '--format',
+        type=str,
+        choices=('txt',) + CUE_FORMATS,
+        default='txt',
+        help='출력 형식: txt(메타데이터 헤더 + 이어 붙인 본문), srt/vtt/jsonl(병합 큐마다 시각 유지) (기본값: txt)'
+    )
+
+    parser.add_argument(
+        '--merge-window',
+        type=float,
+        help='srt/vtt/jsonl에서 첫 큐부터 이 시간(초) 안에 시작하는 큐를 하나로 병합'
+    )
+
+    parser.add_argument(
+        '--merge-chars',
+        type=int,
+        help='srt/vtt/jsonl에서 병합한 큐의 최대 글자 수'
     )
     
     parser.add_argument(
@@ -154,7 +625,13 @@ def main():
     parser.add_argument(
         '--list',
         action='store_true',
-        help='사용 가능한 자막 목록만 출력'
+        help='사용 가능한 자막 목록만 출력 (영상이 여러 개면 --lang 우선순위에 맞는 자막만 요약)'
+    )
+
+    parser.add_argument(
+        '--list-output',
+        type=str,
+        help='--list와 함께 사용, --lang 우선순위에 맞는 자막이 있는 URL만 이 파일에 저장 (배치 사전 필터링)'
     )
     
     parser.add_argument(
@@ -169,6 +646,128 @@ def main():
         help='자동 생성 자막 제외 (수동 작성 자막만)'
     )
 
+    parser.add_argument(
+        '--overlap',
+        type=str,
+        choices=SubtitleProcessor.OVERLAP_MODES,
+        default='prefix',
+        help='롤링 중복 제거 방식: prefix(이전 큐 전체가 앞부분에 반복될 때만, 기본값), '
+             'partial(이전 큐 끝부분과 겹치는 앞부분도 제거)'
+    )
+
+    parser.add_argument(
+        '--min-overlap',
+        type=int,
+        default=SubtitleProcessor.MIN_OVERLAP_CHARS,
+        help=f'partial 모드에서 제거할 최소 겹침 길이(문자 수, 기본값: {SubtitleProcessor.MIN_OVERLAP_CHARS})'
+    )
+
+    parser.add_argument(
+        '--dedup-window',
+        type=int,
+        default=0,
+        help='최근 N개 줄 안에서 다시 나온 같은 줄 제거 (다른 큐를 사이에 둔 자동 자막 반복, 권장: 8, 기본값: 0=끄기)'
+    )
+
+    parser.add_argument(
+        '--comments',
+        type=str,
+        choices=YtDlpFetcher.COMMENT_MODES,
+        default='pinned',
+        help='댓글 조회 모드: pinned(고정 댓글만, 기본값), all(전체 댓글), none(조회 안 함)'
+    )
+
+    parser.add_argument(
+        '--max-comments',
+        type=int,
+        help='조회할 최대 댓글 스레드 수 (기본값: pinned 모드는 1, all 모드는 제한 없음)'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='동시에 처리할 영상 개수 (기본값: 1)'
+    )
+
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=2.0,
+        help='YouTube로 보내는 초당 최대 영상 조회 수, 스로틀링되면 자동으로 낮췄다가 회복, 0이면 제한 없음 (기본값: 2.0)'
+    )
+
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=AdaptiveRateLimiter.DEFAULT_MAX_RETRIES,
+        help=f'HTTP 429/봇 확인/일시적 오류일 때 백오프 후 다시 시도할 횟수, 없는 영상 등은 바로 실패 '
+             f'(기본값: {AdaptiveRateLimiter.DEFAULT_MAX_RETRIES})'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='처리 결과 캐시 디렉토리 (지정하면 같은 영상/언어 재요청 시 YouTube 요청 생략)'
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=24,
+        help='캐시 유효 시간(시간 단위, 기본값: 24)'
+    )
+
+    parser.add_argument(
+        '--cache-max-entries',
+        type=int,
+        default=1000,
+        help='캐시에 보관할 최대 영상 수, 넘으면 오래 쓰지 않은 항목부터 삭제 (기본값: 1000)'
+    )
+
+    parser.add_argument(
+        '--info-cache-dir',
+        type=str,
+        help='영상 정보 캐시 디렉토리 (지정하면 같은 영상을 다른 언어로 재요청 시 extract_info 생략)'
+    )
+
+    parser.add_argument(
+        '--info-cache-ttl',
+        type=float,
+        default=6,
+        help='영상 정보 캐시 유효 시간(시간 단위, 자막 URL 만료가 더 이르면 그때까지, 기본값: 6)'
+    )
+
+    parser.add_argument(
+        '--index-db',
+        type=str,
+        help='받은 자막을 큐 단위로 넣을 전문 검색 색인(SQLite FTS5) 경로 (검색: cli/search_transcripts.py)'
+    )
+
+    parser.add_argument(
+        '--state-db',
+        type=str,
+        help='처리 상태 인덱스(SQLite) 경로, 지정하면 이미 처리한 (영상, --lang)은 건너뛰고 성공한 영상을 기록'
+    )
+
+    parser.add_argument(
+        '--refresh-after',
+        type=float,
+        help='처리한 지 이 시간(시간 단위)이 지난 영상은 다시 처리 (기본값: 다시 처리하지 않음)'
+    )
+
+    parser.add_argument(
+        '--max-entries',
+        type=int,
+        help='재생목록/채널마다 가져올 최대 영상 수 (기본값: 전체)'
+    )
+
+    parser.add_argument(
+        '--stop-after-known',
+        type=int,
+        help='재생목록/채널 목록에서 이미 처리한 영상이 이만큼 연속으로 나오면 목록 조회 중단 '
+             '(최신순인 채널 정기 수집용, --state-db 필요)'
+    )
     
     args = parser.parse_args()
     
@@ -204,127 +803,80 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    # --list 옵션은 첫 번째 URL만 처리
-    if args.list:
-        print_available_subtitles(urls[0])
+    # 모든 조회(목록 펼치기, --list, 처리)가 같은 속도 제한기를 거침 (스로틀링되면 속도를 낮추고 재시도)
+    rate_limiter = AdaptiveRateLimiter(args.rate, burst=max(args.jobs, 1), max_retries=args.retries)
+    fetcher = YtDlpFetcher(rate_limiter=rate_limiter)
+
+    # 재생목록/채널 펼치기와 이미 처리한 영상 제외
+    state = StateIndex(args.state_db) if args.state_db else None
+    transcript_index = TranscriptIndex(args.index_db) if args.index_db else None
+    urls = expand_urls(urls, args, fetcher, state)
+    if not urls:
+        print("✅ 새로 처리할 영상이 없습니다.")
+        fetcher.close()
         sys.exit(0)
-    
+
     # 복수 URL 처리
     total = len(urls)
     success_count = 0
     fail_count = 0
-    
+
+    result_cache = None
+    if args.cache_dir:
+        result_cache = ResultCache(
+            LocalDiskCacheBackend(args.cache_dir, max_entries=args.cache_max_entries),
+            ttl=args.cache_ttl * 3600
+        )
+    info_cache = None
+    if args.info_cache_dir:
+        info_cache = InfoCache(
+            LocalDiskCacheBackend(args.info_cache_dir, max_entries=args.cache_max_entries),
+            ttl=args.info_cache_ttl * 3600
+        )
+
+    # --list: 자막 목록만 조회 (댓글/포맷 처리 없는 가벼운 요청)
+    if args.list:
+        list_urls(urls, args, fetcher, info_cache)
+        fetcher.close()
+        sys.exit(0)
+
     print(f"\n{'='*80}")
     print(f"📦 총 {total}개 영상 처리 시작")
     print(f"{'='*80}\n")
-    
-    for idx, url in enumerate(urls, 1):
-        start_time = time.time()
-        print(f"\n[{idx}/{total}] 처리 중: {url}")
-        print("-" * 80)
-        
-        # Video ID 추출
-        video_id = YtDlpFetcher.extract_video_id(url)
-        if not video_id:
-            print(f"❌ 오류: 유효하지 않은 YouTube URL - {url}")
-            fail_count += 1
-            continue
-        
-        print(f"🎬 Video ID: {video_id}")
-        
-        try:
-            # 1. 한 번의 요청으로 모든 데이터 가져오기
-            print("📋 영상 정보, 댓글, 자막 동시 조회 중...")
-            auto_gen = not args.no_auto
-            all_data = YtDlpFetcher.fetch_all_in_one(url, args.lang, auto_generated=auto_gen)
-            
-            video_info = all_data['video_info']
-            pinned_comment = all_data['pinned_comment']
-            vtt_text = all_data['vtt_text']
 
-            print(f"✅ 제목: {video_info['title']}")
-            print(f"   타입: {video_info['video_type'].upper()} | 길이: {video_info['duration_string']}")
+    timer = StageTimer()
+    batch_start = time.time()
 
-            if pinned_comment:
-                print("✅ 고정 댓글을 찾았습니다.")
+    if args.jobs <= 1:
+        for idx, url in enumerate(urls, 1):
+            if process_url(idx, total, url, args, fetcher, result_cache, timer=timer,
+                           info_cache=info_cache, state=state, transcript_index=transcript_index):
+                success_count += 1
             else:
-                print("💬 고정 댓글이 없습니다.")
-
-            if not vtt_text:
-                print("❌ 자막을 가져올 수 없습니다.")
                 fail_count += 1
-                continue
-            
-            print("✅ 모든 데이터 조회 완료")
-            
-            # 원본 VTT 출력
-            if args.raw:
-                result = vtt_text
-                print("\n" + "="*60)
-                print("원본 VTT:")
-                print("="*60)
-            else:
-                # 3. 자막 처리
-                print(f"\n⚙️  자막 처리 중... (병합 개수: {args.merge})")
-                processor = SubtitleProcessor()
-                processed_text = processor.process(vtt_text, args.merge)
-                
-                if not processed_text:
-                    print("❌ 자막 처리 결과가 비어있습니다.")
+    else:
+        def run(item):
+            idx, url = item
+            buffer = []
+            ok = process_url(idx, total, url, args, fetcher, result_cache, log=buffer.append,
+                             timer=timer, info_cache=info_cache, state=state,
+                             transcript_index=transcript_index)
+            return ok, buffer
+
+        print(f"⚡ 병렬 처리: 작업자 {args.jobs}개, 요청 속도 제한 {args.rate}/초\n")
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            # map은 입력 순서대로 결과를 돌려주므로 진행 로그가 항상 같은 순서로 출력됨
+            for ok, buffer in executor.map(run, enumerate(urls, 1)):
+                print('\n'.join(buffer))
+                if ok:
+                    success_count += 1
+                else:
                     fail_count += 1
-                    continue
-                
-                # 처리 시간 계산
-                end_time = time.time()
-                processing_time_ms = (end_time - start_time) * 1000
 
-                # 메타데이터 헤더 추가
-                description_text = video_info.get('description')
-                metadata_header = create_metadata_header(video_info, pinned_comment, description_text, processing_time_ms)
-                result = metadata_header + "\n" + processed_text
-                
-                print("✅ 자막 처리 완료")
-            
-            # 4. 결과 출력 또는 저장
-            if args.no_save:
-                # 화면에만 출력
-                print("\n" + "="*60)
-                print("처리된 자막:")
-                print("="*60)
-                print(result)
-                print("="*60)
-            elif args.output and total == 1:
-                # 단일 URL일 때만 --output 사용 가능
-                output_path = Path(args.output)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(result, encoding='utf-8')
-                print(f"\n💾 파일 저장 완료: {output_path.absolute()}")
-            else:
-                # 영상 제목으로 자동 저장 (output/ 디렉토리)
-                script_dir = Path('output')
-                script_dir.mkdir(exist_ok=True)
-                
-                # 파일명 생성 (영상 제목)
-                safe_title = sanitize_filename(video_info['title'])
-                filename = f"{safe_title}.txt"
-                output_path = script_dir / filename
-                
-                # 파일 저장
-                output_path.write_text(result, encoding='utf-8')
-                print(f"\n💾 파일 저장 완료: {output_path.absolute()}")
-            
-            # 통계 출력
-            line_count = len(result.strip().split('\n'))
-            char_count = len(result)
-            print(f"📊 통계: {line_count}줄, {char_count}자")
-            
-            success_count += 1
-            
-        except Exception as e:
-            print(f"❌ 오류 발생: {e}")
-            fail_count += 1
-            continue
+    elapsed = time.time() - batch_start
     
+    fetcher.close()
+
     # 최종 요약
     print(f"\n{'='*80}")
     print(f"📊 처리 완료")
@@ -332,6 +884,28 @@ def main():
     print(f"✅ 성공: {success_count}개")
     print(f"❌ 실패: {fail_count}개")
     print(f"📦 전체: {total}개")
+    if result_cache:
+        cache_stats = result_cache.stats()
+        print(f"🗃️  캐시: 적중 {cache_stats['hits']}개 / 미스 {cache_stats['misses']}개")
+    if info_cache:
+        info_stats = info_cache.stats()
+        print(f"🗂️  영상 정보 캐시: 적중 {info_stats['hits']}개 / 미스 {info_stats['misses']}개")
+    rate_stats = rate_limiter.stats()
+    if rate_stats['throttled'] or rate_stats['retries']:
+        rates = ', '.join(f"{host} {rate}/초" for host, rate in rate_stats['rates'].items())
+        print(f"🚦 스로틀링 {rate_stats['throttled']}회, 재시도 {rate_stats['retries']}회, "
+              f"속도 감소 {rate_stats['decreases']}회 (현재 속도: {rates})")
+    if state:
+        print(f"📒 상태 인덱스: 영상 {state.stats()['videos']}개 처리 기록 ({args.state_db})")
+        state.close()
+    if transcript_index:
+        index_stats = transcript_index.stats()
+        print(f"🔎 검색 색인: 영상 {index_stats['videos']}개, 큐 {index_stats['cues']}개 ({args.index_db})")
+        transcript_index.close()
+    print(f"⏱️  소요 시간: {elapsed:.1f}초 ({total / elapsed * 60 if elapsed > 0 else 0:.1f}개/분)")
+    if timer.snapshot():
+        print()
+        print(timer.format_table(f"단계별 처리 시간 ({total}개 영상)"))
     print(f"{'='*80}\n")
     
     if fail_count > 0:
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+보관된 VTT 파일 일괄 재처리 스크립트
+정리 규칙을 바꾼 뒤 YouTube 요청 없이 저장해 둔 VTT들을 모든 CPU 코어로 다시 처리합니다.
+
+사용법:
+    python cli/process_vtt.py <디렉토리 또는 glob> [옵션]
+
+예시:
+    python cli/process_vtt.py archive/ --output processed/
+    python cli/process_vtt.py "archive/**/*.vtt" --workers 8 --chunksize 128
+    python cli/process_vtt.py archive/ --output processed/ --skip-existing --overlap partial
+    python cli/process_vtt.py archive/ --output srt/ --format srt --merge-window 5
+"""
+
+import argparse
+import sys
+from src.bulk_processor import process_many
+from src.cue_writers import CUE_FORMATS
+from src.subtitle_processor import SubtitleProcessor
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='보관된 VTT 파일을 프로세스 풀로 일괄 재처리',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        'source',
+        help='VTT 디렉토리(하위 폴더 포함, .vtt.gz 포함) 또는 glob 패턴 (예: "archive/**/*.vtt.gz")'
+    )
+
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        help='결과 디렉토리 (지정하지 않으면 각 VTT 옆에 .txt로 저장)'
+    )
+
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        help='워커 프로세스 수 (기본값: CPU 코어 수)'
+    )
+
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=64,
+        help='워커에 한 번에 넘길 파일 수 (기본값: 64)'
+    )
+
+    parser.add_argument(
+        '--overlap',
+        type=str,
+        choices=SubtitleProcessor.OVERLAP_MODES,
+        default='prefix',
+        help='롤링 중복 제거 방식 (기본값: prefix)'
+    )
+
+    parser.add_argument(
+        '--min-overlap',
+        type=int,
+        default=SubtitleProcessor.MIN_OVERLAP_CHARS,
+        help=f'partial 모드에서 제거할 최소 겹침 길이 (기본값: {SubtitleProcessor.MIN_OVERLAP_CHARS})'
+    )
+
+    parser.add_argument(
+        '--dedup-window',
+        type=int,
+        default=0,
+        help='최근 N개 줄 안에서 다시 나온 같은 줄 제거 (권장: 8, 기본값: 0=끄기)'
+    )
+
+    parser.add_argument(
+        '--skip-existing',
+        action='store_true',
+        help='결과 파일이 이미 있으면 건너뜀 (중단된 작업 이어서 처리)'
+    )
+
+    parser.add_argument(
+        '-f', '--format',
+        type=str,
+        choices=('txt',) + CUE_FORMATS,
+        default='txt',
+        help='출력 형식: txt(본문만) 또는 시각을 유지하는 srt/vtt/jsonl (기본값: txt)'
+    )
+
+    parser.add_argument(
+        '--merge-window',
+        type=float,
+        help='srt/vtt/jsonl에서 첫 큐부터 이 시간(초) 안에 시작하는 큐를 하나로 병합'
+    )
+
+    parser.add_argument(
+        '--merge-chars',
+        type=int,
+        help='srt/vtt/jsonl에서 병합한 큐의 최대 글자 수'
+    )
+
+    parser.add_argument(
+        '--merge',
+        type=int,
+        help='srt/vtt/jsonl에서 병합할 최대 큐 개수 (병합 조건이 하나도 없으면 원본 큐 그대로)'
+    )
+
+    args = parser.parse_args()
+
+    def report(summary):
+        print(f"\r⚙️  {summary['done']:,}/{summary['files']:,}개 처리 "
+              f"({summary['files_per_sec']:,.1f} 파일/초, 실패 {summary['failed']})", end='', flush=True)
+
+    summary = process_many(
+        args.source,
+        output_dir=args.output,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        overlap=args.overlap,
+        min_overlap=args.min_overlap,
+        skip_existing=args.skip_existing,
+        progress=report,
+        output_format=args.format,
+        window_ms=int(args.merge_window * 1000) if args.merge_window else None,
+        max_chars=args.merge_chars,
+        max_count=args.merge,
+        dedup_window=args.dedup_window
+    )
+
+    if not summary['files']:
+        print(f"❌ 처리할 VTT 파일이 없습니다: {args.source}")
+        sys.exit(1)
+
+    print()
+    print(f"\n{'='*60}")
+    print(f"📊 처리 결과: 성공 {summary['ok']:,}, 빈 결과 {summary['empty']:,}, "
+          f"건너뜀 {summary['skipped']:,}, 실패 {summary['failed']:,} / 전체 {summary['files']:,}")
+    if args.dedup_window:
+        print(f"🧹 반복 줄 제거: {summary['dedup_removed']:,}개")
+    print(f"⏱️  {summary['elapsed_s']:.1f}초, {summary['files_per_sec']:,.1f} 파일/초, "
+          f"{summary['mb_per_sec']:.2f} MB/초, 워커 {summary['worker_count']}개 (사용률 {summary['utilization']:.0%})")
+    print(f"{'='*60}")
+    print(f"{'워커 PID':<12}{'파일':>10}{'실패':>8}{'입력(MB)':>12}{'작업 시간(초)':>16}{'파일/초':>12}")
+    for pid, worker in sorted(summary['workers'].items()):
+        print(f"{pid:<12}{worker['files']:>10,}{worker['failed']:>8,}{worker['bytes_in'] / 1024 / 1024:>12.1f}"
+              f"{worker['busy_s']:>16.1f}{worker['files_per_sec']:>12,.1f}")
+
+    if summary['errors']:
+        print(f"\n❌ 실패한 파일 (최대 10개):")
+        for path, error in summary['errors'][:10]:
+            print(f"   {path}: {error}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
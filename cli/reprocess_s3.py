@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+S3에 보관된 원본 VTT로 scrap_result.json 재생성 스크립트
+SubtitleProcessor 규칙을 바꾼 뒤 YouTube 요청 없이 결과만 다시 만듭니다.
+
+사용법:
+    python cli/reprocess_s3.py --bucket <버킷> <video_id> [video_id ...]
+    python cli/reprocess_s3.py --bucket <버킷> --all
+
+예시:
+    python cli/reprocess_s3.py --bucket my-bucket dQw4w9WgXcQ
+    python cli/reprocess_s3.py --bucket my-bucket --all --overlap partial
+    python cli/reprocess_s3.py --bucket my-bucket --all --dedup-window 8
+    python cli/reprocess_s3.py --bucket my-bucket --all --format gzip
+"""
+
+import argparse
+import os
+import sys
+from src.s3_storage import ScrapArchive
+from src.subtitle_processor import SubtitleProcessor
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='S3에 보관된 원본으로 scrap_result.json 재생성 (YouTube 요청 없음)',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        'video_ids',
+        nargs='*',
+        help='재처리할 video ID (복수 가능)'
+    )
+
+    parser.add_argument(
+        '--bucket',
+        type=str,
+        default=os.environ.get('S3_BUCKET_NAME'),
+        help='S3 버킷 이름 (기본값: S3_BUCKET_NAME 환경 변수)'
+    )
+
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='원본이 보관된 모든 영상 재처리'
+    )
+
+    parser.add_argument(
+        '--overlap',
+        type=str,
+        choices=SubtitleProcessor.OVERLAP_MODES,
+        default='prefix',
+        help='롤링 중복 제거 방식 (기본값: prefix)'
+    )
+
+    parser.add_argument(
+        '--min-overlap',
+        type=int,
+        default=SubtitleProcessor.MIN_OVERLAP_CHARS,
+        help=f'partial 모드에서 제거할 최소 겹침 길이 (기본값: {SubtitleProcessor.MIN_OVERLAP_CHARS})'
+    )
+
+    parser.add_argument(
+        '--dedup-window',
+        type=int,
+        default=0,
+        help='최근 N개 줄 안에서 다시 나온 같은 줄 제거 (권장: 8, 기본값: 0=끄기)'
+    )
+
+    parser.add_argument(
+        '--format',
+        type=str,
+        choices=ScrapArchive.RESULT_FORMATS,
+        default=os.environ.get('RESULT_FORMAT', 'json'),
+        help='scrap_result.json 저장 형식 (기본값: RESULT_FORMAT 환경 변수 또는 json)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='내용이 같아도 항상 다시 업로드'
+    )
+
+    args = parser.parse_args()
+
+    if not args.bucket:
+        parser.error('--bucket 또는 S3_BUCKET_NAME 환경 변수가 필요합니다')
+    if not args.video_ids and not args.all:
+        parser.error('video ID를 지정하거나 --all을 사용하세요')
+
+    archive = ScrapArchive(args.bucket, result_format=args.format, skip_unchanged=not args.force)
+    video_ids = list(archive.iter_archived_video_ids()) if args.all else args.video_ids
+    processor = SubtitleProcessor()
+    failed = 0
+
+    print(f"🔄 {len(video_ids)}개 영상 재처리 (s3://{args.bucket})")
+    for idx, video_id in enumerate(video_ids, 1):
+        try:
+            key = archive.reprocess(video_id, processor, overlap=args.overlap, min_overlap=args.min_overlap,
+                                    dedup_window=args.dedup_window)
+            print(f"[{idx}/{len(video_ids)}] ✅ s3://{args.bucket}/{key}")
+        except Exception as e:
+            failed += 1
+            print(f"[{idx}/{len(video_ids)}] ❌ {video_id}: {e}")
+
+    stats = archive.stats()
+    print(f"\n📊 성공 {len(video_ids) - failed}개, 실패 {failed}개")
+    print(f"   업로드 {stats['uploaded']}개, 변경 없어 생략 {stats['skipped']}개, "
+          f"전송 {stats['bytes_uploaded'] / 1024:.1f} KB "
+          f"(압축 전 {stats['bytes_raw'] / 1024:.1f} KB → {stats['bytes_stored'] / 1024:.1f} KB)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
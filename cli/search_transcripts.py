@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+자막 전문 검색 색인 스크립트
+VTT 파일을 큐 단위로 SQLite FTS5 색인에 넣고, 검색어가 나오는 영상과 시각을 찾습니다.
+
+사용법:
+    python cli/search_transcripts.py add <디렉토리 또는 glob> [옵션]
+    python cli/search_transcripts.py search <검색어> [옵션]
+    python cli/search_transcripts.py stats
+
+VTT 파일 이름 규칙 (video ID와 언어 인식):
+    <video_id>.vtt, <video_id>.<lang>.vtt, <video_id>/raw/<lang>.vtt[.gz] (S3 원본 보관 구조)
+
+예시:
+    python cli/search_transcripts.py add archive/ --db output/transcripts.sqlite
+    python cli/search_transcripts.py add "archive/**/*.vtt.gz" --optimize
+    python cli/search_transcripts.py add archive/ --dedup-window 8
+    python cli/search_transcripts.py search "인공지능 윤리"
+    python cli/search_transcripts.py search "서울*" --videos 20 --hits 3 --lang ko
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from src.bulk_processor import collect_vtt_files, open_vtt
+from src.cue_store import CueStore
+from src.subtitle_processor import SubtitleProcessor
+from src.transcript_index import TranscriptIndex
+
+DEFAULT_DB = 'output/transcripts.sqlite'
+VIDEO_ID_REGEX = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
+
+def parse_vtt_path(path: Path, default_lang: str) -> Optional[Tuple[str, str]]:
+    """VTT 파일 경로에서 (video_id, lang) 추출 (규칙에 맞지 않으면 None)"""
+    name = path.name
+    for suffix in ('.gz', '.vtt'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+
+    # <video_id>/raw/<lang>.vtt[.gz]
+    if path.parent.name == 'raw' and VIDEO_ID_REGEX.match(path.parent.parent.name):
+        return path.parent.parent.name, name
+
+    video_id, _, lang = name.partition('.')
+    if VIDEO_ID_REGEX.match(video_id):
+        return video_id, lang or default_lang
+    return None
+
+
+def add(args: argparse.Namespace):
+    # 디렉토리는 .vtt와 원본 보관 형식인 .vtt.gz를 모두 찾음
+    paths = collect_vtt_files(args.source)
+    if not paths:
+        print(f"❌ 색인할 VTT 파일이 없습니다: {args.source}")
+        sys.exit(1)
+
+    processor = SubtitleProcessor()
+    indexed = unchanged = skipped = failed = cues = 0
+    start = time.time()
+
+    Path(args.db).parent.mkdir(parents=True, exist_ok=True)
+    with TranscriptIndex(args.db) as index:
+        # 배치 단위로 커밋해 중간에 멈춰도 그때까지 색인한 영상은 남김
+        for batch_start in range(0, len(paths), args.batch_size):
+            with index.bulk():
+                for path in paths[batch_start:batch_start + args.batch_size]:
+                    parsed = parse_vtt_path(path, args.lang)
+                    if parsed is None:
+                        print(f"⚠️ video ID를 알 수 없어 건너뜀: {path}")
+                        skipped += 1
+                        continue
+                    video_id, lang = parsed
+                    try:
+                        with open_vtt(path) as f:
+                            count = index.index_vtt(video_id, lang, f.read(), processor, overlap=args.overlap,
+                                                    min_overlap=args.min_overlap, dedup_window=args.dedup_window)
+                    except Exception as e:
+                        print(f"❌ {path}: {e}")
+                        failed += 1
+                        continue
+                    if count:
+                        indexed += 1
+                        cues += count
+                    else:
+                        unchanged += 1
+            done = min(batch_start + args.batch_size, len(paths))
+            print(f"\r⚙️  {done:,}/{len(paths):,}개 파일", end='', flush=True)
+        print()
+
+        if args.optimize:
+            print("🧹 색인 최적화 중...")
+            index.optimize()
+        stats = index.stats()
+
+    elapsed = time.time() - start
+    print(f"\n{'='*60}")
+    print(f"📊 색인: {indexed:,}개 영상 ({cues:,}개 큐), 변경 없음 {unchanged:,}, "
+          f"건너뜀 {skipped:,}, 실패 {failed:,} ({elapsed:.1f}초)")
+    print(f"🗂️  전체: 영상 {stats['videos']:,}개, 문서 {stats['documents']:,}개, 큐 {stats['cues']:,}개 ({args.db})")
+    print(f"{'='*60}")
+
+
+def search(args: argparse.Namespace):
+    if not Path(args.db).exists():
+        print(f"❌ 색인 파일이 없습니다: {args.db}")
+        sys.exit(1)
+
+    query = ' '.join(args.query)
+    start = time.perf_counter()
+    with TranscriptIndex(args.db) as index:
+        try:
+            videos = index.search(query, max_videos=args.videos, hits_per_video=args.hits, lang=args.lang,
+                                  raw_query=args.raw_query)
+        except Exception as e:
+            print(f"❌ 검색 오류: {e}")
+            sys.exit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if not videos:
+        print(f"🔍 '{query}' 검색 결과가 없습니다. ({elapsed_ms:.1f} ms)")
+        return
+
+    print(f"🔍 '{query}': 영상 {len(videos)}개 ({elapsed_ms:.1f} ms)")
+    for video in videos:
+        print(f"\n🎬 {video['title'] or video['video_id']} ({video['video_id']}, {video['lang']}) "
+              f"- 일치 {video['matches']}개")
+        for hit in video['hits']:
+            timestamp = CueStore.format_timestamp(hit['start_ms'])
+            url = f"https://youtu.be/{video['video_id']}?t={hit['start_ms'] // 1000}"
+            print(f"   [{timestamp}] {hit['start_ms']} ms  {hit['text']}")
+            print(f"      {url}")
+
+
+def stats(args: argparse.Namespace):
+    with TranscriptIndex(args.db) as index:
+        result = index.stats()
+    print(f"🗂️  영상 {result['videos']:,}개, 문서 {result['documents']:,}개, 큐 {result['cues']:,}개 ({args.db})")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='자막을 SQLite FTS5로 색인하고 영상/시각 단위로 검색',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        '--db',
+        type=str,
+        default=DEFAULT_DB,
+        help=f'색인 파일 경로 (기본값: {DEFAULT_DB})'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', help='VTT 파일 색인 (바뀐 영상만 다시 색인)')
+    add_parser.add_argument(
+        'source',
+        help='VTT 디렉토리(하위 폴더 포함, .vtt.gz 포함) 또는 glob 패턴 (예: "archive/**/*.vtt.gz")'
+    )
+    add_parser.add_argument(
+        '-l', '--lang',
+        type=str,
+        default='ko',
+        help='파일 이름에 언어가 없을 때 사용할 언어 (기본값: ko)'
+    )
+    add_parser.add_argument(
+        '--overlap',
+        type=str,
+        choices=SubtitleProcessor.OVERLAP_MODES,
+        default='prefix',
+        help='롤링 중복 제거 방식 (기본값: prefix)'
+    )
+    add_parser.add_argument(
+        '--min-overlap',
+        type=int,
+        default=SubtitleProcessor.MIN_OVERLAP_CHARS,
+        help=f'partial 모드에서 제거할 최소 겹침 길이 (기본값: {SubtitleProcessor.MIN_OVERLAP_CHARS})'
+    )
+    add_parser.add_argument(
+        '--dedup-window',
+        type=int,
+        default=0,
+        help='최근 N개 줄 안에서 다시 나온 같은 줄은 색인하지 않음 (권장: 8, 기본값: 0=끄기)'
+    )
+    add_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='한 트랜잭션으로 색인할 파일 수 (기본값: 500)'
+    )
+    add_parser.add_argument(
+        '--optimize',
+        action='store_true',
+        help='색인 후 FTS5 세그먼트 병합 (대량 색인 후 검색 속도 향상)'
+    )
+    add_parser.set_defaults(func=add)
+
+    search_parser = subparsers.add_parser('search', help='검색어가 나오는 영상과 시각 검색')
+    search_parser.add_argument(
+        'query',
+        nargs='+',
+        help="검색어 (모든 단어 포함, '단어*'는 접두어 검색)"
+    )
+    search_parser.add_argument(
+        '--videos',
+        type=int,
+        default=10,
+        help='최대 영상 수 (기본값: 10)'
+    )
+    search_parser.add_argument(
+        '--hits',
+        type=int,
+        default=5,
+        help='영상마다 보여 줄 최대 위치 수 (기본값: 5)'
+    )
+    search_parser.add_argument(
+        '-l', '--lang',
+        type=str,
+        help='이 언어의 자막만 검색'
+    )
+    search_parser.add_argument(
+        '--raw-query',
+        action='store_true',
+        help='검색어를 FTS5 쿼리 문법 그대로 사용 (OR, NEAR, 구문 검색 등)'
+    )
+    search_parser.set_defaults(func=search)
+
+    stats_parser = subparsers.add_parser('stats', help='색인 통계')
+    stats_parser.set_defaults(func=stats)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
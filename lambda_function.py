@@ -1,21 +1,183 @@
 import json
 import os
-import boto3
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 # import psycopg2
-from src.ytdlp_fetcher import YtDlpFetcher
+from src.ytdlp_fetcher import YtDlpFetcher, YtDlpAuthError, YtDlpError, YtDlpUnavailableError
 from src.subtitle_processor import SubtitleProcessor
+from src.result_cache import ResultCache, LocalDiskCacheBackend, S3CacheBackend
+from src.info_cache import InfoCache
+from src.s3_storage import ScrapArchive
+from src.rate_limiter import AdaptiveRateLimiter
+from src.metrics import StageTimer
 
-s3 = boto3.client('s3')
-secrets_manager = boto3.client('secretsmanager')
+# AWS 클라이언트는 처음 쓸 때 만들어 웜 인보케이션 간에 재사용 (boto3 import와 클라이언트 생성이
+# 콜드 스타트 초기화 시간의 대부분을 차지하므로 import 시점에는 만들지 않음)
+_aws_clients = {}
+_aws_clients_lock = threading.Lock()
+
+def get_aws_client(service_name):
+    """boto3 클라이언트를 서비스별로 한 번만 생성 (스레드 안전)"""
+    client = _aws_clients.get(service_name)
+    if client is None:
+        with _aws_clients_lock:
+            client = _aws_clients.get(service_name)
+            if client is None:
+                import boto3
+                client = _aws_clients[service_name] = boto3.client(service_name)
+    return client
+
+def get_s3():
+    return get_aws_client('s3')
+
+# SQS 배치 처리: 한 인보케이션 안에서 동시에 처리할 메시지 수와 YouTube 초당 최대 조회 수
+# 스로틀링(HTTP 429, 봇 확인)되면 속도를 낮추고 백오프 후 재시도하며, 낮춘 속도는 웜 인보케이션 사이에 유지됩니다.
+# Lambda 제한 시간 안에 끝나도록 재시도 횟수와 최대 백오프를 CLI보다 짧게 둡니다.
+SQS_WORKERS = int(os.environ.get('SQS_WORKERS', '4'))
+rate_limiter = AdaptiveRateLimiter(float(os.environ.get('YOUTUBE_RATE', '2.0')), burst=SQS_WORKERS,
+                                   max_retries=int(os.environ.get('YOUTUBE_MAX_RETRIES', '2')),
+                                   backoff_max=float(os.environ.get('YOUTUBE_BACKOFF_MAX', '10')))
+
+# 웜 인보케이션 간에 YoutubeDL 세션 풀을 재사용하기 위해 모듈 레벨에서 생성
+# (SQS 작업자 수만큼 세션을 유휴 상태로 보관)
+fetcher = YtDlpFetcher(pool_size=max(YtDlpFetcher.DEFAULT_POOL_SIZE, SQS_WORKERS), rate_limiter=rate_limiter)
+
+# 원본 VTT/영상 정보 보관 여부 (ARCHIVE_RAW=0이면 scrap_result.json만 저장)
+ARCHIVE_RAW = os.environ.get('ARCHIVE_RAW', '1') != '0'
+
+# scrap_result.json 저장 형식 (json: 들여쓰기 JSON, gzip/zstd: 압축한 compact JSON)과
+# 내용이 같으면 업로드를 생략할지 여부 (RESULT_SKIP_UNCHANGED=0이면 항상 덮어씀)
+RESULT_FORMAT = os.environ.get('RESULT_FORMAT', 'json')
+RESULT_SKIP_UNCHANGED = os.environ.get('RESULT_SKIP_UNCHANGED', '1') != '0'
+_archives = {}
+
+# 최근 N개 줄 안에서 다시 나온 같은 줄 제거 (DEDUP_WINDOW=0이면 끔)
+DEDUP_WINDOW = int(os.environ.get('DEDUP_WINDOW', '0'))
+
+# 자막 언어 우선순위 (예: 'ko,ko-*,en,ko:translated', 없으면 한국어 수동/자동 → 자동 번역 순)
+SUBTITLE_LANGS = os.environ.get('SUBTITLE_LANGS')
+
+# 영상별 단계 시간을 CloudWatch EMF 로그로 출력할 네임스페이스 (METRICS_NAMESPACE=''이면 출력 안 함)
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'YoutubeScraper')
+
+# 결과 캐시 (RESULT_CACHE_PREFIX: S3 prefix 백엔드, RESULT_CACHE_DIR: 로컬 디스크 백엔드)
+result_cache = None
+
+# 영상 정보 캐시 (INFO_CACHE_PREFIX: S3 prefix 백엔드, INFO_CACHE_DIR: 로컬 디스크 백엔드)
+# 같은 영상을 다른 언어로 다시 요청하면 extract_info 없이 자막만 다운로드
+info_cache = None
+
+# 웜 인보케이션 간 쿠키 시크릿 캐시 (COOKIE_CACHE_TTL초 동안 Secrets Manager 호출 생략)
+COOKIE_SECRET_ID = os.environ.get('YOUTUBE_COOKIES_SECRET_ID', 'youtube-cookies')
+COOKIE_CACHE_TTL = float(os.environ.get('COOKIE_CACHE_TTL', '900'))
+# 조회에 실패했을 때 이전 값을 쓰면서 다시 조회하기까지 기다릴 시간 (이전 값이 없으면 다음 호출에서 바로 재시도)
+COOKIE_RETRY_INTERVAL = float(os.environ.get('COOKIE_RETRY_INTERVAL', '30'))
+_cookie_cache = {'value': None, 'expires_at': None}
+_cookie_lock = threading.Lock()
+
+def get_youtube_cookies(force_refresh=False, client=None):
+    """
+    Secrets Manager에서 YouTube 쿠키를 가져옵니다.
+    TTL 안에서는 캐시된 값을 반환합니다. 조회에 실패하면 이전 값을 그대로 사용하고
+    COOKIE_RETRY_INTERVAL초 뒤에 다시 조회하며, 이전 값이 없으면 다음 호출에서 바로 다시 조회합니다.
+
+    Args:
+        force_refresh: 캐시를 무시하고 다시 조회 (인증 실패 시)
+        client: Secrets Manager 클라이언트 (테스트용, 기본값은 모듈 클라이언트)
+    """
+    with _cookie_lock:
+        expires_at = _cookie_cache['expires_at']
+        if not force_refresh and expires_at is not None and time.monotonic() < expires_at:
+            return _cookie_cache['value']
+
+        try:
+            response = (client or get_aws_client('secretsmanager')).get_secret_value(SecretId=COOKIE_SECRET_ID)
+        except Exception as e:
+            print(f"Error fetching {COOKIE_SECRET_ID} from Secrets Manager: {e}")
+            if _cookie_cache['value'] is not None:
+                _cookie_cache['expires_at'] = time.monotonic() + min(COOKIE_RETRY_INTERVAL, COOKIE_CACHE_TTL)
+            return _cookie_cache['value']
+
+        _cookie_cache['value'] = response.get('SecretString')
+        _cookie_cache['expires_at'] = time.monotonic() + COOKIE_CACHE_TTL
+        return _cookie_cache['value']
+
+def invalidate_youtube_cookies():
+    """캐시된 쿠키를 버립니다. 다음 get_youtube_cookies() 호출에서 다시 조회합니다."""
+    with _cookie_lock:
+        _cookie_cache['value'] = None
+        _cookie_cache['expires_at'] = None
+
+def fetch_with_cookie_refresh(video_url, timer=None, **kwargs):
+    """
+    캐시된 쿠키로 조회하고, 인증 오류가 나면 쿠키를 새로 받아 한 번 더 시도합니다.
+    timer(StageTimer)를 넘기면 쿠키 조회와 yt-dlp 단계 시간을 기록합니다.
+    """
+    timer = timer or StageTimer()
+    with timer.stage('secret_fetch'):
+        cookies = get_youtube_cookies()
+    if cookies:
+        print(f"Using YouTube cookies. Length: {len(cookies)}")
+    else:
+        print("Could not fetch cookies from Secrets Manager. Proceeding without cookies.")
 
-def get_youtube_cookies():
-    """Secrets Manager에서 YouTube 쿠키를 가져옵니다."""
     try:
-        response = secrets_manager.get_secret_value(SecretId='youtube-cookies')
-        return response.get('SecretString')
-    except Exception as e:
-        print(f"Error fetching youtube-cookies from Secrets Manager: {e}")
-        return None
+        return fetcher.fetch_all_in_one(video_url, cookies=cookies, timer=timer, **kwargs)
+    except YtDlpAuthError as e:
+        print(f"Authentication failure, refreshing cookies: {e}")
+        with timer.stage('secret_fetch'):
+            fresh_cookies = get_youtube_cookies(force_refresh=True)
+        if not fresh_cookies or fresh_cookies == cookies:
+            raise
+        return fetcher.fetch_all_in_one(video_url, cookies=fresh_cookies, timer=timer, **kwargs)
+
+def get_result_cache(bucket_name):
+    """환경 변수 설정에 따라 결과 캐시를 생성합니다. 설정이 없으면 None을 반환합니다."""
+    global result_cache
+    if result_cache is None:
+        prefix = os.environ.get('RESULT_CACHE_PREFIX')
+        cache_dir = os.environ.get('RESULT_CACHE_DIR')
+        # 0이면 개수 제한 정리를 끔 (S3 수명 주기 규칙으로 prefix를 만료시키는 경우)
+        max_entries = int(os.environ.get('RESULT_CACHE_MAX_ENTRIES', '10000')) or None
+        ttl = float(os.environ.get('RESULT_CACHE_TTL', ResultCache.DEFAULT_TTL))
+
+        if prefix:
+            backend = S3CacheBackend(bucket_name, prefix=prefix, client=get_s3(), max_entries=max_entries)
+        elif cache_dir:
+            backend = LocalDiskCacheBackend(cache_dir, max_entries=max_entries)
+        else:
+            return None
+        result_cache = ResultCache(backend, ttl=ttl)
+    return result_cache
+
+def get_info_cache(bucket_name):
+    """환경 변수 설정에 따라 영상 정보 캐시를 생성합니다. 설정이 없으면 None을 반환합니다."""
+    global info_cache
+    if info_cache is None:
+        prefix = os.environ.get('INFO_CACHE_PREFIX')
+        cache_dir = os.environ.get('INFO_CACHE_DIR')
+        # 0이면 개수 제한 정리를 끔 (S3 수명 주기 규칙으로 prefix를 만료시키는 경우)
+        max_entries = int(os.environ.get('INFO_CACHE_MAX_ENTRIES', '10000')) or None
+        ttl = float(os.environ.get('INFO_CACHE_TTL', InfoCache.DEFAULT_TTL))
+
+        if prefix:
+            backend = S3CacheBackend(bucket_name, prefix=prefix, client=get_s3(), max_entries=max_entries)
+        elif cache_dir:
+            backend = LocalDiskCacheBackend(cache_dir, max_entries=max_entries)
+        else:
+            return None
+        info_cache = InfoCache(backend, ttl=ttl)
+    return info_cache
+
+def get_archive(bucket_name):
+    """버킷별 ScrapArchive를 한 번만 만들어 웜 인보케이션 간 업로드 통계와 함께 재사용합니다."""
+    archive = _archives.get(bucket_name)
+    if archive is None:
+        archive = _archives[bucket_name] = ScrapArchive(
+            bucket_name, client=get_s3(), result_format=RESULT_FORMAT, skip_unchanged=RESULT_SKIP_UNCHANGED
+        )
+    return archive
 
 # def get_db_connection():
 #     return psycopg2.connect(
@@ -41,52 +203,8 @@ def lambda_handler(event, context):
         }
 
     try:
-        # 1. Secrets Manager에서 쿠키 가져오기
-        cookies = get_youtube_cookies()
-
-        if cookies:
-            print(f"Successfully fetched cookies from Secrets Manager. Length: {len(cookies)}, Preview: {cookies[:100]}...")
-        else:
-            print("Could not fetch cookies from Secrets Manager. Proceeding without cookies.")
-
-        # 2. yt-dlp를 사용하여 정보 가져오기
-        fetcher = YtDlpFetcher()
-        data = fetcher.fetch_all_in_one(video_url, cookies=cookies)
-        
-        video_info = data.get('video_info', {})
-        vtt_text = data.get('vtt_text')
-        video_id = video_info.get('video_id', 'unknown_video')
-
-        # 4. 자막 및 텍스트 처리
-        processor = SubtitleProcessor()
-        transcript = processor.process(vtt_text) if vtt_text else None
-
-        # 5. 설명 및 고정 댓글 텍스트 정리
-        if video_info.get('description'):
-            video_info['description'] = processor.clean_text(video_info['description'])
-        
-        pinned_comment = data.get('pinned_comment')
-        if pinned_comment and pinned_comment.get('text'):
-            pinned_comment['text'] = processor.clean_text(pinned_comment['text'])
-
-        # 6. S3에 저장할 최종 결과 데이터 구성
-        result = {
-            'video_info': video_info,
-            'pinned_comment': pinned_comment,
-            'transcript': transcript
-        }
-        
-        # 7. S3에 JSON 파일로 업로드
-        s3_key = f"{video_id}/scrap_result.json"
-        # # 8. RDS 상태를 'SCRAPED'로 업데이트
-        # update_status(db_conn, social_media_id, 'SCRAPED')
-
-        s3.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=json.dumps(result, ensure_ascii=False, indent=4),
-            ContentType='application/json'
-        )
+        s3_key = process_video(video_url, bucket_name, SubtitleProcessor(),
+                               languages=event.get('languages') or SUBTITLE_LANGS)
 
         return {
             'statusCode': 200,
@@ -104,3 +222,246 @@ def lambda_handler(event, context):
     # finally:
     #     if db_conn:
     #         db_conn.close()
+
+def process_video(video_url, bucket_name, processor, lang='ko', auto_generated=True, languages=None):
+    """
+    영상 하나를 조회·처리해 S3에 올리고 업로드한 키를 반환합니다. 실패하면 예외를 그대로 던집니다.
+    lambda_handler와 sqs_handler가 공유하며, 여러 스레드에서 동시에 호출해도 안전합니다.
+    단계별 소요 시간은 성공 여부와 관계없이 EMF 로그 한 줄로 출력합니다.
+    languages('ko,ko-*,en,ko:translated' 또는 목록)를 넘기면 lang 대신 우선순위 순서로 자막을 고릅니다.
+    """
+    if isinstance(languages, (list, tuple)):
+        languages = ','.join(languages)
+    timer = StageTimer()
+    requested_id = fetcher.extract_video_id(video_url)
+    properties = {'video_id': requested_id, 'lang': lang, 'status': 'failed', 'cache_hit': False}
+    try:
+        s3_key = _process_video(video_url, bucket_name, processor, lang, auto_generated, languages, timer,
+                                properties)
+        properties['status'] = 'ok'
+        return s3_key
+    except YtDlpError as e:
+        properties['error_kind'] = e.kind
+        raise
+    finally:
+        if METRICS_NAMESPACE:
+            timer.emit_emf(METRICS_NAMESPACE,
+                           {'FunctionName': os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'local')},
+                           properties)
+
+def _process_video(video_url, bucket_name, processor, lang, auto_generated, languages, timer, properties):
+    # 0. 결과 캐시 확인 (적중 시 쿠키 조회와 YouTube 요청 모두 생략)
+    cache = get_result_cache(bucket_name)
+    requested_id = properties['video_id']
+    cache_lang = languages or lang
+    # 캐시된 결과는 같은 댓글 모드·처리 설정으로 만든 경우에만 사용 (COMMENT_MODE, DEDUP_WINDOW 등을 바꾸면 다시 처리)
+    settings = {'comments': os.environ.get('COMMENT_MODE', 'pinned'), 'overlap': 'prefix',
+                'min_overlap': processor.MIN_OVERLAP_CHARS, 'dedup_window': DEDUP_WINDOW}
+    data = cache.get(requested_id, cache_lang, auto_generated) if cache and requested_id else None
+    if data is not None and any(data.get(key) != value for key, value in settings.items()):
+        print(f"Result cache entry for {requested_id} was built with different comment/processing settings, ignoring")
+        data = None
+    properties['cache_hit'] = data is not None
+
+    if data is not None:
+        print(f"Result cache hit for {requested_id}. Cache stats: {cache.stats()}")
+        transcript = data.get('transcript')
+        # 캐시 적중 시에는 처음 조회할 때 이미 보관했으므로 다시 올리지 않음
+        vtt_text = None
+    else:
+        # 1~2. 캐시된 쿠키로 yt-dlp 조회 (인증 실패 시 쿠키 갱신 후 재시도, 스로틀링은 fetcher가 백오프 후 재시도)
+        data = fetch_with_cookie_refresh(video_url, timer=timer, lang=lang, auto_generated=auto_generated,
+                                         comments=settings['comments'], languages=languages,
+                                         info_cache=get_info_cache(bucket_name))
+        stats = data.pop('stats')
+        properties.update(comment_pages=stats['comment_pages'], session_reused=stats['session_reused'],
+                          info_cache_hit=stats['info_cache_hit'], retries=stats['retries'])
+        if stats['retries']:
+            print(f"Retried {stats['retries']} times after throttling/transient errors. "
+                  f"Rate limiter: {rate_limiter.stats()}")
+        print(f"Comment pages fetched: {stats['comment_pages']}")
+        if stats['info_cache_hit']:
+            print(f"Info cache hit for {requested_id}, extract_info skipped")
+        print(f"yt-dlp session reused: {stats['session_reused']}, "
+              f"saved: {stats['session_init_saved_ms']} ms")
+
+        # 4. 자막 및 텍스트 처리
+        vtt_text = data.get('vtt_text')
+        dedup_stats = {}
+        transcript = processor.process(vtt_text, overlap=settings['overlap'], min_overlap=settings['min_overlap'],
+                                       timer=timer, dedup_window=settings['dedup_window'],
+                                       stats=dedup_stats) if vtt_text else None
+        properties['dedup_removed'] = dedup_stats.get('dedup_removed', 0)
+        if properties['dedup_removed']:
+            print(f"Repeated caption lines removed: {properties['dedup_removed']}")
+
+        if cache and transcript:
+            cache.put(requested_id, cache_lang, auto_generated, {**data, 'transcript': transcript, **settings})
+            print(f"Result cached for {requested_id}. Cache stats: {cache.stats()}")
+
+    video_info = data.get('video_info', {})
+    video_id = video_info.get('video_id', 'unknown_video')
+    subtitle = {'lang': data.get('subtitle_lang') or lang, 'kind': data.get('subtitle_kind')}
+    properties['subtitle_lang'] = subtitle['lang']
+    if vtt_text:
+        print(f"Subtitle served: {subtitle['lang']} ({subtitle['kind']})")
+    archive = get_archive(bucket_name)
+
+    # 4-1. 원본 VTT와 정리 전 영상 정보 보관 (처리 규칙이 바뀌면 reprocess_handler로 재생성)
+    if vtt_text and ARCHIVE_RAW:
+        try:
+            with timer.stage('s3_upload'):
+                archive.archive(video_id, vtt_text, video_info, data.get('pinned_comment'), subtitle['lang'],
+                                auto_generated, subtitle['kind'])
+        except Exception as e:
+            print(f"Failed to archive raw VTT for {video_id}: {e}")
+
+    # 5~6. 설명 및 고정 댓글 텍스트를 정리해 최종 결과 데이터 구성
+    with timer.stage('cleaning'):
+        result = archive.build_result(processor, video_info, data.get('pinned_comment'), transcript, subtitle)
+    
+    # 7. S3에 JSON 파일로 업로드
+    # # 8. RDS 상태를 'SCRAPED'로 업데이트
+    # update_status(db_conn, social_media_id, 'SCRAPED')
+    with timer.stage('s3_upload'):
+        s3_key = archive.put_result(video_id, result)
+    print(f"S3 upload stats: {archive.stats()}")
+    return s3_key
+
+def parse_sqs_video_url(record):
+    """
+    SQS 메시지 본문에서 영상 URL 추출 ({"video_url": ...} JSON 또는 URL 문자열)
+    본문이 비었거나 JSON이 깨졌거나 영상 URL이 아니면 ValueError를 던집니다 (다시 보내도 성공할 수 없는 메시지).
+    """
+    body = (record.get('body') or '').strip()
+    if body.startswith('{'):
+        try:
+            video_url = json.loads(body).get('video_url')
+        except ValueError as e:
+            raise ValueError(f'malformed JSON body: {e}') from e
+    else:
+        video_url = body
+    if not video_url or not isinstance(video_url, str):
+        raise ValueError('video_url is required')
+    if not fetcher.extract_video_id(video_url):
+        raise ValueError(f'not a YouTube video URL or ID: {video_url[:200]}')
+    return video_url
+
+def sqs_handler(event, context):
+    """
+    SQS 배치 이벤트를 받아 메시지들을 한 인보케이션 안에서 동시에 처리합니다.
+    fetcher(세션 풀), SubtitleProcessor, 캐시된 쿠키, S3 클라이언트를 모든 작업자가 공유하고,
+    실패한 메시지만 batchItemFailures로 돌려주어 SQS가 그 메시지만 다시 보내게 합니다.
+    없거나 비공개인 영상(YtDlpUnavailableError)과 본문이 잘못된 메시지는 다시 보내도 실패하므로
+    로그만 남기고 실패로 돌려주지 않습니다.
+    (이벤트 소스 매핑에 ReportBatchItemFailures 설정이 필요합니다.)
+    """
+    records = event.get('Records', [])
+    bucket_name = os.environ.get('S3_BUCKET_NAME')
+    if not bucket_name:
+        # 설정 오류는 메시지별 문제가 아니므로 배치 전체를 재시도 대상으로 돌림
+        print("S3_BUCKET_NAME environment variable is not set")
+        return {'batchItemFailures': [{'itemIdentifier': record['messageId']} for record in records]}
+
+    processor = SubtitleProcessor()
+    # 작업자 스레드들이 동시에 만들지 않도록 공유 객체를 먼저 준비
+    get_result_cache(bucket_name)
+    get_info_cache(bucket_name)
+    get_archive(bucket_name)
+    get_youtube_cookies()
+
+    # 다시 보내지 않고 버린 메시지 (잘못된 메시지, 없는 영상)
+    dropped_ids = []
+
+    def handle(record):
+        message_id = record['messageId']
+        try:
+            video_url = parse_sqs_video_url(record)
+        except ValueError as e:
+            # 잘못된 메시지는 다시 보내도 같은 결과이므로 maxReceiveCount까지 인보케이션을 쓰지 않게 버림
+            print(f"[{message_id}] Invalid message, dropping: {e}. Body: {(record.get('body') or '')[:200]!r}")
+            dropped_ids.append(message_id)
+            return None
+        try:
+            s3_key = process_video(video_url, bucket_name, processor, languages=SUBTITLE_LANGS)
+            print(f"[{message_id}] Uploaded to s3://{bucket_name}/{s3_key}")
+            return None
+        except YtDlpUnavailableError as e:
+            # 없거나 비공개인 영상은 다시 보내도 실패하므로 재시도 대상에서 뺌
+            print(f"[{message_id}] Permanently unavailable, not retrying: {e}")
+            dropped_ids.append(message_id)
+            return None
+        except Exception as e:
+            print(f"[{message_id}] Failed: {e}")
+            return message_id
+
+    start = time.monotonic()
+    workers = max(1, min(SQS_WORKERS, len(records)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        failed_ids = [message_id for message_id in executor.map(handle, records) if message_id]
+
+    elapsed = time.monotonic() - start
+    print(f"SQS batch: {len(records) - len(failed_ids) - len(dropped_ids)}/{len(records)} succeeded, "
+          f"{len(dropped_ids)} dropped, {len(failed_ids)} failed with {workers} workers "
+          f"in {elapsed:.1f}s ({elapsed / max(len(records), 1):.2f}s per message). "
+          f"Session pool: {fetcher.pool_stats()}, S3 upload: {get_archive(bucket_name).stats()}")
+    return {'batchItemFailures': [{'itemIdentifier': message_id} for message_id in failed_ids]}
+
+def reprocess_handler(event, context):
+    """
+    보관된 원본 VTT와 영상 정보로 scrap_result.json을 다시 만듭니다. YouTube에는 요청하지 않습니다.
+
+    event:
+        video_id 또는 video_ids: 재처리할 영상 ID (목록)
+        all: true면 원본이 보관된 모든 영상
+        overlap, min_overlap, dedup_window: SubtitleProcessor.process() 옵션 (선택)
+    """
+    bucket_name = os.environ.get('S3_BUCKET_NAME')
+    if not bucket_name:
+        return {
+            'statusCode': 500,
+            'body': json.dumps({'error': 'S3_BUCKET_NAME environment variable is not set'})
+        }
+
+    # 응답에 이번 호출의 업로드 통계만 담도록 공유 객체 대신 새로 생성
+    archive = ScrapArchive(bucket_name, client=get_s3(), result_format=RESULT_FORMAT,
+                           skip_unchanged=RESULT_SKIP_UNCHANGED)
+    if event.get('all'):
+        video_ids = list(archive.iter_archived_video_ids())
+    else:
+        video_ids = event.get('video_ids') or ([event['video_id']] if event.get('video_id') else [])
+
+    if not video_ids:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({'error': 'video_id, video_ids or all is required'})
+        }
+
+    process_kwargs = {key: event[key] for key in ('overlap', 'min_overlap', 'dedup_window') if key in event}
+    processor = SubtitleProcessor()
+    succeeded, failed = [], {}
+    for video_id in video_ids:
+        try:
+            archive.reprocess(video_id, processor, **process_kwargs)
+            succeeded.append(video_id)
+        except Exception as e:
+            print(f"Failed to reprocess {video_id}: {e}")
+            failed[video_id] = str(e)
+
+    return {
+        'statusCode': 200 if not failed else 207,
+        'body': json.dumps({'reprocessed': succeeded, 'failed': failed, 'upload_stats': archive.stats()},
+                           ensure_ascii=False)
+    }
+
+def warm_up():
+    """
+    지연 초기화 대상을 미리 준비합니다 (AWS 클라이언트, yt_dlp와 YouTube 익스트랙터).
+    프로비저닝된 동시성처럼 초기화 단계에서 미리 데우는 편이 나은 환경에서는 WARM_UP_ON_INIT=1로 켭니다.
+    """
+    get_s3()
+    get_aws_client('secretsmanager')
+    fetcher.warm_up()
+
+if os.environ.get('WARM_UP_ON_INIT') == '1':
+    warm_up()
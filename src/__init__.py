@@ -1,9 +1,38 @@
 """
 YouTube 자막 추출 라이브러리 (yt-dlp 기반)
+
+하위 모듈은 이름에 처음 접근할 때 import합니다 (PEP 562).
+`from src import SubtitleProcessor`만 쓰는 경로는 yt_dlp를 불러오지 않습니다.
 """
 
-from .ytdlp_fetcher import YtDlpFetcher
-from .subtitle_processor import SubtitleProcessor
+import importlib
+
+_LAZY_EXPORTS = {
+    'YtDlpFetcher': '.ytdlp_fetcher',
+    'YtDlpAuthError': '.ytdlp_fetcher',
+    'YtDlpBotCheckError': '.ytdlp_fetcher',
+    'YtDlpError': '.ytdlp_fetcher',
+    'YtDlpThrottledError': '.ytdlp_fetcher',
+    'YtDlpTransientError': '.ytdlp_fetcher',
+    'YtDlpUnavailableError': '.ytdlp_fetcher',
+    'SubtitleProcessor': '.subtitle_processor',
+    'CueStore': '.cue_store',
+    'Cue': '.cue_store',
+    'process_many': '.bulk_processor',
+}
 
-__all__ = ['YtDlpFetcher', 'SubtitleProcessor']
+__all__ = list(_LAZY_EXPORTS)
 __version__ = '2.0.0'
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
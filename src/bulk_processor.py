@@ -0,0 +1,250 @@
+"""
+보관된 VTT 파일 일괄 재처리 모듈
+디렉토리나 glob 패턴의 .vtt(.vtt.gz 포함) 파일들을 프로세스 풀로 나누어 처리하고, 끝나는 대로 결과 파일을 씁니다.
+"""
+
+import os
+import glob
+import gzip
+import time
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Optional, Iterable, Iterator, Callable, TextIO, Union
+
+from .cue_writers import CUE_FORMATS
+from .subtitle_processor import SubtitleProcessor
+
+# 워커 프로세스마다 한 번 만들어 재사용하는 처리 객체와 옵션
+_worker_processor: Optional[SubtitleProcessor] = None
+_worker_options: Dict = {}
+
+
+def collect_vtt_files(source: Union[str, Iterable[str]]) -> List[Path]:
+    """
+    처리할 .vtt 파일 목록 수집
+
+    Args:
+        source: 디렉토리(하위 폴더 포함, 원본 보관 형식인 .vtt.gz도 포함), glob 패턴(** 지원), 또는 파일 경로 목록
+    """
+    if not isinstance(source, str):
+        return [Path(path) for path in source]
+
+    path = Path(source).expanduser()
+    if path.is_dir():
+        return sorted([*path.rglob('*.vtt'), *path.rglob('*.vtt.gz')])
+    if path.is_file():
+        return [path]
+    return sorted(Path(match) for match in glob.glob(os.path.expanduser(source), recursive=True)
+                  if os.path.isfile(match))
+
+
+def open_vtt(path: Path) -> TextIO:
+    """VTT 파일을 텍스트로 열기 (.gz면 압축을 풀며 읽음)"""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def output_path_for(vtt_path: Path, base_dir: Optional[Path], output_dir: Optional[Path],
+                    extension: str = 'txt') -> Path:
+    """
+    결과 파일 경로 (output_dir가 없으면 VTT 옆에 .<extension>으로 저장, ko.vtt.gz → ko.<extension>)
+    output_dir가 있으면 base_dir 기준 상대 경로를 그대로 유지합니다.
+    """
+    if vtt_path.suffix == '.gz':
+        vtt_path = vtt_path.with_suffix('')
+    if output_dir is None:
+        return vtt_path.with_suffix(f'.{extension}')
+    relative = vtt_path.relative_to(base_dir) if base_dir else Path(vtt_path.name)
+    return output_dir / relative.with_suffix(f'.{extension}')
+
+
+def _init_worker(options: Dict):
+    global _worker_processor, _worker_options
+    _worker_processor = SubtitleProcessor()
+    _worker_options = options
+
+
+def _process_file(vtt_path: Path, out_path: Path) -> Dict:
+    """VTT 하나를 스트리밍으로 처리해 임시 파일에 쓰고 교체 (워커 프로세스에서 실행)"""
+    start = time.perf_counter()
+    result = {'path': str(vtt_path), 'status': 'ok', 'bytes_in': 0, 'chars_out': 0, 'dedup_removed': 0,
+              'error': None}
+    tmp_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        if _worker_options.get('skip_existing') and out_path.exists():
+            result['status'] = 'skipped'
+            return result
+
+        result['bytes_in'] = vtt_path.stat().st_size
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        overlap = _worker_options.get('overlap', 'prefix')
+        min_overlap = _worker_options.get('min_overlap', SubtitleProcessor.MIN_OVERLAP_CHARS)
+        output_format = _worker_options.get('output_format', 'txt')
+        dedup_window = _worker_options.get('dedup_window', 0)
+        dedup_stats = {}
+        with open_vtt(vtt_path) as src, open(tmp_path, 'w', encoding='utf-8') as dst:
+            if output_format == 'txt':
+                written = _worker_processor.write_transcript(src, dst, overlap=overlap, min_overlap=min_overlap,
+                                                             dedup_window=dedup_window, stats=dedup_stats)
+            else:
+                # 시각 형식은 기록한 큐 수를 반환하므로 문자 수는 쓴 파일 크기로 셈
+                cue_count = _worker_processor.write_cues(
+                    src, dst, output_format, overlap=overlap, min_overlap=min_overlap,
+                    window_ms=_worker_options.get('window_ms'),
+                    max_chars=_worker_options.get('max_chars'),
+                    max_count=_worker_options.get('max_count'),
+                    dedup_window=dedup_window, stats=dedup_stats
+                )
+                written = dst.tell() if cue_count else 0
+
+        result['dedup_removed'] = dedup_stats.get('dedup_removed', 0)
+        if written:
+            os.replace(tmp_path, out_path)
+            result['chars_out'] = written
+        else:
+            # process()가 None을 반환하는 경우와 같이 결과가 비면 파일을 남기지 않음
+            tmp_path.unlink()
+            result['status'] = 'empty'
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+        try:
+            tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+    finally:
+        result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def _process_chunk(chunk: List[tuple]) -> Dict:
+    """파일 묶음 하나를 처리하고 결과 목록과 워커 PID를 반환 (워커 프로세스에서 실행)"""
+    return {
+        'pid': os.getpid(),
+        'results': [_process_file(vtt_path, out_path) for vtt_path, out_path in chunk],
+    }
+
+
+def _chunks(items: List, size: int) -> Iterator[List]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def process_many(
+    source: Union[str, Iterable[str]],
+    output_dir: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    overlap: str = 'prefix',
+    min_overlap: int = SubtitleProcessor.MIN_OVERLAP_CHARS,
+    skip_existing: bool = False,
+    progress: Optional[Callable[[Dict], None]] = None,
+    output_format: str = 'txt',
+    window_ms: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    max_count: Optional[int] = None,
+    dedup_window: int = 0,
+) -> Dict:
+    """
+    여러 VTT 파일을 프로세스 풀로 재처리하고 결과를 .txt(또는 .srt/.vtt/.jsonl) 파일로 저장
+
+    파일을 chunksize개씩 묶어 제출하고, 동시에 대기시키는 묶음 수를 워커 수의 두 배로 제한해
+    파일 수와 무관하게 메모리 사용량을 일정하게 유지합니다. 결과 파일은 워커가 처리 즉시 씁니다.
+
+    Args:
+        source: 디렉토리, glob 패턴, 또는 파일 경로 목록
+        output_dir: 결과 디렉토리 (None이면 각 VTT 옆에 저장)
+        workers: 워커 프로세스 수 (기본값: CPU 코어 수)
+        chunksize: 한 번에 워커에 넘길 파일 수
+        overlap: 롤링 오버랩 제거 방식 ('prefix' 또는 'partial')
+        min_overlap: partial 모드의 최소 겹침 길이(문자 수)
+        skip_existing: 결과 파일이 이미 있으면 건너뜀 (중단 후 이어서 처리할 때)
+        progress: 묶음 하나가 끝날 때마다 호출할 함수 (누적 통계 dict를 인자로 받음)
+        output_format: 'txt'(본문만) 또는 시각을 유지하는 'srt', 'vtt', 'jsonl'
+        window_ms, max_chars, max_count: 시각 형식의 병합 조건 (SubtitleProcessor.iter_merge_cues)
+        dedup_window: 0보다 크면 최근 이 개수의 줄 안에서 반복된 줄 제거
+
+    Returns:
+        전체 통계 (files, ok, empty, skipped, failed, dedup_removed, elapsed_s, files_per_sec, mb_per_sec,
+        worker_count, utilization, workers(PID별 통계), errors)
+    """
+    if overlap not in SubtitleProcessor.OVERLAP_MODES:
+        raise ValueError(f"지원하지 않는 오버랩 제거 방식: {overlap} (지원: {', '.join(SubtitleProcessor.OVERLAP_MODES)})")
+    if output_format != 'txt' and output_format not in CUE_FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output_format} (지원: txt, {', '.join(CUE_FORMATS)})")
+
+    files = collect_vtt_files(source)
+    if isinstance(source, str) and Path(source).expanduser().is_dir():
+        base_dir = Path(source).expanduser()
+    else:
+        base_dir = Path(os.path.commonpath([str(path.parent) for path in files])) if files else None
+    out_dir = Path(output_dir).expanduser() if output_dir else None
+    tasks = [(path, output_path_for(path, base_dir, out_dir, output_format)) for path in files]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, chunksize)
+    stats = {
+        'files': len(tasks), 'done': 0, 'ok': 0, 'empty': 0, 'skipped': 0, 'failed': 0,
+        'bytes_in': 0, 'chars_out': 0, 'dedup_removed': 0, 'workers': {}, 'errors': [],
+    }
+    options = {
+        'overlap': overlap, 'min_overlap': min_overlap, 'skip_existing': skip_existing,
+        'output_format': output_format, 'window_ms': window_ms, 'max_chars': max_chars, 'max_count': max_count,
+        'dedup_window': dedup_window,
+    }
+    start = time.perf_counter()
+
+    def collect(chunk_result: Dict):
+        worker = stats['workers'].setdefault(chunk_result['pid'], {
+            'files': 0, 'failed': 0, 'bytes_in': 0, 'chars_out': 0, 'busy_s': 0.0,
+        })
+        for result in chunk_result['results']:
+            stats['done'] += 1
+            stats[result['status']] += 1
+            stats['bytes_in'] += result['bytes_in']
+            stats['chars_out'] += result['chars_out']
+            stats['dedup_removed'] += result['dedup_removed']
+            worker['files'] += 1
+            worker['bytes_in'] += result['bytes_in']
+            worker['chars_out'] += result['chars_out']
+            worker['busy_s'] += result['seconds']
+            if result['status'] == 'failed':
+                worker['failed'] += 1
+                stats['errors'].append((result['path'], result['error']))
+        if progress:
+            progress(_summary(stats, time.perf_counter() - start))
+
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(options,)) as executor:
+            chunks = _chunks(tasks, chunksize)
+            pending = set()
+            max_pending = workers * 2
+            for chunk in chunks:
+                pending.add(executor.submit(_process_chunk, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+            for future in pending:
+                collect(future.result())
+
+    return _summary(stats, time.perf_counter() - start, workers)
+
+
+def _summary(stats: Dict, elapsed: float, workers: Optional[int] = None) -> Dict:
+    summary = {key: value for key, value in stats.items() if key != 'workers'}
+    summary['elapsed_s'] = round(elapsed, 3)
+    summary['files_per_sec'] = round(stats['done'] / elapsed, 1) if elapsed else 0.0
+    summary['mb_per_sec'] = round(stats['bytes_in'] / 1024 / 1024 / elapsed, 2) if elapsed else 0.0
+    summary['workers'] = {
+        pid: {**worker, 'busy_s': round(worker['busy_s'], 3),
+              'files_per_sec': round(worker['files'] / worker['busy_s'], 1) if worker['busy_s'] else 0.0}
+        for pid, worker in stats['workers'].items()
+    }
+    if workers is not None:
+        summary['worker_count'] = workers
+        # 워커들이 실제로 일한 시간의 합 / (경과 시간 × 워커 수)
+        busy = sum(worker['busy_s'] for worker in stats['workers'].values())
+        summary['utilization'] = round(busy / (elapsed * workers), 3) if elapsed else 0.0
+    return summary
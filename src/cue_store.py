@@ -0,0 +1,176 @@
+"""
+자막 큐 저장소 모듈
+큐마다 dict와 문자열을 만드는 대신 시작/종료 시각(ms)을 array('q') 열로, 텍스트를 리스트로 보관합니다.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Optional, Iterable, Iterator, NamedTuple
+
+
+class Cue(NamedTuple):
+    """큐 하나 (시각은 밀리초 정수)"""
+
+    start_ms: int
+    end_ms: int
+    text: str
+
+    @property
+    def time(self) -> str:
+        """기존 블록 형식의 시작 시각 (예: 01:23, 한 시간 이상이면 1:01:23)"""
+        return CueStore.format_timestamp(self.start_ms)
+
+
+class CueStore:
+    """
+    시작/종료 시각과 텍스트를 열(column) 단위로 보관하는 큐 컨테이너
+
+    슬라이스는 열을 복사하지 않고 같은 열의 구간을 가리키는 뷰를 반환하므로 O(1)입니다.
+    뷰에는 append할 수 없습니다.
+    시작 시각이 오름차순이면 between()/index_at()이 이진 탐색으로 동작합니다.
+    """
+
+    __slots__ = ('_starts', '_ends', '_texts', '_lo', '_hi', '_sorted', '_is_view')
+
+    def __init__(self, cues: Optional[Iterable] = None):
+        """
+        Args:
+            cues: (start_ms, end_ms, text) 튜플 또는 Cue 이터러블
+        """
+        self._starts = array('q')
+        self._ends = array('q')
+        self._texts: List[str] = []
+        self._lo = 0
+        self._hi = 0
+        self._sorted = True
+        self._is_view = False
+        if cues is not None:
+            for start_ms, end_ms, text in cues:
+                self.append(start_ms, end_ms, text)
+
+    @classmethod
+    def _view(cls, parent: 'CueStore', lo: int, hi: int) -> 'CueStore':
+        view = cls.__new__(cls)
+        view._starts = parent._starts
+        view._ends = parent._ends
+        view._texts = parent._texts
+        view._lo = lo
+        view._hi = max(lo, hi)
+        view._sorted = parent._sorted
+        view._is_view = True
+        return view
+
+    @staticmethod
+    def parse_timestamp(timestamp: str) -> int:
+        """
+        VTT 타임스탬프를 밀리초로 변환
+        01:02:03.456 -> 3723456, 02:03.456 -> 123456
+        """
+        clock, _, fraction = timestamp.partition('.')
+        ms = 0
+        for part in clock.split(':'):
+            ms = ms * 60 + int(part)
+        return ms * 1000 + int(fraction.ljust(3, '0')[:3])
+
+    @staticmethod
+    def format_timestamp(ms: int, precise: bool = False) -> str:
+        """
+        밀리초를 타임스탬프 문자열로 변환
+        한 시간 미만은 기존 simplify_timestamp와 같은 MM:SS, 이상이면 H:MM:SS 형식입니다.
+
+        Args:
+            ms: 밀리초
+            precise: True면 VTT 형식(HH:MM:SS.mmm)으로 반환
+        """
+        seconds, millis = divmod(int(ms), 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if precise:
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def append(self, start_ms: int, end_ms: int, text: str):
+        """큐 추가"""
+        if self._is_view:
+            raise ValueError("CueStore 뷰에는 큐를 추가할 수 없습니다")
+        if self._hi and start_ms < self._starts[-1]:
+            self._sorted = False
+        self._starts.append(start_ms)
+        self._ends.append(end_ms)
+        self._texts.append(text)
+        self._hi += 1
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def __iter__(self) -> Iterator[Cue]:
+        lo, hi = self._lo, self._hi
+        for start_ms, end_ms, text in zip(self._starts[lo:hi], self._ends[lo:hi], self._texts[lo:hi]):
+            yield Cue(start_ms, end_ms, text)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._view(self, self._lo + start, self._lo + stop)
+            return CueStore(self[i] for i in range(start, stop, step))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CueStore index out of range")
+        i = self._lo + index
+        return Cue(self._starts[i], self._ends[i], self._texts[i])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CueStore):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"CueStore({len(self)} cues)"
+
+    # memoryview를 쥐고 있는 동안에는 원본 array 크기를 바꿀 수 없으므로(BufferError)
+    # append 전에 참조를 놓아야 합니다.
+    @property
+    def starts(self) -> memoryview:
+        """시작 시각 열 (복사 없는 읽기 뷰)"""
+        return memoryview(self._starts)[self._lo:self._hi]
+
+    @property
+    def ends(self) -> memoryview:
+        """종료 시각 열 (복사 없는 읽기 뷰)"""
+        return memoryview(self._ends)[self._lo:self._hi]
+
+    @property
+    def texts(self) -> List[str]:
+        """텍스트 열 (뷰이면 해당 구간의 복사본)"""
+        if self._lo == 0 and self._hi == len(self._texts):
+            return self._texts
+        return self._texts[self._lo:self._hi]
+
+    def index_at(self, ms: int) -> int:
+        """
+        ms 시각에 표시 중인(시작 시각이 ms 이하인 마지막) 큐의 인덱스
+        해당하는 큐가 없으면 -1을 반환합니다.
+        """
+        if not self._sorted:
+            raise ValueError("시작 시각이 정렬되지 않은 CueStore는 이진 탐색할 수 없습니다")
+        return bisect_right(self._starts, ms, self._lo, self._hi) - 1 - self._lo
+
+    def between(self, start_ms: int, end_ms: int) -> 'CueStore':
+        """
+        시작 시각이 [start_ms, end_ms) 구간에 있는 큐들의 뷰
+        정렬된 저장소는 이진 탐색(O(log n))으로, 아니면 전체를 훑어 복사본을 만듭니다.
+        """
+        if self._sorted:
+            lo = bisect_left(self._starts, start_ms, self._lo, self._hi)
+            hi = bisect_left(self._starts, end_ms, lo, self._hi)
+            return self._view(self, lo, hi)
+        return CueStore(cue for cue in self if start_ms <= cue.start_ms < end_ms)
+
+    def to_blocks(self) -> List[Dict[str, str]]:
+        """기존 [{'time': '01:23', 'text': ...}] 블록 형식으로 변환"""
+        return [{'time': cue.time, 'text': cue.text} for cue in self]
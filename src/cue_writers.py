@@ -0,0 +1,79 @@
+"""
+시각이 있는 자막 출력 모듈
+(시작 ms, 종료 ms, 텍스트) 큐를 SRT, WebVTT, JSONL 형식으로 파일 객체에 바로 씁니다.
+큐를 하나씩 받아 쓰므로 전체 결과를 메모리에 만들지 않습니다.
+"""
+
+import json
+from typing import Dict, Iterable, Optional, TextIO, Tuple
+
+from .cue_store import CueStore
+
+CUE_FORMATS = ('srt', 'vtt', 'jsonl')
+
+TimedCue = Tuple[int, int, str]
+
+
+def format_srt_timestamp(ms: int) -> str:
+    """밀리초를 SRT 타임스탬프로 변환 (예: 01:02:03,456)"""
+    return CueStore.format_timestamp(ms, precise=True).replace('.', ',')
+
+
+def write_srt(cues: Iterable[TimedCue], fp: TextIO) -> int:
+    """SRT 형식으로 쓰고 쓴 큐 수를 반환"""
+    count = 0
+    for start_ms, end_ms, text in cues:
+        count += 1
+        fp.write(f"{count}\n{format_srt_timestamp(start_ms)} --> {format_srt_timestamp(end_ms)}\n{text}\n\n")
+    return count
+
+
+def write_vtt(cues: Iterable[TimedCue], fp: TextIO, lang: Optional[str] = None) -> int:
+    """WebVTT 형식으로 쓰고 쓴 큐 수를 반환 (텍스트의 &, <는 엔티티로 바꿈)"""
+    fp.write("WEBVTT\n")
+    if lang:
+        fp.write(f"Language: {lang}\n")
+    fp.write("\n")
+
+    count = 0
+    for start_ms, end_ms, text in cues:
+        count += 1
+        text = text.replace('&', '&amp;').replace('<', '&lt;')
+        fp.write(f"{CueStore.format_timestamp(start_ms, precise=True)} --> "
+                 f"{CueStore.format_timestamp(end_ms, precise=True)}\n{text}\n\n")
+    return count
+
+
+def write_jsonl(cues: Iterable[TimedCue], fp: TextIO, fields: Optional[Dict] = None) -> int:
+    """
+    한 줄에 큐 하나씩 JSON으로 쓰고 쓴 큐 수를 반환
+
+    Args:
+        fields: 모든 줄에 붙일 필드 (예: {'video_id': ..., 'lang': ...})
+    """
+    fields = fields or {}
+    count = 0
+    for start_ms, end_ms, text in cues:
+        count += 1
+        fp.write(json.dumps({**fields, 'start_ms': start_ms, 'end_ms': end_ms, 'text': text}, ensure_ascii=False))
+        fp.write("\n")
+    return count
+
+
+def write_cues(output_format: str, cues: Iterable[TimedCue], fp: TextIO, lang: Optional[str] = None,
+               fields: Optional[Dict] = None) -> int:
+    """
+    output_format에 맞는 작성기로 큐를 씀
+
+    Args:
+        output_format: 'srt', 'vtt', 'jsonl'
+        lang: VTT 헤더의 Language 값
+        fields: JSONL 줄마다 붙일 필드
+    """
+    if output_format == 'srt':
+        return write_srt(cues, fp)
+    if output_format == 'vtt':
+        return write_vtt(cues, fp, lang)
+    if output_format == 'jsonl':
+        return write_jsonl(cues, fp, fields)
+    raise ValueError(f"지원하지 않는 출력 형식: {output_format} (지원: {', '.join(CUE_FORMATS)})")
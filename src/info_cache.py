@@ -0,0 +1,158 @@
+"""
+영상 정보(info JSON) 캐시 모듈
+extract_info 결과에서 자막 트랙 선택과 결과 구성에 필요한 필드만 남겨 video ID별로 저장하고,
+같은 영상을 다른 언어로 다시 요청하면 추출(플레이어/JS 처리)을 건너뛰고 자막 트랙만 다운로드합니다.
+저장소는 result_cache의 로컬 디스크/S3 prefix 백엔드를 그대로 사용합니다.
+
+YouTube 자막 URL에는 만료 시각(expire 쿼리)이 있으므로 TTL과 URL 만료 시각 중 이른 쪽까지만 유효하며,
+그 전에 URL이 거부되면 fetch_all_in_one이 항목을 지우고 다시 추출합니다.
+"""
+
+import json
+import time
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+# 자막 트랙 선택과 video_info 구성에 쓰는 필드
+INFO_FIELDS = ('id', 'title', 'duration', 'uploader', 'upload_date', 'description', 'webpage_url')
+
+
+class InfoCache:
+    """video ID 단위의 축약된 extract_info 결과 캐시"""
+
+    DEFAULT_TTL = 6 * 60 * 60
+    # URL 만료 직전에 받기 시작해 실패하지 않도록 남겨 두는 여유 시간(초)
+    EXPIRY_MARGIN = 5 * 60
+
+    def __init__(self, backend, ttl: Optional[float] = DEFAULT_TTL, subtitle_ext: str = 'vtt'):
+        """
+        Args:
+            backend: LocalDiskCacheBackend 또는 S3CacheBackend (결과 캐시와 다른 디렉토리/prefix 권장)
+            ttl: 항목 유효 시간(초), None이면 자막 URL 만료 시각까지
+            subtitle_ext: 보관할 자막 형식 (다른 형식의 트랙은 버려서 크기를 줄임)
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.subtitle_ext = subtitle_ext
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(video_id: str, with_comments: bool) -> str:
+        """캐시 키 생성 (댓글 조회 여부에 따라 고정 댓글 유무가 달라지므로 구분)"""
+        return f"info/{video_id}/{'comments' if with_comments else 'nocomments'}"
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def trim(self, info: Dict) -> Dict:
+        """
+        extract_info 결과에서 필요한 필드만 남김
+        formats, thumbnails 등은 버리고 자막은 subtitle_ext 형식만, 댓글은 고정 댓글만 보관합니다.
+        """
+        trimmed = {key: info[key] for key in INFO_FIELDS if key in info}
+        for field in ('subtitles', 'automatic_captions'):
+            tracks = {}
+            for lang, formats in (info.get(field) or {}).items():
+                kept = [
+                    {key: value for key, value in fmt.items() if key in ('ext', 'url', 'data', 'name')}
+                    for fmt in formats or [] if fmt.get('ext') == self.subtitle_ext
+                ]
+                if kept:
+                    tracks[lang] = kept
+            trimmed[field] = tracks
+        if info.get('comments') is not None:
+            trimmed['comments'] = [comment for comment in info['comments'] if comment.get('is_pinned')]
+        return trimmed
+
+    @staticmethod
+    def url_expiry(info: Dict) -> Optional[float]:
+        """자막 URL들의 expire 쿼리 중 가장 이른 시각 (없으면 None)"""
+        earliest = None
+        for field in ('subtitles', 'automatic_captions'):
+            for formats in (info.get(field) or {}).values():
+                for fmt in formats:
+                    expire = parse_qs(urlparse(fmt.get('url') or '').query).get('expire')
+                    if expire and expire[0].isdigit():
+                        value = float(expire[0])
+                        earliest = value if earliest is None else min(earliest, value)
+        return earliest
+
+    def get(self, video_id: str, with_comments: bool) -> Optional[Dict]:
+        """캐시된 축약 info를 반환 (없거나 TTL/URL 만료가 지났으면 None)"""
+        key = self.make_key(video_id, with_comments)
+        try:
+            raw = self.backend.get(key)
+        except Exception as e:
+            print(f"⚠️ 정보 캐시 조회 실패 ({key}): {e}")
+            raw = None
+
+        if raw is None:
+            self._count('misses')
+            return None
+
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            entry = None
+        if not isinstance(entry, dict) or 'info' not in entry:
+            self._delete(key)
+            self._count('misses')
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() >= expires_at:
+            self._delete(key)
+            self._count('expired')
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return entry['info']
+
+    def put(self, video_id: str, with_comments: bool, info: Dict) -> Dict:
+        """extract_info 결과를 축약해 저장하고 축약본을 반환 (저장 실패는 경고만 출력)"""
+        trimmed = self.trim(info)
+        now = time.time()
+        deadlines = []
+        if self.ttl is not None:
+            deadlines.append(now + self.ttl)
+        url_expiry = self.url_expiry(trimmed)
+        if url_expiry is not None:
+            deadlines.append(url_expiry - self.EXPIRY_MARGIN)
+        expires_at = min(deadlines) if deadlines else None
+
+        if expires_at is None or expires_at > now:
+            key = self.make_key(video_id, with_comments)
+            entry = {'cached_at': now, 'expires_at': expires_at, 'info': trimmed}
+            try:
+                self.backend.put(key, json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+            except Exception as e:
+                print(f"⚠️ 정보 캐시 저장 실패 ({key}): {e}")
+        return trimmed
+
+    def _delete(self, key: str):
+        """항목 삭제 (삭제 실패는 경고만 출력)"""
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            print(f"⚠️ 정보 캐시 삭제 실패 ({key}): {e}")
+
+    def invalidate(self, video_id: str, with_comments: bool):
+        """자막 URL이 거부되는 등 더 쓸 수 없는 항목 삭제"""
+        self._delete(self.make_key(video_id, with_comments))
+
+    def stats(self) -> Dict:
+        """hit/miss 카운터"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
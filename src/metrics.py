@@ -0,0 +1,138 @@
+"""
+단계별 처리 시간 측정 모듈
+CLI와 Lambda가 같은 StageTimer로 각 단계의 소요 시간을 모으고,
+Lambda에서는 CloudWatch EMF(Embedded Metric Format) JSON 로그로, CLI에서는 요약 표로 출력합니다.
+"""
+
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Iterator
+
+# 표와 EMF 출력 순서 (여기 없는 단계는 기록된 순서대로 뒤에 붙음)
+STAGES = (
+    'secret_fetch',     # Secrets Manager 쿠키 조회
+    'rate_wait',        # 요청 속도 제한과 스로틀링 백오프 대기
+    'ydl_init',         # YoutubeDL 세션 생성 (풀에서 재사용하면 0)
+    'info_cache',       # 캐시된 영상 정보 조회 (적중하면 extract_info 생략)
+    'extract_info',     # extract_info (댓글 페이지 조회 제외)
+    'comment_paging',   # 댓글 페이지 조회
+    'subtitle_read',    # 자막 트랙 다운로드
+    'parse_vtt',        # VTT 파싱
+    'overlap',          # 롤링 오버랩 제거
+    'cleaning',         # 텍스트 정리와 공백 병합
+    's3_upload',        # S3 업로드
+)
+
+STAGE_LABELS = {
+    'secret_fetch': '쿠키 시크릿 조회',
+    'rate_wait': '속도 제한 대기',
+    'ydl_init': 'YoutubeDL 생성',
+    'info_cache': '영상 정보 캐시',
+    'extract_info': 'extract_info',
+    'comment_paging': '댓글 페이지 조회',
+    'subtitle_read': '자막 다운로드',
+    'parse_vtt': 'VTT 파싱',
+    'overlap': '오버랩 제거',
+    'cleaning': '텍스트 정리',
+    's3_upload': 'S3 업로드',
+}
+
+
+class StageTimer:
+    """
+    단계 이름별 누적 시간(ms)과 횟수를 모으는 타이머
+    여러 스레드에서 같은 객체에 기록해도 안전하며, 여러 영상의 시간을 합산할 때는 merge()를 사용합니다.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록의 실행 시간을 name 단계에 더함 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name: str, ms: float, count: int = 1):
+        """이미 측정한 시간(ms)을 name 단계에 더함"""
+        with self._lock:
+            self._totals[name] = self._totals.get(name, 0.0) + ms
+            self._counts[name] = self._counts.get(name, 0) + count
+
+    def merge(self, other: 'StageTimer'):
+        """다른 타이머의 기록을 합산"""
+        for name, (total, count) in other.snapshot().items():
+            self.add(name, total, count)
+
+    def snapshot(self) -> Dict[str, tuple]:
+        """{단계: (누적 ms, 횟수)}를 STAGES 순서로 반환"""
+        with self._lock:
+            names = [name for name in STAGES if name in self._totals]
+            names += [name for name in self._totals if name not in STAGES]
+            return {name: (self._totals[name], self._counts[name]) for name in names}
+
+    def timings(self) -> Dict[str, float]:
+        """{단계: 누적 ms} (소수 둘째 자리 반올림)"""
+        return {name: round(total, 2) for name, (total, _) in self.snapshot().items()}
+
+    def total_ms(self) -> float:
+        return sum(total for total, _ in self.snapshot().values())
+
+    def emf(self, namespace: str, dimensions: Optional[Dict[str, str]] = None,
+            properties: Optional[Dict] = None) -> Dict:
+        """
+        CloudWatch EMF 형식의 로그 객체 생성
+        단계마다 '{단계}_ms' 지표(Milliseconds)를 만들고, properties는 검색용 필드로만 붙입니다.
+
+        Args:
+            namespace: CloudWatch 지표 네임스페이스
+            dimensions: 지표 차원 (예: {'Handler': 'sqs'})
+            properties: 지표가 아닌 추가 필드 (예: video_id)
+        """
+        dimensions = dimensions or {}
+        timings = self.timings()
+        metrics = {f"{name}_ms": ms for name, ms in timings.items()}
+        metrics['total_ms'] = round(sum(timings.values()), 2)
+        return {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': namespace,
+                    'Dimensions': [list(dimensions)],
+                    'Metrics': [{'Name': name, 'Unit': 'Milliseconds'} for name in metrics],
+                }],
+            },
+            **(properties or {}),
+            **dimensions,
+            **metrics,
+        }
+
+    def emit_emf(self, namespace: str, dimensions: Optional[Dict[str, str]] = None,
+                 properties: Optional[Dict] = None):
+        """EMF 로그를 한 줄 JSON으로 출력 (Lambda에서는 CloudWatch Logs가 지표로 추출)"""
+        print(json.dumps(self.emf(namespace, dimensions, properties), ensure_ascii=False))
+
+    def format_table(self, title: str = '단계별 처리 시간') -> str:
+        """단계별 횟수, 합계, 평균, 비율 표 문자열"""
+        snapshot = self.snapshot()
+        grand_total = sum(total for total, _ in snapshot.values())
+        lines = [
+            f"⏱️  {title}",
+            "-" * 64,
+            f"{'단계':<20}{'횟수':>6}{'합계(ms)':>14}{'평균(ms)':>12}{'비율':>10}",
+            "-" * 64,
+        ]
+        for name, (total, count) in snapshot.items():
+            share = total / grand_total * 100 if grand_total else 0.0
+            lines.append(f"{STAGE_LABELS.get(name, name):<20}{count:>6}{total:>14.2f}"
+                         f"{total / count if count else 0.0:>12.2f}{share:>9.1f}%")
+        lines.append("-" * 64)
+        lines.append(f"{'합계':<20}{'':>6}{grand_total:>14.2f}")
+        return '\n'.join(lines)
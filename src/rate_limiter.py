@@ -0,0 +1,258 @@
+"""
+YouTube 요청 속도 제한 모듈
+여러 작업자가 동시에 요청할 때 호스트별 토큰 버킷으로 요청 간격을 조절합니다.
+AdaptiveRateLimiter는 스로틀링(HTTP 429, 봇 확인) 신호에 맞춰 호스트별 속도를 AIMD로 조절하고,
+재시도할 수 있는 오류는 지터를 넣은 지수 백오프로 다시 시도합니다.
+"""
+
+import time
+import random
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓입니다.
+    토큰이 부족하면 부족분을 '예약'(음수 잔고)하고 그만큼 대기하므로
+    대기 중인 작업자들이 도착 순서대로 균등한 간격으로 풀려납니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 한 번에 몰아서 허용할 최대 요청 수
+        """
+        self.rate = rate
+        self.capacity = max(int(burst), 1)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 소비하고 필요하면 대기
+
+        Returns:
+            실제 대기한 시간(초)
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float):
+        """
+        지금까지 쌓인 토큰은 이전 속도로 계산하고 이후부터 새 속도로 채움
+        이미 예약된 대기(음수 잔고)는 시간 기준으로 유지해 속도를 낮춰도 대기 중인 작업자가 더 밀리지 않습니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                if self._tokens < 0 and rate > 0:
+                    self._tokens *= rate / self.rate
+            self._last = now
+            self.rate = rate
+
+    def penalize(self, seconds: float):
+        """
+        지금부터 seconds초 동안 새 토큰을 내주지 않음 (Retry-After, 0이면 쌓인 토큰만 비움)
+        같은 시점에 여러 번 불려도 대기 시간이 누적되지 않습니다.
+        """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class HostRateLimiter:
+    """호스트별로 TokenBucket을 관리하는 속도 제한기"""
+
+    # 같은 서비스로 취급할 호스트 별칭
+    HOST_ALIASES = {
+        'youtu.be': 'youtube.com',
+        'youtube-nocookie.com': 'youtube.com',
+    }
+    DEFAULT_HOST = 'youtube.com'
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 호스트당 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 호스트당 한 번에 몰아서 허용할 최대 요청 수
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def host_of(cls, url: str) -> str:
+        """URL에서 속도 제한 단위가 되는 호스트 추출 (video ID만 주어지면 YouTube)"""
+        host: Optional[str] = urlparse(url).hostname if '://' in url else None
+        if not host:
+            return cls.DEFAULT_HOST
+        for prefix in ('www.', 'm.', 'music.'):
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+                break
+        return cls.HOST_ALIASES.get(host, host)
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> float:
+        """URL의 호스트 버킷에서 토큰을 하나 소비하고 대기한 시간(초)을 반환"""
+        return self.bucket(self.host_of(url)).acquire()
+
+
+class AdaptiveRateLimiter(HostRateLimiter):
+    """
+    스로틀링 신호에 맞춰 호스트별 속도를 조절하는 AIMD 속도 제한기
+
+    - 성공할 때마다 increase / 현재 속도만큼 올림 (현재 속도로 1초 동안 성공하면 increase만큼 오름, 최대 rate)
+    - 스로틀링되면 속도를 decrease배로 낮추고 쌓인 토큰을 비움 (최소 min_rate)
+      낮춘 뒤에 시작한 요청의 스로틀링만 다시 반영해, 동시에 진행 중이던 요청들이 한꺼번에 실패해도 한 번만 낮춥니다.
+    - call()은 재시도할 수 있는 오류를 지터를 넣은 지수 백오프로 다시 시도하고, 영구 오류는 바로 던집니다.
+
+    오류 분류는 예외의 속성으로 판단합니다 (src.ytdlp_fetcher.YtDlpError 참고).
+        retryable: True면 재시도
+        throttled: True면 속도를 낮춤
+        retry_after: 서버가 알려 준 대기 시간(초), 있으면 호스트 전체를 그만큼 멈춤
+    """
+
+    DEFAULT_MAX_RETRIES = 3
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 60.0
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: Optional[float] = None, increase: float = 0.5,
+                 decrease: float = 0.7, max_retries: int = DEFAULT_MAX_RETRIES, backoff_base: float = BACKOFF_BASE,
+                 backoff_max: float = BACKOFF_MAX):
+        """
+        Args:
+            rate: 호스트당 최대(시작) 초당 요청 수 (0 이하이면 속도 제한 없이 재시도만)
+            burst: 호스트당 한 번에 몰아서 허용할 최대 요청 수
+            min_rate: 낮출 수 있는 최소 속도 (기본값: rate / 20)
+            increase: 스로틀링 없이 1초가 지날 때마다 올릴 속도(초당 요청 수)
+            decrease: 스로틀링될 때 곱할 값 (0~1)
+            max_retries: call()의 최대 재시도 횟수
+            backoff_base, backoff_max: 백오프 시작/최대 대기 시간(초)
+        """
+        super().__init__(rate, burst)
+        self.min_rate = min_rate if min_rate is not None else rate / 20
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # 호스트별 마지막으로 속도를 낮춘 시각 (time.monotonic)
+        self._decreased_at: Dict[str, float] = {}
+        self._stats = {'requests': 0, 'successes': 0, 'throttled': 0, 'retries': 0, 'decreases': 0, 'failed': 0}
+
+    def current_rate(self, url: str) -> float:
+        return self.bucket(self.host_of(url)).rate
+
+    def on_success(self, url: str):
+        """성공한 요청 반영 (가산 증가)"""
+        bucket = self.bucket(self.host_of(url))
+        with self._lock:
+            self._stats['successes'] += 1
+            if 0 < bucket.rate < self.rate:
+                bucket.set_rate(min(self.rate, bucket.rate + self.increase / bucket.rate))
+
+    def on_throttle(self, url: str, started_at: Optional[float] = None, retry_after: Optional[float] = None) -> bool:
+        """
+        스로틀링된 요청 반영 (승산 감소)
+
+        Args:
+            started_at: 요청을 보낸 시각 (time.monotonic, 마지막 감소 이전이면 속도를 다시 낮추지 않음)
+            retry_after: 서버가 알려 준 대기 시간(초)
+
+        Returns:
+            속도를 낮췄는지 여부
+        """
+        host = self.host_of(url)
+        bucket = self.bucket(host)
+        bucket.penalize(min(retry_after or 0.0, self.backoff_max))
+        with self._lock:
+            self._stats['throttled'] += 1
+            if bucket.rate <= 0:
+                return False
+            if started_at is not None and started_at < self._decreased_at.get(host, float('-inf')):
+                return False
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.decrease))
+            self._decreased_at[host] = time.monotonic()
+            self._stats['decreases'] += 1
+            return True
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째 재시도 전 대기 시간 (full jitter: 0 ~ base·2^attempt, Retry-After보다 짧지 않게)"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, min(retry_after or 0.0, self.backoff_max))
+
+    def call(self, url: str, func: Callable[[], Any],
+             log: Optional[Callable[[str], None]] = None) -> Tuple[Any, Dict]:
+        """
+        속도 제한을 지켜 func()를 호출하고 재시도할 수 있는 오류는 백오프 후 다시 시도
+
+        Returns:
+            (func() 결과, {'retries': 재시도 횟수, 'wait_ms': 속도 제한 대기 시간, 'backoff_ms': 백오프 대기 시간})
+        """
+        info = {'retries': 0, 'wait_ms': 0.0, 'backoff_ms': 0.0}
+        attempt = 0
+        while True:
+            info['wait_ms'] += self.acquire(url) * 1000
+            started_at = time.monotonic()
+            with self._lock:
+                self._stats['requests'] += 1
+            try:
+                result = func()
+            except Exception as e:
+                if getattr(e, 'throttled', False):
+                    self.on_throttle(url, started_at, getattr(e, 'retry_after', None))
+                if not getattr(e, 'retryable', False) or attempt >= self.max_retries:
+                    with self._lock:
+                        self._stats['failed'] += 1
+                    raise
+                delay = self.backoff_delay(attempt, getattr(e, 'retry_after', None))
+                if log:
+                    log(f"⏳ {e} - {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}, "
+                        f"속도 {self.current_rate(url):.2f}/초)")
+                time.sleep(delay)
+                info['backoff_ms'] += delay * 1000
+                attempt += 1
+                info['retries'] = attempt
+                with self._lock:
+                    self._stats['retries'] += 1
+                continue
+            self.on_success(url)
+            info['wait_ms'] = round(info['wait_ms'], 2)
+            info['backoff_ms'] = round(info['backoff_ms'], 2)
+            return result, info
+
+    def stats(self) -> Dict:
+        """누적 요청/성공/스로틀링/재시도/속도 감소 횟수와 호스트별 현재 속도"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['rates'] = {host: round(bucket.rate, 3) for host, bucket in self._buckets.items()}
+        return stats
@@ -0,0 +1,325 @@
+"""
+처리 결과 캐시 모듈
+같은 영상/언어/자막 종류에 대한 재요청을 YouTube 요청 없이 처리합니다.
+로컬 디스크와 S3 prefix 백엔드를 지원하며 TTL 만료와 크기 제한(LRU) 정리를 수행합니다.
+크기 제한 정리는 전체 항목을 훑어야 하므로 저장할 때마다 하지 않고 일정 횟수/시간마다 합니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict
+
+
+class _EvictSchedule:
+    """
+    크기 제한 정리 주기
+    프로세스의 첫 저장에서 한 번 정리하고, 이후에는 every번 저장하거나 interval초가 지날 때마다 정리합니다.
+    """
+
+    def __init__(self, every: int, interval: Optional[float]):
+        self.every = max(int(every), 1)
+        self.interval = interval
+        self._puts = 0
+        self._last: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def due(self) -> bool:
+        """저장 한 번을 기록하고 지금 정리할 차례인지 반환"""
+        with self._lock:
+            self._puts += 1
+            now = time.monotonic()
+            if (self._last is not None and self._puts < self.every
+                    and (self.interval is None or now - self._last < self.interval)):
+                return False
+            self._puts = 0
+            self._last = now
+            return True
+
+
+class LocalDiskCacheBackend:
+    """
+    로컬 디스크 캐시 백엔드
+    항목마다 JSON 파일 하나를 쓰고, 파일 수정 시각을 최근 사용 시각으로 사용합니다(LRU).
+    정리 주기 사이에는 max_entries를 최대 evict_every개까지 넘을 수 있습니다.
+    """
+
+    EVICT_EVERY = 50
+    EVICT_INTERVAL = 60.0
+
+    def __init__(self, cache_dir: str, max_entries: Optional[int] = 1000, max_bytes: Optional[int] = None,
+                 evict_every: int = EVICT_EVERY, evict_interval: Optional[float] = EVICT_INTERVAL):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (없으면 생성)
+            max_entries: 최대 항목 수 (None이면 제한 없음)
+            max_bytes: 최대 전체 크기 (None이면 제한 없음)
+            evict_every: 이 횟수만큼 저장할 때마다 크기 제한 정리
+            evict_interval: 마지막 정리 후 이 시간(초)이 지나면 다음 저장에서 정리 (None이면 횟수만 사용)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._evict_schedule = _EvictSchedule(evict_every, evict_interval)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # 최근 사용 시각 갱신 (LRU, 파일 내용은 다시 쓰지 않고 메타데이터만 바꿈)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes):
+        path = self._path(key)
+        # 다른 프로세스가 읽는 도중 잘린 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        if self._evict_schedule.due():
+            self.evict()
+
+    def delete(self, key: str):
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제하고 삭제 개수를 반환"""
+        if self.max_entries is None and self.max_bytes is None:
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        removed = 0
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries) or
+            (self.max_bytes is not None and total_bytes > self.max_bytes)
+        ):
+            _, size, path = entries.pop(0)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+            removed += 1
+        return removed
+
+
+class S3CacheBackend:
+    """
+    S3 prefix 캐시 백엔드
+    S3는 접근 시각을 기록하지 않으므로, 조회한 객체의 LastModified가 touch_interval보다 오래되었을 때만
+    객체를 자기 자신으로 복사해 갱신하는 방식으로 LRU 순서를 대략 유지합니다 (조회마다 쓰기를 하지 않음).
+    정리는 prefix 전체 목록을 조회하므로 evict_every번 저장하거나 evict_interval초가 지날 때마다 합니다.
+    prefix에 S3 수명 주기(만료) 규칙을 걸었다면 max_entries=None으로 정리를 끌 수 있습니다.
+    """
+
+    EVICT_EVERY = 100
+    EVICT_INTERVAL = 10 * 60.0
+    TOUCH_INTERVAL = 6 * 60 * 60.0
+
+    def __init__(self, bucket: str, prefix: str = 'cache/', client=None, max_entries: Optional[int] = 10000,
+                 evict_every: int = EVICT_EVERY, evict_interval: Optional[float] = EVICT_INTERVAL,
+                 touch_interval: Optional[float] = TOUCH_INTERVAL):
+        """
+        Args:
+            bucket: S3 버킷 이름
+            prefix: 캐시 객체 키 prefix
+            client: boto3 S3 클라이언트 (None이면 생성)
+            max_entries: 최대 항목 수 (None이면 제한 없음)
+            evict_every: 이 횟수만큼 저장할 때마다 크기 제한 정리
+            evict_interval: 마지막 정리 후 이 시간(초)이 지나면 다음 저장에서 정리 (None이면 횟수만 사용)
+            touch_interval: 조회한 객체가 이 시간(초)보다 오래되었을 때만 LastModified 갱신 (None이면 갱신 안 함)
+        """
+        if client is None:
+            import boto3
+            client = boto3.client('s3')
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = client
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self._evict_schedule = _EvictSchedule(evict_every, evict_interval)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        s3_key = self._key(key)
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=s3_key)
+        except self.client.exceptions.NoSuchKey:
+            return None
+        data = response['Body'].read()
+        if self._needs_touch(response.get('LastModified')):
+            self._touch(s3_key)
+        return data
+
+    def _needs_touch(self, last_modified: Optional[datetime]) -> bool:
+        if self.touch_interval is None or last_modified is None:
+            return False
+        return (datetime.now(timezone.utc) - last_modified).total_seconds() >= self.touch_interval
+
+    def _touch(self, s3_key: str):
+        """최근 사용 시각 갱신 (LRU, 실패해도 조회 결과에는 영향 없음)"""
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=s3_key,
+                CopySource={'Bucket': self.bucket, 'Key': s3_key},
+                MetadataDirective='REPLACE',
+                ContentType='application/json'
+            )
+        except Exception as e:
+            print(f"⚠️ 캐시 사용 시각 갱신 실패 ({s3_key}): {e}")
+
+    def put(self, key: str, data: bytes):
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(key),
+            Body=data,
+            ContentType='application/json'
+        )
+        if self._evict_schedule.due():
+            self.evict()
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+    def evict(self) -> int:
+        """최대 항목 수를 넘으면 LastModified가 가장 오래된 객체부터 삭제하고 삭제 개수를 반환"""
+        if self.max_entries is None:
+            return 0
+
+        objects = []
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            objects.extend(page.get('Contents', []))
+
+        excess = len(objects) - self.max_entries
+        if excess <= 0:
+            return 0
+
+        objects.sort(key=lambda obj: obj['LastModified'])
+        stale = objects[:excess]
+        # delete_objects는 한 번에 최대 1000개
+        for i in range(0, len(stale), 1000):
+            self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': obj['Key']} for obj in stale[i:i + 1000]], 'Quiet': True}
+            )
+        return len(stale)
+
+
+class ResultCache:
+    """
+    (video ID, 언어, 자막 종류) 단위의 처리 결과 캐시
+    TTL이 지난 항목은 조회 시 삭제하고 miss로 처리합니다.
+    """
+
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, backend, ttl: Optional[float] = DEFAULT_TTL):
+        """
+        Args:
+            backend: LocalDiskCacheBackend 또는 S3CacheBackend
+            ttl: 항목 유효 시간(초), None이면 만료 없음
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(video_id: str, lang: str, auto_generated: bool) -> str:
+        """캐시 키 생성 (예: dQw4w9WgXcQ/ko/auto)"""
+        return f"{video_id}/{lang}/{'auto' if auto_generated else 'manual'}"
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get(self, video_id: str, lang: str, auto_generated: bool) -> Optional[Dict]:
+        """캐시된 결과를 반환 (없거나 만료되면 None)"""
+        key = self.make_key(video_id, lang, auto_generated)
+        try:
+            raw = self.backend.get(key)
+        except Exception as e:
+            print(f"⚠️ 캐시 조회 실패 ({key}): {e}")
+            raw = None
+
+        if raw is None:
+            self._count('misses')
+            return None
+
+        try:
+            entry = json.loads(raw)
+        except ValueError:
+            entry = None
+        # 형식이 맞지 않는 항목(잘린 파일, 다른 버전이 쓴 항목 등)은 손상된 것으로 보고 삭제
+        if not isinstance(entry, dict) or 'value' not in entry:
+            self._delete(key)
+            self._count('misses')
+            return None
+
+        if self.ttl is not None and time.time() - entry.get('cached_at', 0) > self.ttl:
+            self._delete(key)
+            self._count('expired')
+            self._count('misses')
+            return None
+
+        self._count('hits')
+        return entry['value']
+
+    def _delete(self, key: str):
+        """손상·만료 항목 삭제 (삭제 실패는 경고만 출력하고 miss로 처리)"""
+        try:
+            self.backend.delete(key)
+        except Exception as e:
+            print(f"⚠️ 캐시 삭제 실패 ({key}): {e}")
+
+    def put(self, video_id: str, lang: str, auto_generated: bool, value: Dict):
+        """결과를 캐시에 저장 (저장 실패는 경고만 출력)"""
+        key = self.make_key(video_id, lang, auto_generated)
+        entry = {'cached_at': time.time(), 'value': value}
+        try:
+            self.backend.put(key, json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        except Exception as e:
+            print(f"⚠️ 캐시 저장 실패 ({key}): {e}")
+
+    def stats(self) -> Dict:
+        """hit/miss 카운터"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
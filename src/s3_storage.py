@@ -0,0 +1,273 @@
+"""
+S3 결과 저장 및 원본 보관 모듈
+scrap_result.json 옆에 원본 VTT와 영상 정보를 gzip으로 보관해 두고,
+처리 규칙이 바뀌면 YouTube 요청 없이 보관본으로 결과를 다시 만듭니다.
+
+객체 구성:
+    {video_id}/scrap_result.json   최종 결과 (result_format에 따라 gzip/zstd Content-Encoding)
+    {video_id}/raw/{lang}.vtt.gz   원본 VTT
+    {video_id}/info.json.gz        정리 전 영상 정보, 고정 댓글, 자막 언어/종류
+
+모든 객체는 압축 전 내용의 SHA-256을 메타데이터에 기록하고, 같은 내용이 이미 올라가 있으면
+put_object를 생략합니다 (반복 조회 시 PUT 요청과 전송량 절감).
+"""
+
+import gzip
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, Optional, Iterator, Tuple
+
+from .subtitle_processor import SubtitleProcessor
+
+
+class ScrapArchive:
+    """S3 버킷의 영상별 결과·원본 보관 객체 관리"""
+
+    RESULT_NAME = 'scrap_result.json'
+    INFO_NAME = 'info.json.gz'
+    RAW_DIR = 'raw'
+    # json: 기존과 같은 들여쓰기 JSON (압축 없음), gzip/zstd: 공백 없는 JSON을 압축
+    RESULT_FORMATS = ('json', 'gzip', 'zstd')
+    HASH_METADATA = 'content-sha256'
+    FORMAT_METADATA = 'result-format'
+
+    def __init__(self, bucket: str, client=None, prefix: str = '', result_format: str = 'json',
+                 skip_unchanged: bool = True):
+        """
+        Args:
+            bucket: S3 버킷 이름
+            client: boto3 S3 클라이언트 (None이면 생성, 테스트에서는 moto 클라이언트 주입)
+            prefix: 모든 키 앞에 붙일 prefix (기본값: 버킷 루트)
+            result_format: scrap_result.json 저장 형식 ('json', 'gzip', 'zstd')
+            skip_unchanged: 내용 해시가 같은 객체가 이미 있으면 업로드 생략
+        """
+        if result_format not in self.RESULT_FORMATS:
+            raise ValueError(f"지원하지 않는 결과 형식: {result_format} (지원: {', '.join(self.RESULT_FORMATS)})")
+        self._zstd = None
+        if result_format == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd 형식에는 zstandard 패키지가 필요합니다: pip install zstandard") from None
+            self._zstd = zstandard.ZstdCompressor(level=10)
+
+        if client is None:
+            import boto3
+            client = boto3.client('s3')
+        self.bucket = bucket
+        self.client = client
+        self.prefix = prefix
+        self.result_format = result_format
+        self.skip_unchanged = skip_unchanged
+
+        self.uploaded = 0
+        self.skipped = 0
+        self.bytes_raw = 0
+        self.bytes_stored = 0
+        self.bytes_uploaded = 0
+        self._lock = threading.Lock()
+
+    def result_key(self, video_id: str) -> str:
+        return f"{self.prefix}{video_id}/{self.RESULT_NAME}"
+
+    def info_key(self, video_id: str) -> str:
+        return f"{self.prefix}{video_id}/{self.INFO_NAME}"
+
+    def raw_key(self, video_id: str, lang: str) -> str:
+        return f"{self.prefix}{video_id}/{self.RAW_DIR}/{lang}.vtt.gz"
+
+    @staticmethod
+    def content_hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _is_unchanged(self, key: str, digest: str, content_format: str) -> bool:
+        """기존 객체의 메타데이터 해시·형식이 같은지 확인 (객체가 없거나 조회에 실패하면 False)"""
+        try:
+            metadata = self.client.head_object(Bucket=self.bucket, Key=key).get('Metadata', {})
+        except self.client.exceptions.ClientError:
+            return False
+        return (metadata.get(self.HASH_METADATA) == digest
+                and metadata.get(self.FORMAT_METADATA, 'json') == content_format)
+
+    def _put_if_changed(self, key: str, body: bytes, raw_size: int, digest: str, content_type: str,
+                        content_format: str) -> bool:
+        """
+        내용이 바뀐 경우에만 업로드하고 업로드 여부를 반환
+
+        Args:
+            key: S3 키
+            body: 업로드할 (압축된) 본문
+            raw_size: 압축 전 크기
+            digest: 압축 전 내용의 SHA-256
+            content_type: Content-Type
+            content_format: 'json', 'gzip', 'zstd' (Content-Encoding 결정)
+        """
+        unchanged = self.skip_unchanged and self._is_unchanged(key, digest, content_format)
+        if not unchanged:
+            params = {}
+            if content_format != 'json':
+                params['ContentEncoding'] = content_format
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=body,
+                ContentType=content_type,
+                Metadata={self.HASH_METADATA: digest, self.FORMAT_METADATA: content_format},
+                **params
+            )
+
+        with self._lock:
+            self.bytes_raw += raw_size
+            self.bytes_stored += len(body)
+            if unchanged:
+                self.skipped += 1
+            else:
+                self.uploaded += 1
+                self.bytes_uploaded += len(body)
+
+        if unchanged:
+            print(f"⏭️ 변경 없음, 업로드 생략: s3://{self.bucket}/{key}")
+        return not unchanged
+
+    def _put_gzip(self, key: str, data: bytes, content_type: str, digest: Optional[str] = None) -> bool:
+        # mtime=0: 같은 내용이면 압축 결과도 같도록 gzip 헤더의 시각을 고정
+        return self._put_if_changed(key, gzip.compress(data, mtime=0), len(data),
+                                    digest or self.content_hash(data), content_type, 'gzip')
+
+    def stats(self) -> Dict:
+        """업로드/생략 횟수와 크기 통계 (bytes_raw: 압축 전, bytes_stored: 압축 후, bytes_uploaded: 실제 전송)"""
+        with self._lock:
+            return {
+                'uploaded': self.uploaded,
+                'skipped': self.skipped,
+                'bytes_raw': self.bytes_raw,
+                'bytes_stored': self.bytes_stored,
+                'bytes_uploaded': self.bytes_uploaded,
+                'compression_ratio': round(self.bytes_stored / self.bytes_raw, 4) if self.bytes_raw else 0.0,
+            }
+
+    def _get_gzip(self, key: str) -> bytes:
+        body = self.client.get_object(Bucket=self.bucket, Key=key)['Body'].read()
+        # 일부 클라이언트/프록시는 Content-Encoding을 보고 미리 풀어서 주므로 gzip 헤더를 확인
+        return gzip.decompress(body) if body[:2] == b'\x1f\x8b' else body
+
+    def archive(self, video_id: str, vtt_text: str, video_info: Dict, pinned_comment: Optional[Dict],
+                lang: str, auto_generated: bool, kind: Optional[str] = None):
+        """
+        원본 VTT와 정리 전 영상 정보를 gzip으로 보관
+
+        Args:
+            video_id: YouTube video ID
+            vtt_text: 원본 VTT 텍스트
+            video_info: fetch_all_in_one()의 video_info (정리 전)
+            pinned_comment: fetch_all_in_one()의 pinned_comment (정리 전)
+            lang: 실제로 받은 자막 언어
+            auto_generated: 자동 생성 자막 포함 여부
+            kind: 자막 종류 ('manual', 'auto', 'translated')
+        """
+        self._put_gzip(self.raw_key(video_id, lang), vtt_text.encode('utf-8'), 'text/vtt; charset=utf-8')
+        info = {
+            'video_info': video_info,
+            'pinned_comment': pinned_comment,
+            'lang': lang,
+            'kind': kind,
+            'auto_generated': auto_generated,
+        }
+        # 보관 시각은 해시에서 빼서, 내용이 같으면 다시 올리지 않음
+        digest = self.content_hash(json.dumps(info, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        info['archived_at'] = time.time()
+        self._put_gzip(self.info_key(video_id), json.dumps(info, ensure_ascii=False).encode('utf-8'),
+                       'application/json', digest=digest)
+
+    def load(self, video_id: str) -> Dict:
+        """
+        보관된 영상 정보와 원본 VTT를 읽어 fetch_all_in_one()과 같은 형태로 반환
+
+        Raises:
+            FileNotFoundError: 보관본이 없을 때
+        """
+        try:
+            info = json.loads(self._get_gzip(self.info_key(video_id)))
+            vtt_text = self._get_gzip(self.raw_key(video_id, info['lang'])).decode('utf-8')
+        except self.client.exceptions.NoSuchKey:
+            raise FileNotFoundError(f"보관된 원본이 없습니다: {video_id}")
+        return {**info, 'vtt_text': vtt_text}
+
+    def encode_result(self, result: Dict) -> Tuple[bytes, bytes]:
+        """
+        result_format에 맞게 결과를 직렬화
+
+        Returns:
+            (압축 전 JSON, 업로드할 본문)
+        """
+        if self.result_format == 'json':
+            data = json.dumps(result, ensure_ascii=False, indent=4).encode('utf-8')
+            return data, data
+
+        data = json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if self.result_format == 'zstd':
+            return data, self._zstd.compress(data)
+        return data, gzip.compress(data, mtime=0)
+
+    def put_result(self, video_id: str, result: Dict) -> str:
+        """scrap_result.json 업로드 후 S3 키 반환 (내용이 같으면 업로드 생략)"""
+        key = self.result_key(video_id)
+        data, body = self.encode_result(result)
+        self._put_if_changed(key, body, len(data), self.content_hash(data), 'application/json',
+                             self.result_format)
+        return key
+
+    def iter_archived_video_ids(self) -> Iterator[str]:
+        """원본이 보관된 video ID를 하나씩 생성"""
+        suffix = f"/{self.INFO_NAME}"
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                if key.endswith(suffix):
+                    yield key[len(self.prefix):-len(suffix)]
+
+    @staticmethod
+    def build_result(processor: SubtitleProcessor, video_info: Dict, pinned_comment: Optional[Dict],
+                     transcript: Optional[str], subtitle: Optional[Dict] = None) -> Dict:
+        """
+        scrap_result.json 내용 구성 (설명과 고정 댓글 텍스트 정리 포함)
+        보관본을 건드리지 않도록 복사본을 정리합니다.
+        subtitle({'lang', 'kind'})을 넘기면 실제로 사용한 자막 언어를 결과에 함께 기록합니다.
+        """
+        video_info = dict(video_info or {})
+        if video_info.get('description'):
+            video_info['description'] = processor.clean_text(video_info['description'])
+
+        if pinned_comment and pinned_comment.get('text'):
+            pinned_comment = {**pinned_comment, 'text': processor.clean_text(pinned_comment['text'])}
+
+        result = {
+            'video_info': video_info,
+            'pinned_comment': pinned_comment,
+            'transcript': transcript
+        }
+        if subtitle:
+            result['subtitle'] = subtitle
+        return result
+
+    def reprocess(self, video_id: str, processor: Optional[SubtitleProcessor] = None, **process_kwargs) -> str:
+        """
+        보관된 원본으로 scrap_result.json을 다시 만들어 업로드 (YouTube 요청 없음)
+
+        Args:
+            video_id: YouTube video ID
+            processor: 사용할 SubtitleProcessor (None이면 생성)
+            **process_kwargs: SubtitleProcessor.process()에 넘길 옵션 (overlap 등)
+
+        Returns:
+            업로드한 S3 키
+        """
+        processor = processor or SubtitleProcessor()
+        data = self.load(video_id)
+        transcript = processor.process(data['vtt_text'], **process_kwargs)
+        subtitle = {'lang': data['lang'], 'kind': data.get('kind')}
+        result = self.build_result(processor, data['video_info'], data['pinned_comment'], transcript, subtitle)
+        return self.put_result(video_id, result)
@@ -0,0 +1,92 @@
+"""
+처리 상태 인덱스 모듈
+이미 처리한 (video ID, 언어) 쌍을 로컬 SQLite 파일에 기록해 재생목록/채널을 다시 훑을 때
+새 영상이나 오래된 영상만 fetch_all_in_one으로 조회하게 합니다.
+"""
+
+import time
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+
+class StateIndex:
+    """(video_id, lang) 단위 처리 기록 (SQLite)"""
+
+    # IN (...) 조회 한 번에 넣을 최대 ID 수 (SQLite 변수 개수 제한 이하)
+    QUERY_CHUNK = 500
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+        """
+        self.path = path
+        # 병렬 처리(-j) 작업자 스레드가 같은 연결을 쓰므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS processed ('
+                ' video_id TEXT NOT NULL,'
+                ' lang TEXT NOT NULL,'
+                ' processed_at REAL NOT NULL,'
+                ' PRIMARY KEY (video_id, lang))'
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def processed_ids(self, video_ids: Iterable[str], lang: str, max_age: Optional[float] = None) -> set:
+        """
+        video_ids 중 lang으로 처리한 기록이 있는 ID 집합
+
+        Args:
+            max_age: 지정하면 이 시간(초)보다 오래된 기록은 처리하지 않은 것으로 봄
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        since = time.time() - max_age if max_age is not None else None
+        found = set()
+        with self._lock:
+            for start in range(0, len(video_ids), self.QUERY_CHUNK):
+                chunk = video_ids[start:start + self.QUERY_CHUNK]
+                query = (f"SELECT video_id FROM processed WHERE lang = ? "
+                         f"AND video_id IN ({','.join('?' * len(chunk))})")
+                params = [lang, *chunk]
+                if since is not None:
+                    query += ' AND processed_at >= ?'
+                    params.append(since)
+                found.update(row[0] for row in self._conn.execute(query, params))
+        return found
+
+    def is_processed(self, video_id: str, lang: str, max_age: Optional[float] = None) -> bool:
+        return video_id in self.processed_ids([video_id], lang, max_age)
+
+    def filter_new(self, video_ids: List[str], lang: str, max_age: Optional[float] = None) -> List[str]:
+        """처리 기록이 없거나 max_age보다 오래된 ID만 입력 순서대로 반환"""
+        processed = self.processed_ids(video_ids, lang, max_age)
+        return [video_id for video_id in video_ids if video_id not in processed]
+
+    def mark(self, video_id: str, lang: str):
+        """처리 완료 기록 (이미 있으면 처리 시각 갱신)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO processed (video_id, lang, processed_at) VALUES (?, ?, ?)',
+                (video_id, lang, time.time())
+            )
+
+    def stats(self) -> Dict:
+        """기록된 (video_id, lang) 쌍과 영상 수"""
+        with self._lock:
+            pairs, videos = self._conn.execute(
+                'SELECT COUNT(*), COUNT(DISTINCT video_id) FROM processed'
+            ).fetchone()
+        return {'pairs': pairs, 'videos': videos}
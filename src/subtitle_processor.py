@@ -3,14 +3,24 @@ YouTube 자막 처리 모듈
 VTT 형식의 자막을 파싱하고 정리합니다.
 """
 
+import io
 import re
-from typing import List, Dict, Optional
+import time
+from collections import deque
+from typing import List, Dict, Optional, Union, Iterable, Iterator, TextIO, Tuple
+from .cue_store import CueStore
+from .cue_writers import write_cues as _write_cues
+
+# 스트리밍 API 입력: VTT 문자열/바이트, 파일 객체, 또는 줄 단위 이터러블
+VttSource = Union[str, bytes, Iterable[str], Iterable[bytes]]
 
 
 class SubtitleProcessor:
     """YouTube VTT 자막을 처리하는 클래스"""
     
     TIME_REGEX = re.compile(r'^(\d{2}:\d{2}:\d{2}\.\d{3}) -->')
+    # TIME_REGEX와 같은 줄에 매칭되면서 종료 시각도 함께 읽는 버전
+    CUE_TIMING_REGEX = re.compile(r'^(\d{2}:\d{2}:\d{2}\.\d{3}) -->(?:\s*(\d{2}:\d{2}:\d{2}\.\d{3}))?')
     VTT_TAG_REGEX = re.compile(r'<[^>]*>')
     URL_REGEX = re.compile(r'https?://\S+')
     MUSIC_TAG_REGEX = re.compile(r'\(.*?\)') # [음악], [웃음] 등 제거
@@ -20,6 +30,26 @@ class SubtitleProcessor:
         r'\U0001F680-\U0001F6FF\U0001F910-\U0001F96B\U0001F980-\U0001F9E0]',
         flags=re.UNICODE
     )
+
+    # clean_text를 한 번의 스캔으로 처리하기 위한 패턴
+    # EMOJI_CLASS는 EMOJI_REGEX와 같은 문자 집합에서 겹치거나 이어지는 구간을 합친 것입니다.
+    EMOJI_CLASS = r'[\u2600-\u27BF\U0001F000-\U0001F02F\U0001F0A0-\U0001F9FF]'
+    FAST_EMOJI_REGEX = re.compile(EMOJI_CLASS)
+    FUSED_CLEAN_REGEX = re.compile(r'https?://\S+|\(.*?\)|' + EMOJI_CLASS)
+    # 여러 줄을 '\n'으로 이어 한 번에 처리할 때 태그가 줄을 넘어 매칭되지 않도록 한 버전
+    LINE_TAG_REGEX = re.compile(r'<[^>\n]*>')
+    # parse_vtt가 한 번에 정리할 자막 줄 수
+    CLEAN_BATCH_SIZE = 512
+
+    # 롤링 오버랩 제거 방식
+    # prefix: 이전 텍스트 전체가 현재 텍스트의 앞부분일 때만 제거 (기존 방식)
+    # partial: 이전 큐의 끝부분과 현재 큐의 앞부분이 min_overlap자 이상 겹치면 겹친 부분 제거
+    OVERLAP_MODES = ('prefix', 'partial')
+    MIN_OVERLAP_CHARS = 10
+
+    # 반복 줄 제거: 정규화(소문자, 문자·숫자만)한 길이가 이보다 짧은 줄은 비교하지 않음 ('네', 'ok' 같은 맞장구 보존)
+    DEDUP_MIN_CHARS = 4
+    DEDUP_NORMALIZE_REGEX = re.compile(r'[\W_]+')
     
     @staticmethod
     def simplify_timestamp(timestamp: str) -> str:
@@ -39,34 +69,113 @@ class SubtitleProcessor:
         """VTT 태그 제거 (예: <c>, <v> 등)"""
         return SubtitleProcessor.VTT_TAG_REGEX.sub('', text).strip()
     
+    @staticmethod
+    def _remove_urls_music_emoji(text: str) -> str:
+        """
+        VTT 태그가 제거된 텍스트에서 URL, 음악 태그, 이모지를 한 번의 스캔으로 제거
+
+        URL 정규식(\\S+)이 괄호까지 삼키면 URL 제거 결과에 따라 음악 태그 매칭이 달라지므로,
+        URL과 괄호가 함께 있을 때만 기존처럼 순서대로 처리해 결과를 동일하게 유지합니다.
+        """
+        has_url = 'http' in text
+        has_paren = '(' in text
+        if has_url and (has_paren or ')' in text):
+            text = SubtitleProcessor.URL_REGEX.sub('', text)
+            text = SubtitleProcessor.MUSIC_TAG_REGEX.sub('', text)
+            return SubtitleProcessor.FAST_EMOJI_REGEX.sub('', text)
+        if has_url or has_paren:
+            return SubtitleProcessor.FUSED_CLEAN_REGEX.sub('', text)
+        # URL과 음악 태그가 없으면 이모지만 확인 (ASCII 텍스트에는 이모지가 없음)
+        if text.isascii():
+            return text
+        return SubtitleProcessor.FAST_EMOJI_REGEX.sub('', text)
+
     @staticmethod
     def clean_text(text: str) -> str:
         """불필요한 요소(VTT 태그, URL, 음악 태그, 이모지)를 제거합니다."""
-        text = SubtitleProcessor.VTT_TAG_REGEX.sub('', text)
-        text = SubtitleProcessor.URL_REGEX.sub('', text)
-        text = SubtitleProcessor.MUSIC_TAG_REGEX.sub('', text)
-        text = SubtitleProcessor.EMOJI_REGEX.sub('', text)
-        return text.strip()
+        # 태그 제거가 URL/괄호를 새로 이어 붙일 수 있으므로 태그만 먼저 제거
+        if '<' in text:
+            text = SubtitleProcessor.VTT_TAG_REGEX.sub('', text)
+        return SubtitleProcessor._remove_urls_music_emoji(text).strip()
+
+    @staticmethod
+    def clean_lines(lines: List[str]) -> List[str]:
+        """
+        여러 줄을 한 번에 정리 (각 줄에 clean_text를 적용한 것과 같은 결과)
+        줄을 '\n'으로 이어 붙여 정규식 호출 횟수를 줄 수와 무관하게 만듭니다.
+        """
+        if not lines:
+            return []
+
+        joined = '\n'.join(lines)
+        if joined.count('\n') != len(lines) - 1:
+            # 줄 안에 개행이 있으면 줄 경계를 구분할 수 없으므로 한 줄씩 처리
+            return [SubtitleProcessor.clean_text(line) for line in lines]
+
+        if '<' in joined:
+            joined = SubtitleProcessor.LINE_TAG_REGEX.sub('', joined)
+        joined = SubtitleProcessor._remove_urls_music_emoji(joined)
+        return [line.strip() for line in joined.split('\n')]
     
-    def parse_vtt(self, vtt_text: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def iter_lines(source: VttSource) -> Iterator[str]:
         """
-        VTT 텍스트를 파싱하여 타임스탬프와 텍스트 블록으로 변환
-        
+        다양한 입력을 한 줄씩 꺼내는 이터레이터로 변환
+
         Args:
-            vtt_text: VTT 형식의 자막 텍스트
-            
-        Returns:
-            [{'time': '01:23', 'text': '자막 내용'}, ...]
+            source: VTT 문자열/바이트, 텍스트/바이너리 파일 객체, 또는 줄 단위 이터러블
         """
-        if not vtt_text or not vtt_text.strip():
-            return []
-        
-        lines = vtt_text.split('\n')
-        time_blocks = []
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+        if isinstance(source, str):
+            # split('\n')과 같은 기준으로 줄을 나누되 전체 리스트를 만들지 않음
+            return iter(io.StringIO(source))
+        return (line.decode('utf-8') if isinstance(line, bytes) else line for line in source)
+
+    def iter_blocks(self, source: VttSource) -> Iterator[Dict[str, str]]:
+        """
+        VTT를 한 줄씩 읽으며 타임스탬프와 텍스트 블록을 하나씩 생성 (parse_vtt의 스트리밍 버전)
+
+        Args:
+            source: VTT 문자열/바이트, 파일 객체, 또는 줄 단위 이터러블
+
+        Yields:
+            {'time': '01:23', 'text': '자막 내용'}
+        """
+        for match, text in self._iter_timed_texts(source):
+            yield {
+                'time': self.simplify_timestamp(match.group(1)),
+                'text': text
+            }
+
+    def iter_cue_tuples(self, source: VttSource) -> Iterator[Tuple[int, int, str]]:
+        """
+        iter_blocks와 같은 블록을 (시작 ms, 종료 ms, 텍스트) 튜플로 생성
+        시·밀리초를 버리지 않으므로 한 시간 넘는 영상에서도 시각이 모호하지 않습니다.
+        """
+        parse_timestamp = CueStore.parse_timestamp
+        for match, text in self._iter_timed_texts(source):
+            start_ms = parse_timestamp(match.group(1))
+            end = match.group(2)
+            yield start_ms, parse_timestamp(end) if end else start_ms, text
+
+    def _iter_timed_texts(self, source: VttSource) -> Iterator[Tuple[re.Match, str]]:
+        """(타임스탬프 줄 매치, 정리된 텍스트) 쌍을 생성 (내용이 남은 블록만)"""
+        # 블록마다 마지막 텍스트 줄만 결과에 쓰이므로 그 줄만 모아 두었다가 묶어서 정리
+        pending = []
+        for item in self._iter_raw_cue_lines(source):
+            pending.append(item)
+            if len(pending) >= self.CLEAN_BATCH_SIZE:
+                yield from self._clean_pending(pending)
+                pending = []
+        yield from self._clean_pending(pending)
+
+    def _iter_raw_cue_lines(self, source: VttSource) -> Iterator[Tuple[re.Match, str]]:
+        """(타임스탬프 줄 매치, 블록의 마지막 텍스트 줄) 쌍을 정리 전 상태로 생성"""
         current_time = None
-        current_text = ''
-        
-        for raw_line in lines:
+        current_line = None
+
+        for raw_line in self.iter_lines(source):
             line = raw_line.strip()
             
             # 헤더 라인 스킵
@@ -77,65 +186,391 @@ class SubtitleProcessor:
                 continue
             
             # 타임스탬프 라인 감지
-            match = self.TIME_REGEX.match(line)
+            match = self.CUE_TIMING_REGEX.match(line)
             if match:
-                if current_time is not None and current_text:
-                    time_blocks.append({
-                        'time': current_time,
-                        'text': current_text
-                    })
-                current_time = self.simplify_timestamp(match.group(1))
-                current_text = ''
+                if current_time is not None and current_line is not None:
+                    yield current_time, current_line
+                current_time = match
+                current_line = None
             else:
-                # 텍스트 라인 처리
-                clean_text = self.clean_text(line)
-                current_text = clean_text
+                # 텍스트 라인 처리 (같은 블록의 이전 줄은 덮어씀)
+                current_line = line
         
         # 마지막 블록 추가
-        if current_time is not None and current_text:
-            time_blocks.append({
-                'time': current_time,
-                'text': current_text
-            })
+        if current_time is not None and current_line is not None:
+            yield current_time, current_line
+
+    def _clean_pending(self, pending: List[tuple]) -> Iterator[Tuple[re.Match, str]]:
+        """(타임스탬프 매치, 원본 줄) 목록을 한 번에 정리하고 내용이 남은 블록만 생성"""
+        texts = self.clean_lines([line for _, line in pending])
+        for (match, _), text in zip(pending, texts):
+            if text:
+                yield match, text
+
+    def parse_vtt(self, vtt_text: Union[str, bytes], as_store: bool = False) -> Union[List[Dict[str, str]], CueStore]:
+        """
+        VTT 텍스트를 파싱하여 타임스탬프와 텍스트 블록으로 변환
         
-        return time_blocks
-    
-    def remove_rolling_overlap(self, blocks: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        Args:
+            vtt_text: VTT 형식의 자막 텍스트 (메모리로 받은 UTF-8 바이트도 허용)
+            as_store: True면 밀리초 시각을 보존하는 CueStore로 반환
+            
+        Returns:
+            [{'time': '01:23', 'text': '자막 내용'}, ...] 또는 CueStore
+        """
+        if not vtt_text or not vtt_text.strip():
+            return CueStore() if as_store else []
+
+        if as_store:
+            return CueStore(self.iter_cue_tuples(vtt_text))
+        return list(self.iter_blocks(vtt_text))
+
+    @staticmethod
+    def find_overlap(prev: str, curr: str, min_overlap: int = 1) -> int:
+        """
+        prev의 끝부분과 curr의 앞부분이 겹치는 가장 긴 길이를 선형 시간(KMP)에 계산
+        겹친 구간은 단어 경계에서 시작하고 끝나야 하며, min_overlap자보다 짧으면 0을 반환합니다.
+
+        예: prev='오늘은 정말 맛있는 음식을', curr='맛있는 음식을 먹어 볼게요' -> 7 ('맛있는 음식을')
+        """
+        if not prev or not curr:
+            return 0
+        min_overlap = max(min_overlap, 1)
+        tail = prev[-len(curr):]
+        if len(tail) < min_overlap or curr[:min_overlap] not in tail:
+            # 최소 길이만큼의 앞부분조차 없으면 겹칠 수 없음 (대부분의 큐가 여기서 끝남)
+            return 0
+
+        # curr의 접두사 함수 (failure function)
+        n = len(curr)
+        pi = [0] * n
+        k = 0
+        for i in range(1, n):
+            while k and curr[i] != curr[k]:
+                k = pi[k - 1]
+            if curr[i] == curr[k]:
+                k += 1
+            pi[i] = k
+
+        # tail을 훑으며 끝에서 일치하는 curr 접두사 길이 계산
+        j = 0
+        for ch in tail:
+            while j and (j == n or ch != curr[j]):
+                j = pi[j - 1]
+            if ch == curr[j]:
+                j += 1
+
+        # 단어 경계를 만족하는 가장 긴 겹침을 접두사 함수 체인으로 탐색
+        while j >= min_overlap:
+            before = len(prev) - j - 1
+            if (before < 0 or prev[before].isspace()) and (j == n or curr[j].isspace()):
+                return j
+            j = pi[j - 1]
+        return 0
+
+    def iter_remove_rolling_overlap(self, blocks: Iterable[Dict[str, str]], mode: str = 'prefix',
+                                    min_overlap: int = MIN_OVERLAP_CHARS) -> Iterator[Dict[str, str]]:
+        """
+        롤링 오버랩 제거 (remove_rolling_overlap의 스트리밍 버전)
+        직전 블록 하나만 기억하므로 입력 길이와 무관하게 메모리 사용량이 일정합니다.
+
+        Args:
+            blocks: 자막 블록 이터러블
+            mode: 'prefix'(기존 방식) 또는 'partial'(부분 겹침까지 제거)
+            min_overlap: partial 모드에서 제거할 최소 겹침 길이(문자 수)
+        """
+        texts = ((block, block['text']) for block in blocks)
+        for curr, text in self._iter_rolling_texts(texts, mode, min_overlap):
+            if text is curr['text']:
+                yield curr
+            else:
+                yield {
+                    'time': curr['time'],
+                    'text': text
+                }
+
+    @classmethod
+    def _iter_rolling_texts(cls, items: Iterable[tuple], mode: str = 'prefix',
+                            min_overlap: int = MIN_OVERLAP_CHARS) -> Iterator[tuple]:
+        """
+        (키, 텍스트) 쌍에서 롤링 오버랩을 제거한 (키, 텍스트)를 생성
+        블록 dict와 CueStore가 같은 규칙을 공유하기 위한 공통 루프입니다.
+        """
+        if mode == 'partial':
+            return cls._iter_partial_overlap_texts(items, min_overlap)
+        if mode != 'prefix':
+            raise ValueError(f"지원하지 않는 오버랩 제거 방식: {mode} (지원: {', '.join(cls.OVERLAP_MODES)})")
+        return cls._iter_prefix_overlap_texts(items)
+
+    @staticmethod
+    def _iter_prefix_overlap_texts(items: Iterable[tuple]) -> Iterator[tuple]:
+        """prefix 모드: 직전에 내보낸 텍스트가 현재 텍스트의 앞부분이면 제거"""
+        prev_text = None
+
+        for key, text in items:
+            if prev_text is not None and text.startswith(prev_text):
+                # 중복 부분 제거
+                text = text[len(prev_text):].strip()
+                if not text:
+                    continue
+
+            prev_text = text
+            # 빈 텍스트 제거
+            if text.strip():
+                yield key, text
+
+    @classmethod
+    def _iter_partial_overlap_texts(cls, items: Iterable[tuple], min_overlap: int) -> Iterator[tuple]:
+        """
+        partial 모드: 직전 큐의 원래 텍스트와 비교해 앞부분 포함 또는 부분 겹침을 제거
+        잘라낸 결과가 아니라 원래 텍스트와 비교하므로 세 개 이상 이어지는 롤링 큐도 모두 정리됩니다.
+        """
+        prev_text = None
+
+        for key, text in items:
+            original = text
+            if prev_text is not None:
+                if text.startswith(prev_text):
+                    text = text[len(prev_text):].strip()
+                else:
+                    overlap = cls.find_overlap(prev_text, text, min_overlap)
+                    if overlap:
+                        text = text[overlap:].strip()
+
+            prev_text = original
+            if text.strip():
+                yield key, text
+
+    @classmethod
+    def _iter_dedup_texts(cls, items: Iterable[tuple], window: int, stats: Optional[Dict] = None) -> Iterator[tuple]:
+        """
+        (키, 텍스트) 쌍에서 최근에 내보낸 window개 줄 안에 이미 나온 줄을 제거
+        자동 자막이 다른 큐 하나를 사이에 두고 같은 줄을 다시 내보내는 경우처럼 직전 큐 비교로는 못 잡는 반복을 지웁니다.
+        정규화한 줄의 해시만 deque와 set으로 들고 있어 큐마다 O(1)이고 메모리는 window에 비례합니다.
+
+        Args:
+            window: 비교할 최근 줄 수
+            stats: 넘기면 'dedup_removed'에 제거한 줄 수를 기록 (스트리밍이면 소비한 만큼 갱신)
+        """
+        recent = deque()
+        seen = set()
+        if stats is not None:
+            stats['dedup_removed'] = 0
+
+        for key, text in items:
+            normalized = cls.DEDUP_NORMALIZE_REGEX.sub('', text.casefold())
+            if len(normalized) >= cls.DEDUP_MIN_CHARS:
+                digest = hash(normalized)
+                if digest in seen:
+                    if stats is not None:
+                        stats['dedup_removed'] += 1
+                    continue
+                # 제거한 줄은 넣지 않으므로 window 안의 해시는 모두 서로 다름
+                recent.append(digest)
+                seen.add(digest)
+                if len(recent) > window:
+                    seen.discard(recent.popleft())
+            yield key, text
+
+    @classmethod
+    def _iter_clean_texts(cls, items: Iterable[tuple], mode: str = 'prefix', min_overlap: int = MIN_OVERLAP_CHARS,
+                          dedup_window: int = 0, stats: Optional[Dict] = None) -> Iterator[tuple]:
+        """롤링 오버랩 제거 뒤 dedup_window가 있으면 반복 줄 제거까지 적용"""
+        texts = cls._iter_rolling_texts(items, mode, min_overlap)
+        if dedup_window > 0:
+            texts = cls._iter_dedup_texts(texts, dedup_window, stats)
+        elif stats is not None:
+            stats['dedup_removed'] = 0
+        return texts
+
+    def remove_repeated_lines(self, blocks: Union[List[Dict[str, str]], CueStore], window: int = 8,
+                              stats: Optional[Dict] = None) -> Union[List[Dict[str, str]], CueStore]:
+        """
+        최근 window개 블록 안에서 이미 나온 줄을 제거 (remove_rolling_overlap 다음 단계)
+        CueStore를 넘기면 남은 큐의 시각 열을 그대로 가져온 CueStore를 반환합니다.
+
+        Args:
+            window: 비교할 최근 블록 수
+            stats: 넘기면 'dedup_removed'에 제거한 블록 수를 기록
+        """
+        if isinstance(blocks, CueStore):
+            starts, ends = blocks.starts, blocks.ends
+            return CueStore(
+                (starts[i], ends[i], text)
+                for i, text in self._iter_dedup_texts(enumerate(blocks.texts), window, stats)
+            )
+        return [block for block, _ in self._iter_dedup_texts(((block, block['text']) for block in blocks),
+                                                              window, stats)]
+
+    def remove_rolling_overlap(self, blocks: Union[List[Dict[str, str]], CueStore], mode: str = 'prefix',
+                               min_overlap: int = MIN_OVERLAP_CHARS) -> Union[List[Dict[str, str]], CueStore]:
         """
         롤링 오버랩 제거
         이전 텍스트가 현재 텍스트의 시작 부분에 포함되어 있으면 중복 제거
+        mode='partial'이면 이전 큐의 끝부분과 현재 큐의 앞부분이 겹치는 경우도 제거합니다.
+        CueStore를 넘기면 시각 열을 그대로 가져온 CueStore를 반환합니다.
         """
-        if not blocks:
-            return []
-        
-        final_blocks = [blocks[0]]
-        
-        for i in range(1, len(blocks)):
-            prev = final_blocks[-1]
-            curr = blocks[i]
-            
-            if curr['text'].startswith(prev['text']):
-                # 중복 부분 제거
-                diff = curr['text'][len(prev['text']):].strip()
-                if diff:
-                    final_blocks.append({
-                        'time': curr['time'],
-                        'text': diff
-                    })
+        if isinstance(blocks, CueStore):
+            starts, ends = blocks.starts, blocks.ends
+            return CueStore(
+                (starts[i], ends[i], text)
+                for i, text in self._iter_rolling_texts(enumerate(blocks.texts), mode, min_overlap)
+            )
+        return list(self.iter_remove_rolling_overlap(blocks, mode, min_overlap))
+
+    def iter_cues(self, source: VttSource, overlap: str = 'prefix', min_overlap: int = MIN_OVERLAP_CHARS,
+                  dedup_window: int = 0, stats: Optional[Dict] = None) -> Iterator[Dict[str, str]]:
+        """
+        VTT를 스트리밍으로 파싱하고 정리·롤링 오버랩 제거까지 마친 블록을 하나씩 생성
+        수 시간 분량의 라이브 자막도 파일 객체로 넘기면 일정한 메모리로 처리됩니다.
+
+        Args:
+            source: VTT 문자열/바이트, 파일 객체, 또는 줄 단위 이터러블
+            overlap: 롤링 오버랩 제거 방식 ('prefix' 또는 'partial')
+            min_overlap: partial 모드의 최소 겹침 길이(문자 수)
+            dedup_window: 0보다 크면 최근 이 개수의 줄 안에서 반복된 줄 제거
+            stats: 넘기면 'dedup_removed'에 제거한 줄 수를 기록
+
+        Yields:
+            {'time': '01:23', 'text': '자막 내용'}
+        """
+        if overlap not in self.OVERLAP_MODES:
+            raise ValueError(f"지원하지 않는 오버랩 제거 방식: {overlap} (지원: {', '.join(self.OVERLAP_MODES)})")
+        cues = self.iter_remove_rolling_overlap(self.iter_blocks(source), overlap, min_overlap)
+        if dedup_window > 0:
+            cues = (block for block, _ in self._iter_dedup_texts(((block, block['text']) for block in cues),
+                                                                  dedup_window, stats))
+        elif stats is not None:
+            stats['dedup_removed'] = 0
+        return cues
+
+    def iter_timed_cues(self, source: VttSource, overlap: str = 'prefix', min_overlap: int = MIN_OVERLAP_CHARS,
+                        dedup_window: int = 0, stats: Optional[Dict] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        iter_cues와 같은 블록을 (시작 ms, 종료 ms, 텍스트) 튜플로 생성 (검색 색인 등 정확한 시각이 필요할 때)
+
+        Args:
+            source: VTT 문자열/바이트, 파일 객체, 또는 줄 단위 이터러블
+            overlap: 롤링 오버랩 제거 방식 ('prefix' 또는 'partial')
+            min_overlap: partial 모드의 최소 겹침 길이(문자 수)
+            dedup_window, stats: iter_cues와 같음
+        """
+        items = (((start_ms, end_ms), text) for start_ms, end_ms, text in self.iter_cue_tuples(source))
+        for (start_ms, end_ms), text in self._iter_clean_texts(items, overlap, min_overlap, dedup_window, stats):
+            yield start_ms, end_ms, text
+
+    @staticmethod
+    def iter_merge_cues(cues: Iterable[Tuple[int, int, str]], window_ms: Optional[int] = None,
+                        max_chars: Optional[int] = None,
+                        max_count: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        (시작 ms, 종료 ms, 텍스트) 큐를 한 번 훑으며 이어 붙여 병합
+        지정한 조건 중 하나라도 넘기 직전까지 묶고, 병합한 큐는 첫 큐의 시작~가장 늦은 종료 시각을 갖습니다.
+        조건을 하나도 주지 않으면 큐를 하나씩(공백만 정리해) 내보냅니다.
+
+        Args:
+            cues: iter_timed_cues 결과 등 시작 시각 순서의 큐
+            window_ms: 묶음의 첫 큐부터 이 시간(ms) 안에 시작하는 큐만 같은 묶음에 넣음
+            max_chars: 묶음 텍스트의 최대 글자 수 (큐 하나가 더 길면 그 큐만 단독으로 나감)
+            max_count: 묶음의 최대 큐 수 (기존 merge_count와 같은 고정 개수 병합)
+        """
+        if window_ms is None and max_chars is None and max_count is None:
+            max_count = 1
+
+        parts: List[str] = []
+        group_start = group_end = 0
+        chars = 0
+        for start_ms, end_ms, text in cues:
+            text = ' '.join(text.split())
+            if not text:
+                continue
+            if parts and ((window_ms is not None and start_ms - group_start >= window_ms) or
+                          (max_chars is not None and chars + 1 + len(text) > max_chars) or
+                          (max_count is not None and len(parts) >= max_count)):
+                yield group_start, group_end, ' '.join(parts)
+                parts = []
+            if not parts:
+                group_start, group_end, chars = start_ms, end_ms, len(text)
             else:
-                final_blocks.append(curr)
-        
-        # 빈 텍스트 제거
-        return [b for b in final_blocks if b['text'].strip()]
+                group_end = max(group_end, end_ms)
+                chars += 1 + len(text)
+            parts.append(text)
+
+        if parts:
+            yield group_start, group_end, ' '.join(parts)
+
+    def write_cues(self, source: VttSource, fp: TextIO, output_format: str = 'srt', overlap: str = 'prefix',
+                   min_overlap: int = MIN_OVERLAP_CHARS, window_ms: Optional[int] = None,
+                   max_chars: Optional[int] = None, max_count: Optional[int] = None,
+                   lang: Optional[str] = None, fields: Optional[Dict] = None, dedup_window: int = 0,
+                   stats: Optional[Dict] = None) -> int:
+        """
+        VTT를 파싱·정리·롤링 오버랩 제거·병합까지 한 번에 흘려 보내며 시각이 있는 형식으로 씀
+        (src.cue_writers의 SRT/WebVTT/JSONL 작성기 사용)
+
+        Args:
+            source: VTT 문자열/바이트, 파일 객체, 또는 줄 단위 이터러블
+            fp: 결과를 쓸 텍스트 파일 객체
+            output_format: 'srt', 'vtt', 'jsonl'
+            overlap, min_overlap: iter_timed_cues와 같음
+            window_ms, max_chars, max_count: iter_merge_cues의 병합 조건
+            lang: VTT 헤더의 Language 값
+            fields: JSONL 줄마다 붙일 필드 (예: video_id)
+            dedup_window, stats: iter_cues와 같음
+
+        Returns:
+            기록한 (병합된) 큐 수
+        """
+        cues = self.iter_merge_cues(self.iter_timed_cues(source, overlap, min_overlap, dedup_window, stats),
+                                    window_ms, max_chars, max_count)
+        return _write_cues(output_format, cues, fp, lang=lang, fields=fields)
+
+    def write_transcript(self, source: VttSource, fp: TextIO, overlap: str = 'prefix',
+                         min_overlap: int = MIN_OVERLAP_CHARS, dedup_window: int = 0,
+                         stats: Optional[Dict] = None) -> int:
+        """
+        process()와 같은 결과를 한 번에 만들지 않고 파일 객체에 이어서 씁니다.
+
+        Args:
+            source: VTT 문자열/바이트, 파일 객체, 또는 줄 단위 이터러블
+            fp: 결과를 쓸 텍스트 파일 객체
+            overlap: 롤링 오버랩 제거 방식 ('prefix' 또는 'partial')
+            min_overlap: partial 모드의 최소 겹침 길이(문자 수)
+            dedup_window, stats: iter_cues와 같음
+
+        Returns:
+            기록한 문자 수 (0이면 process()가 None을 반환하는 경우)
+        """
+        written = 0
+        for cue in self.iter_cues(source, overlap, min_overlap, dedup_window, stats):
+            chunk = ' '.join(cue['text'].split())
+            if not chunk:
+                continue
+            if written:
+                fp.write(' ')
+                written += 1
+            fp.write(chunk)
+            written += len(chunk)
+        return written
     
-    def merge_blocks(self, blocks: List[Dict[str, str]], group_size: int = 3) -> List[Dict[str, str]]:
+    def merge_blocks(self, blocks: Union[List[Dict[str, str]], CueStore], group_size: int = 3) -> Union[List[Dict[str, str]], CueStore]:
         """
         블록을 지정된 크기로 그룹화하여 병합
         
         Args:
-            blocks: 자막 블록 리스트
+            blocks: 자막 블록 리스트 또는 CueStore
             group_size: 병합할 블록 개수 (기본값: 3)
+
+        Returns:
+            병합된 블록 리스트 (CueStore를 넘기면 첫 큐의 시작~마지막 큐의 종료 시각을 갖는 CueStore)
         """
+        if isinstance(blocks, CueStore):
+            starts, ends, texts = blocks.starts, blocks.ends, blocks.texts
+            return CueStore(
+                (starts[i], ends[min(i + group_size, len(texts)) - 1], ' '.join(texts[i:i + group_size]).strip())
+                for i in range(0, len(texts), group_size)
+            )
+
         merged_blocks = []
         
         for i in range(0, len(blocks), group_size):
@@ -154,32 +589,62 @@ class SubtitleProcessor:
         
         return merged_blocks
     
-    def process(self, vtt_text: str, merge_count: int = 3) -> Optional[str]:
+    def process(self, vtt_text: Union[str, bytes], merge_count: int = 3, overlap: str = 'prefix',
+                min_overlap: int = MIN_OVERLAP_CHARS, timer=None, dedup_window: int = 0,
+                stats: Optional[Dict] = None) -> Optional[str]:
         """
         VTT 자막을 처리하여 최종 스크립트 문자열로 반환합니다.
         타임스탬프, 중복, 불필요한 태그를 모두 제거합니다.
 
         Args:
-            vtt_text: VTT 형식의 자막 텍스트.
-            merge_count: 텍스트를 부드럽게 연결하기 위해 병합할 블록 수.
+            vtt_text: VTT 형식의 자막 텍스트 (str 또는 UTF-8 bytes).
+            merge_count: 이전 버전과의 호환용 (공백으로 모두 이어 붙이므로 결과에 영향 없음).
+                시각을 유지한 병합은 iter_merge_cues/write_cues를 사용합니다.
+            overlap: 롤링 오버랩 제거 방식. 'partial'이면 이전 큐 끝부분과 겹치는 앞부분도 제거합니다.
+            min_overlap: partial 모드에서 제거할 최소 겹침 길이(문자 수).
+            timer: src.metrics.StageTimer를 넘기면 parse_vtt, cleaning, overlap 단계 시간을 기록합니다.
+            dedup_window: 0보다 크면 롤링 오버랩 제거 뒤 최근 이 개수의 줄 안에서 반복된 줄도 제거합니다.
+            stats: 넘기면 'dedup_removed'에 제거한 반복 줄 수를 기록합니다.
 
         Returns:
             정리된 단일 transcript 문자열 또는 None.
         """
-        # 1. VTT 파싱 (타임스탬프 포함)
-        time_blocks = self.parse_vtt(vtt_text)
-        if not time_blocks:
+        if not vtt_text:
             return None
 
-        # 2. 롤링 오버랩 제거
-        non_overlapping_blocks = self.remove_rolling_overlap(time_blocks)
-        if not non_overlapping_blocks:
-            return None
+        if timer is not None:
+            return self._process_timed(vtt_text, overlap, min_overlap, timer, dedup_window, stats)
+
+        # 1~2. VTT 파싱과 롤링 오버랩·반복 줄 제거 (중간 리스트 없이 스트리밍)
+        cues = self.iter_cues(vtt_text, overlap, min_overlap, dedup_window, stats)
+
+        # 3~4. 모든 텍스트를 하나의 문자열로 병합하면서 불필요한 공백 정리
+        final_transcript = ' '.join(word for cue in cues for word in cue['text'].split())
+
+        return final_transcript if final_transcript else None
+
+    def _process_timed(self, vtt_text: Union[str, bytes], overlap: str, min_overlap: int, timer,
+                       dedup_window: int = 0, stats: Optional[Dict] = None) -> Optional[str]:
+        """
+        process()와 같은 결과를 단계별로 나누어 만들며 각 단계 시간을 timer에 기록
+        스트리밍 경로는 단계가 한 루프에 섞여 있어 따로 잴 수 없으므로 중간 목록을 만듭니다.
+        """
+        if overlap not in self.OVERLAP_MODES:
+            raise ValueError(f"지원하지 않는 오버랩 제거 방식: {overlap} (지원: {', '.join(self.OVERLAP_MODES)})")
+
+        with timer.stage('parse_vtt'):
+            raw_lines = [line for _, line in self._iter_raw_cue_lines(vtt_text)]
+
+        with timer.stage('cleaning'):
+            texts = [text for text in self.clean_lines(raw_lines) if text]
 
-        # 3. 모든 텍스트를 하나의 문자열로 병합
-        full_transcript = ' '.join(block['text'] for block in non_overlapping_blocks)
+        with timer.stage('overlap'):
+            texts = [text for _, text in self._iter_clean_texts(enumerate(texts), overlap, min_overlap,
+                                                                 dedup_window, stats)]
 
-        # 4. 최종적으로 불필요한 공백 정리
-        final_transcript = ' '.join(full_transcript.split())
+        # 공백 병합도 정리 단계에 포함 (한 번의 process 호출을 정리 1회로 셈)
+        join_start = time.perf_counter()
+        final_transcript = ' '.join(word for text in texts for word in text.split())
+        timer.add('cleaning', (time.perf_counter() - join_start) * 1000, count=0)
 
         return final_transcript if final_transcript else None
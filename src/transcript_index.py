@@ -0,0 +1,273 @@
+"""
+자막 전문 검색 색인 모듈
+처리한 자막을 큐 단위로 SQLite FTS5 색인에 넣어 video ID와 시작 시각(ms)까지 검색합니다.
+영상마다 내용 해시를 기록해 바뀐 영상만 다시 색인하고, 여러 영상을 한 트랜잭션으로 묶어 넣을 수 있습니다.
+"""
+
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class TranscriptIndex:
+    """(video_id, lang) 단위 문서와 큐 단위 FTS5 색인"""
+
+    # 공백 기준 토크나이저 (한국어는 '서울*'처럼 접두어 검색으로 조사를 붙인 형태까지 찾음)
+    # 'trigram'을 쓰면 3글자 이상 부분 문자열 검색이 되지만 색인이 3~4배 커집니다.
+    DEFAULT_TOKENIZER = 'unicode61 remove_diacritics 2'
+    # executemany 한 번에 넣을 큐 수
+    INSERT_BATCH = 5000
+
+    def __init__(self, path: str, tokenizer: str = DEFAULT_TOKENIZER):
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+            tokenizer: FTS5 토크나이저 (색인을 처음 만들 때만 적용)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._in_bulk = False
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_id INTEGER PRIMARY KEY,
+                    video_id TEXT NOT NULL,
+                    lang TEXT NOT NULL,
+                    title TEXT,
+                    content_hash TEXT NOT NULL,
+                    cue_count INTEGER NOT NULL,
+                    indexed_at REAL NOT NULL,
+                    UNIQUE (video_id, lang)
+                );
+                CREATE TABLE IF NOT EXISTS cues (
+                    cue_id INTEGER PRIMARY KEY,
+                    doc_id INTEGER NOT NULL,
+                    start_ms INTEGER NOT NULL,
+                    end_ms INTEGER NOT NULL,
+                    text TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS cues_doc ON cues (doc_id);
+                CREATE VIRTUAL TABLE IF NOT EXISTS cues_fts USING fts5(
+                    text, content='cues', content_rowid='cue_id', tokenize='{tokenizer}'
+                );
+            """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """bulk() 안이면 바깥 트랜잭션에 합류, 아니면 호출 하나를 트랜잭션으로 실행"""
+        with self._lock:
+            if self._in_bulk:
+                yield self._conn
+                return
+            self._conn.execute('BEGIN')
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    @contextmanager
+    def bulk(self) -> Iterator['TranscriptIndex']:
+        """
+        여러 영상을 한 트랜잭션으로 색인 (영상마다 커밋하지 않아 대량 색인이 빠름)
+        블록 안에서 예외가 나면 블록 전체가 취소됩니다.
+        """
+        with self._transaction():
+            self._in_bulk = True
+            try:
+                yield self
+            finally:
+                self._in_bulk = False
+
+    @staticmethod
+    def content_hash(cues: List[Tuple[int, int, str]], title: Optional[str]) -> str:
+        digest = hashlib.sha256((title or '').encode('utf-8'))
+        for start_ms, end_ms, text in cues:
+            digest.update(f"\n{start_ms}\t{end_ms}\t{text}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _delete_cues(self, conn: sqlite3.Connection, doc_id: int):
+        # 외부 콘텐츠 FTS 테이블은 지울 행의 원래 텍스트를 알려 줘야 색인에서 빠짐
+        conn.execute(
+            "INSERT INTO cues_fts (cues_fts, rowid, text) SELECT 'delete', cue_id, text FROM cues WHERE doc_id = ?",
+            (doc_id,)
+        )
+        conn.execute('DELETE FROM cues WHERE doc_id = ?', (doc_id,))
+
+    def index_cues(self, video_id: str, lang: str, cues: Iterable[Tuple[int, int, str]],
+                   title: Optional[str] = None) -> int:
+        """
+        영상 하나의 큐를 색인 (같은 video_id/lang의 이전 큐는 교체)
+
+        Args:
+            cues: (시작 ms, 종료 ms, 텍스트) 이터러블 (SubtitleProcessor.iter_timed_cues 결과)
+
+        Returns:
+            색인한 큐 수 (내용이 이전과 같아 건너뛰면 0)
+        """
+        cues = [(int(start_ms), int(end_ms), text) for start_ms, end_ms, text in cues]
+        digest = self.content_hash(cues, title)
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT doc_id, content_hash FROM documents WHERE video_id = ? AND lang = ?', (video_id, lang)
+            ).fetchone()
+            if row and row[1] == digest:
+                return 0
+
+            if row:
+                doc_id = row[0]
+                self._delete_cues(conn, doc_id)
+                conn.execute(
+                    'UPDATE documents SET title = ?, content_hash = ?, cue_count = ?, indexed_at = ? WHERE doc_id = ?',
+                    (title, digest, len(cues), time.time(), doc_id)
+                )
+            else:
+                doc_id = conn.execute(
+                    'INSERT INTO documents (video_id, lang, title, content_hash, cue_count, indexed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (video_id, lang, title, digest, len(cues), time.time())
+                ).lastrowid
+
+            for start in range(0, len(cues), self.INSERT_BATCH):
+                conn.executemany(
+                    'INSERT INTO cues (doc_id, start_ms, end_ms, text) VALUES (?, ?, ?, ?)',
+                    [(doc_id, start_ms, end_ms, text) for start_ms, end_ms, text in cues[start:start + self.INSERT_BATCH]]
+                )
+            conn.execute('INSERT INTO cues_fts (rowid, text) SELECT cue_id, text FROM cues WHERE doc_id = ?', (doc_id,))
+        return len(cues)
+
+    def index_vtt(self, video_id: str, lang: str, vtt_text, processor, title: Optional[str] = None,
+                  overlap: str = 'prefix', min_overlap: Optional[int] = None, dedup_window: int = 0) -> int:
+        """
+        VTT를 SubtitleProcessor로 정리·롤링 오버랩 제거한 큐 단위로 색인
+
+        Args:
+            vtt_text: VTT 문자열/바이트 또는 파일 객체
+            processor: SubtitleProcessor
+            dedup_window: 0보다 크면 최근 이 개수의 큐 안에서 반복된 줄은 색인하지 않음
+        """
+        min_overlap = processor.MIN_OVERLAP_CHARS if min_overlap is None else min_overlap
+        cues = processor.iter_timed_cues(vtt_text, overlap, min_overlap, dedup_window)
+        return self.index_cues(video_id, lang, cues, title)
+
+    def remove(self, video_id: str, lang: Optional[str] = None) -> int:
+        """영상의 색인 삭제 (lang이 없으면 모든 언어), 삭제한 문서 수 반환"""
+        with self._transaction() as conn:
+            query = 'SELECT doc_id FROM documents WHERE video_id = ?'
+            params = [video_id]
+            if lang is not None:
+                query += ' AND lang = ?'
+                params.append(lang)
+            doc_ids = [row[0] for row in conn.execute(query, params)]
+            for doc_id in doc_ids:
+                self._delete_cues(conn, doc_id)
+                conn.execute('DELETE FROM documents WHERE doc_id = ?', (doc_id,))
+        return len(doc_ids)
+
+    @staticmethod
+    def build_query(text: str) -> str:
+        """
+        검색어를 FTS5 쿼리로 변환
+        단어마다 따옴표로 감싸 특수 문자를 그대로 검색하고, 끝에 '*'가 붙은 단어는 접두어 검색으로 둡니다.
+        """
+        terms = []
+        for word in text.split():
+            prefix = word.endswith('*')
+            word = word.rstrip('*').replace('"', '""')
+            if word:
+                terms.append(f'"{word}"*' if prefix else f'"{word}"')
+        if not terms:
+            raise ValueError("검색어가 비어 있습니다.")
+        return ' '.join(terms)
+
+    def search(self, query: str, max_videos: int = 10, hits_per_video: int = 5, lang: Optional[str] = None,
+               raw_query: bool = False) -> List[Dict]:
+        """
+        검색어가 나오는 영상과 시각 검색
+
+        Args:
+            query: 검색어 (raw_query=True면 FTS5 쿼리 문법 그대로)
+            max_videos: 최대 영상 수
+            hits_per_video: 영상마다 보여 줄 최대 큐 수 (관련도 순으로 고른 뒤 시각 순 정렬)
+            lang: 지정하면 이 언어의 자막만 검색
+
+        Returns:
+            [{'video_id', 'lang', 'title', 'matches', 'hits': [{'start_ms', 'end_ms', 'text'}, ...]}, ...]
+            (영상은 가장 관련도가 높은 큐 기준 정렬, 'matches'는 영상 안에서 일치한 전체 큐 수)
+        """
+        match = query if raw_query else self.build_query(query)
+        lang_filter = 'AND d.lang = ?' if lang is not None else ''
+
+        with self._lock:
+            # 1. 영상(문서)별 최고 관련도와 일치 수로 상위 영상 선택
+            top_docs = self._conn.execute(f"""
+                SELECT d.doc_id, d.video_id, d.lang, d.title, MIN(cues_fts.rank) AS best, COUNT(*) AS matches
+                FROM cues_fts
+                JOIN cues c ON c.cue_id = cues_fts.rowid
+                JOIN documents d ON d.doc_id = c.doc_id
+                WHERE cues_fts MATCH ? {lang_filter}
+                GROUP BY d.doc_id
+                ORDER BY best
+                LIMIT ?
+            """, [match] + ([lang] if lang is not None else []) + [max_videos]).fetchall()
+
+            # 2. 영상마다 상위 큐와 하이라이트 (한 영상의 큐는 연속된 cue_id로 들어가므로 rowid 범위로 좁힘)
+            videos = []
+            for doc_id, video_id, video_lang, title, _, matches in top_docs:
+                low, high = self._conn.execute(
+                    'SELECT MIN(cue_id), MAX(cue_id) FROM cues WHERE doc_id = ?', (doc_id,)
+                ).fetchone()
+                hits = self._conn.execute("""
+                    SELECT c.start_ms, c.end_ms, highlight(cues_fts, 0, '[', ']')
+                    FROM cues_fts
+                    JOIN cues c ON c.cue_id = cues_fts.rowid
+                    WHERE cues_fts MATCH ? AND cues_fts.rowid BETWEEN ? AND ? AND c.doc_id = ?
+                    ORDER BY cues_fts.rank
+                    LIMIT ?
+                """, (match, low, high, doc_id, hits_per_video)).fetchall()
+                videos.append({
+                    'video_id': video_id,
+                    'lang': video_lang,
+                    'title': title,
+                    'matches': matches,
+                    'hits': [{'start_ms': start_ms, 'end_ms': end_ms, 'text': text}
+                             for start_ms, end_ms, text in sorted(hits)],
+                })
+        return videos
+
+    def is_indexed(self, video_id: str, lang: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT 1 FROM documents WHERE video_id = ? AND lang = ?', (video_id, lang)
+            ).fetchone() is not None
+
+    def optimize(self):
+        """FTS5 세그먼트 병합 (대량 색인 후 한 번 실행하면 검색이 빨라짐)"""
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO cues_fts (cues_fts) VALUES ('optimize')")
+
+    def stats(self) -> Dict:
+        """문서(영상/언어)·영상·큐 수"""
+        with self._lock:
+            documents, videos, cues = self._conn.execute(
+                'SELECT COUNT(*), COUNT(DISTINCT video_id), COALESCE(SUM(cue_count), 0) FROM documents'
+            ).fetchone()
+        return {'documents': documents, 'videos': videos, 'cues': cues}
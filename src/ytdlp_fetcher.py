@@ -3,18 +3,360 @@ yt-dlp를 사용한 YouTube 자막 다운로드 모듈
 youtube-transcript-api보다 더 강력하고 안정적입니다.
 """
 
+import io
 import re
 import json
-import os
-import tempfile
-from typing import Optional, List, Dict
-import yt_dlp
+import time
+import fnmatch
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, List, Dict, Tuple, Union
+
+from .rate_limiter import AdaptiveRateLimiter
+
+
+def _yt_dlp():
+    """
+    yt_dlp 모듈을 처음 필요할 때 import
+    import에만 200ms 가까이 걸리므로 캐시 적중, 재처리처럼 YouTube를 호출하지 않는 경로의
+    콜드 스타트에서 비용을 치르지 않도록 미룹니다.
+    """
+    import yt_dlp
+    return yt_dlp
+
+
+class _CommentPageLogger:
+    """
+    yt-dlp 로그 메시지를 받아 댓글 API 페이지 요청 횟수를 집계하는 로거
+    logger가 지정되면 yt-dlp의 to_screen 메시지가 모두 debug()로 전달됩니다.
+    댓글은 extract_info 끝부분에서 조회되므로 첫 댓글 페이지 요청 시각을 기록해 두면
+    extract_info 시간을 영상 정보 조회와 댓글 페이지 조회로 나눌 수 있습니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.comment_pages = 0
+        self.comment_started = None
+
+    def debug(self, msg: str):
+        if 'Downloading comment' in msg and 'API JSON' in msg:
+            if self.comment_started is None:
+                self.comment_started = time.perf_counter()
+            self.comment_pages += 1
+
+    def info(self, msg: str):
+        pass
+
+    def warning(self, msg: str):
+        pass
+
+    def error(self, msg: str):
+        pass
+
+
+class YtDlpError(Exception):
+    """
+    yt-dlp 조회 실패 (분류되지 않은 오류, 재시도하지 않음)
+    하위 클래스의 retryable/throttled 속성은 AdaptiveRateLimiter가 재시도와 속도 조절에 사용합니다.
+    """
+
+    kind = 'error'
+    retryable = False
+    throttled = False
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # 서버가 Retry-After로 알려 준 대기 시간(초)
+        self.retry_after = retry_after
+
+
+class YtDlpAuthError(YtDlpError):
+    """쿠키 만료, 로그인 요구 등 인증 문제로 조회에 실패한 경우 (쿠키 갱신 후 다시 시도)"""
+
+    kind = 'auth'
+
+
+class YtDlpBotCheckError(YtDlpAuthError):
+    """
+    봇 확인 요구 ('Sign in to confirm you're not a bot')
+    요청 속도 때문에 생기므로 속도는 낮추지만, 같은 쿠키로는 다시 시도해도 통과하지 못하므로
+    백오프 재시도 대신 인증 오류처럼 쿠키를 갱신해 다시 시도합니다.
+    """
+
+    kind = 'bot_check'
+    throttled = True
+
+
+class YtDlpThrottledError(YtDlpError):
+    """HTTP 429 등 요청이 너무 많아 거부된 경우 (속도를 낮추고 백오프 후 재시도)"""
+
+    kind = 'throttled'
+    retryable = True
+    throttled = True
+
+
+class YtDlpTransientError(YtDlpError):
+    """5xx 응답, 시간 초과, 연결 끊김 등 일시적인 오류 (백오프 후 재시도)"""
+
+    kind = 'transient'
+    retryable = True
+
+
+class YtDlpUnavailableError(YtDlpError):
+    """삭제·비공개·존재하지 않는 영상처럼 다시 시도해도 실패하는 경우 (바로 실패)"""
+
+    kind = 'unavailable'
+
+
+class _YtDlpSession:
+    """
+    풀에 보관되는 YoutubeDL 인스턴스와 부속 자원(로거, 쿠키 저장소)
+    익스트랙터 초기화, HTTP 커넥션 풀, 쿠키 파싱, 플레이어 JS 캐시를 재사용하기 위해
+    호출이 끝나도 닫지 않고 보관합니다.
+
+    기본 익스트랙터 전체(1,800여 개)를 등록하지 않고(auto_init=False) 필요한 YouTube 익스트랙터만 등록합니다.
+    """
+
+    IE_KEY = 'Youtube'
+    # 재생목록/채널 목록용 익스트랙터
+    TAB_IE_KEY = 'YoutubeTab'
+
+    def __init__(self, ydl_opts: Dict, cookies: Optional[str] = None, generation: int = 0,
+                 ie_keys: Tuple[str, ...] = (IE_KEY,)):
+        start = time.perf_counter()
+        self.generation = generation
+        self.logger = _CommentPageLogger()
+        self.uses = 0
+
+        self.ydl = _yt_dlp().YoutubeDL(dict(ydl_opts, logger=self.logger), auto_init=False)
+        for ie_key in ie_keys:
+            self.ydl.get_info_extractor(ie_key)
+        if cookies:
+            # 쿠키 파일 없이 세션의 메모리 쿠키 저장소에 직접 로드
+            # (같은 프로세스의 다른 호출과 파일 경로가 겹치거나 서로 지우는 일이 없음)
+            self.ydl.cookiejar.load(io.StringIO(self.netscape_cookies(cookies)))
+        self.init_ms = (time.perf_counter() - start) * 1000
+
+    @staticmethod
+    def netscape_cookies(cookies: str) -> str:
+        """Netscape 쿠키 파일 헤더 추가"""
+        return (
+            "# Netscape HTTP Cookie File\n"
+            "# http://www.netscape.com/newsref/std/cookie_spec.html\n"
+            "# This is a generated file! Do not edit.\n\n"
+            f"{cookies}"
+        )
+
+    def close(self):
+        """YoutubeDL을 닫습니다."""
+        try:
+            self.ydl.close()
+        except Exception as e:
+            # 폐기하는 세션이므로 정리 중 오류는 무시
+            print(f"⚠️ yt-dlp 세션 종료 중 오류: {e}")
 
 
 class YtDlpFetcher:
     """yt-dlp를 사용하여 YouTube 자막을 가져오는 클래스"""
-    
-    def extract_video_id(self, url: str) -> Optional[str]:
+
+    # 옵션 조합별로 보관할 유휴 YoutubeDL 세션 최대 개수
+    DEFAULT_POOL_SIZE = 4
+
+    # 댓글 조회 모드
+    # - pinned: 인기순 정렬 후 상위 일부만 조회 (고정 댓글은 항상 첫 번째 스레드에 위치)
+    # - all: 모든 댓글 조회 (기존 동작)
+    # - none: 댓글 조회 생략
+    COMMENT_MODES = ('pinned', 'all', 'none')
+    PINNED_COMMENT_LIMIT = 1
+
+    # 쿠키 갱신으로 해결될 수 있는 인증/봇 확인 오류 메시지
+    AUTH_ERROR_MARKERS = (
+        'sign in to confirm',
+        'login required',
+        'cookies are no longer valid',
+        'use --cookies',
+        'http error 401',
+        'http error 403',
+    )
+
+    # 요청이 너무 많아 거부된 경우의 오류 메시지
+    THROTTLE_ERROR_MARKERS = (
+        'http error 429',
+        'too many requests',
+        'rate-limited',
+        'rate limited',
+        # 차단된 IP에 yt-dlp가 내는 메시지 ('Video unavailable. This content isn't available, try again later')
+        "this content isn't available",
+    )
+
+    # 봇 확인 요구 메시지 (AUTH_ERROR_MARKERS의 'sign in to confirm'보다 먼저 판별)
+    BOT_CHECK_ERROR_MARKERS = (
+        'not a bot',
+    )
+
+    # 다시 시도하면 성공할 수 있는 일시적인 오류 메시지
+    TRANSIENT_ERROR_MARKERS = (
+        'http error 500',
+        'http error 502',
+        'http error 503',
+        'http error 504',
+        'timed out',
+        'connection reset',
+        'connection aborted',
+        'remote end closed',
+        'incomplete read',
+        'incompleteread',
+        'temporary failure in name resolution',
+        'connection refused',
+        'network is unreachable',
+    )
+
+    # 다시 시도해도 실패하는 영상/목록 오류 메시지 (이 목록에 없는 DownloadError는 영구 실패로 보지 않음)
+    UNAVAILABLE_ERROR_MARKERS = (
+        'video unavailable',
+        'private video',
+        'has been removed',
+        'account associated with this video has been terminated',
+        'members-only',
+        'join this channel to get access',
+        'not available in your country',
+        'uploader has not made this video available',
+        'does not exist',
+        'http error 404',
+        'is not a valid url',
+        'incomplete youtube id',
+    )
+
+    # 자막 언어 우선순위 항목의 종류 ('ko:translated'처럼 언어 뒤에 붙여 지정)
+    # - manual: 업로더가 올린 자막
+    # - auto: 영상 원래 언어의 자동 생성 자막
+    # - translated: 다른 언어 자막을 자동 번역한 자막
+    SUBTITLE_KINDS = ('manual', 'auto', 'translated')
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        """
+        Args:
+            pool_size: 재사용을 위해 보관할 유휴 YoutubeDL 세션 최대 개수
+            rate_limiter: 프로세스의 모든 조회가 거쳐 갈 속도 제한기 (스로틀링되면 속도를 낮추고 재시도)
+        """
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self._idle_sessions: 'OrderedDict[Tuple, List[_YtDlpSession]]' = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """보관 중인 모든 세션을 닫습니다."""
+        self.reset_sessions()
+
+    def reset_sessions(self):
+        """
+        세션 풀 초기화
+        보관 중인 세션은 즉시 닫고, 사용 중인 세션은 반환될 때 닫힙니다.
+        쿠키 교체나 차단 감지 후 새 세션으로 시작할 때 사용합니다.
+        """
+        with self._lock:
+            self._generation += 1
+            sessions = [s for idle in self._idle_sessions.values() for s in idle]
+            self._idle_sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    @staticmethod
+    def warm_up() -> float:
+        """
+        yt_dlp와 YouTube 익스트랙터 클래스를 미리 import하고 걸린 시간(ms)을 반환
+        (평소에는 첫 세션 생성 시점까지 미뤄집니다.)
+        """
+        start = time.perf_counter()
+        _yt_dlp().extractor.get_info_extractor(_YtDlpSession.IE_KEY)
+        return (time.perf_counter() - start) * 1000
+
+    def pool_stats(self) -> Dict:
+        """세션 풀 상태 (옵션 조합 수, 유휴 세션 수)"""
+        with self._lock:
+            return {
+                'keys': len(self._idle_sessions),
+                'idle_sessions': sum(len(idle) for idle in self._idle_sessions.values()),
+                'pool_size': self.pool_size,
+            }
+
+    @staticmethod
+    def _session_key(auto_generated: bool, cookies: Optional[str], comment_opts: Dict) -> Tuple:
+        """세션 풀 키 생성 (쿠키는 해시로 구분, 자막 언어는 조회 후 고르므로 키에 넣지 않음)"""
+        cookies_digest = hashlib.sha256(cookies.encode('utf-8')).hexdigest() if cookies else None
+        return (auto_generated, cookies_digest, json.dumps(comment_opts, sort_keys=True))
+
+    def _acquire_session(self, key: Tuple, ydl_opts: Dict, cookies: Optional[str],
+                         ie_keys: Tuple[str, ...] = (_YtDlpSession.IE_KEY,)) -> Tuple[_YtDlpSession, bool]:
+        """
+        풀에서 세션을 꺼내거나 새로 생성 (ie_keys는 새로 만들 때 등록할 익스트랙터)
+
+        Returns:
+            (세션, 재사용 여부)
+        """
+        with self._lock:
+            idle = self._idle_sessions.get(key)
+            if idle:
+                session = idle.pop()
+                if not idle:
+                    del self._idle_sessions[key]
+                return session, True
+            generation = self._generation
+
+        return _YtDlpSession(ydl_opts, cookies, generation, ie_keys), False
+
+    def _release_session(self, key: Tuple, session: _YtDlpSession, reusable: bool = True):
+        """세션을 풀에 반환 (풀이 가득 차면 가장 오래 사용하지 않은 세션을 닫음)"""
+        evicted = []
+        with self._lock:
+            if not reusable or session.generation != self._generation or self.pool_size <= 0:
+                evicted.append(session)
+            else:
+                self._idle_sessions.setdefault(key, []).append(session)
+                self._idle_sessions.move_to_end(key)
+
+                while sum(len(idle) for idle in self._idle_sessions.values()) > self.pool_size:
+                    oldest_key = next(iter(self._idle_sessions))
+                    oldest = self._idle_sessions[oldest_key]
+                    evicted.append(oldest.pop(0))
+                    if not oldest:
+                        del self._idle_sessions[oldest_key]
+
+        for stale in evicted:
+            stale.close()
+
+    def _build_ydl_opts(self, auto_generated: bool, comment_opts: Dict) -> Dict:
+        """
+        fetch_all_in_one에서 사용할 yt-dlp 옵션 생성
+        자막 트랙은 extract_info 결과의 subtitles/automatic_captions에서 직접 고르므로
+        subtitleslangs를 지정하지 않습니다 (언어가 달라도 같은 세션을 재사용).
+        """
+        return {
+            'skip_download': True,
+            'writesubtitles': True,
+            'writeautomaticsub': auto_generated,
+            'subtitlesformat': 'vtt',
+            'quiet': True,
+            'no_warnings': True,
+            'user_agent': self.USER_AGENT,
+            **comment_opts,
+        }
+
+    @staticmethod
+    def extract_video_id(url: str) -> Optional[str]:
         """
         YouTube URL에서 video ID 추출
         
@@ -37,119 +379,709 @@ class YtDlpFetcher:
         
         return None
     
-    def fetch_all_in_one(self, video_url: str, lang: str = 'ko', auto_generated: bool = True, cookies: Optional[str] = None) -> Dict:
+    @staticmethod
+    def is_collection_url(url: str) -> bool:
+        """
+        재생목록/채널 URL인지 판별 (영상 ID가 있는 URL은 영상으로 처리)
+
+        지원 형식:
+        - https://www.youtube.com/playlist?list=PLAYLIST_ID
+        - https://www.youtube.com/@HANDLE[/videos|/shorts|/streams]
+        - https://www.youtube.com/channel/CHANNEL_ID, /c/NAME, /user/NAME
+        """
+        if YtDlpFetcher.extract_video_id(url):
+            return False
+        return re.search(r'youtube\.com\/(?:playlist\?(?:.*&)?list=|@|channel\/|c\/|user\/)', url) is not None
+
+    @staticmethod
+    def normalize_collection_url(url: str) -> str:
+        """탭 없는 채널 URL은 동영상 탭으로 (채널 홈은 영상 대신 탭 목록을 돌려줌)"""
+        url = url.strip()
+        if re.search(r'youtube\.com\/(?:@[^/?#]+|(?:channel|c|user)\/[^/?#]+)\/?$', url):
+            return url.rstrip('/') + '/videos'
+        return url
+
+    @classmethod
+    def is_auth_error(cls, error: Exception) -> bool:
+        """쿠키 갱신으로 해결될 수 있는 인증 오류인지 판별"""
+        message = str(error).lower()
+        return any(marker in message for marker in cls.AUTH_ERROR_MARKERS)
+
+    @staticmethod
+    def retry_after_of(error: Exception) -> Optional[float]:
+        """오류에 담긴 HTTP 응답의 Retry-After(초) (yt-dlp DownloadError는 원래 예외까지 확인)"""
+        exc_info = getattr(error, 'exc_info', None)
+        candidates = [error, exc_info[1] if exc_info else None, error.__cause__, error.__context__]
+        for candidate in candidates:
+            if candidate is None:
+                continue
+            response = getattr(candidate, 'response', None)
+            headers = getattr(response, 'headers', None) or getattr(candidate, 'headers', None)
+            value = headers.get('Retry-After') if headers is not None else None
+            if value:
+                try:
+                    return max(float(value), 0.0)
+                except ValueError:
+                    # HTTP 날짜 형식은 무시하고 백오프에 맡김
+                    return None
+        return None
+
+    @classmethod
+    def classify_error(cls, error: Exception, unavailable: str = '영상을 찾을 수 없거나 접근할 수 없습니다',
+                       failure: str = '데이터 조회 실패') -> YtDlpError:
+        """
+        조회 중 난 오류를 재시도 여부에 따라 분류
+
+        UNAVAILABLE_ERROR_MARKERS에 해당하는 메시지만 영구 실패로 봅니다.
+        익스트랙터 오류처럼 분류되지 않는 오류는 YtDlpError로 돌려주어 호출한 쪽에서 실패로 처리하게 합니다
+        (SQS는 다시 보내고, 계속 실패하면 DLQ로 보냄).
+
+        Args:
+            unavailable: 영구 실패 메시지 앞부분
+            failure: 분류되지 않은 오류 메시지 앞부분
+
+        Returns:
+            YtDlpThrottledError, YtDlpBotCheckError, YtDlpAuthError, YtDlpTransientError,
+            YtDlpUnavailableError 또는 YtDlpError
+        """
+        if isinstance(error, YtDlpError):
+            return error
+        message = str(error).lower()
+        if any(marker in message for marker in cls.THROTTLE_ERROR_MARKERS):
+            return YtDlpThrottledError(f"요청이 너무 많아 거부되었습니다: {error}", cls.retry_after_of(error))
+        if any(marker in message for marker in cls.BOT_CHECK_ERROR_MARKERS):
+            return YtDlpBotCheckError(f"봇 확인을 요구합니다: {error}")
+        if cls.is_auth_error(error):
+            return YtDlpAuthError(f"인증이 필요하거나 쿠키가 만료되었습니다: {error}")
+        if isinstance(error, TimeoutError) or any(marker in message for marker in cls.TRANSIENT_ERROR_MARKERS):
+            return YtDlpTransientError(f"일시적인 오류로 조회하지 못했습니다: {error}", cls.retry_after_of(error))
+        if any(marker in message for marker in cls.UNAVAILABLE_ERROR_MARKERS):
+            return YtDlpUnavailableError(f"{unavailable}: {error}")
+        return YtDlpError(f"{failure}: {error}")
+
+    def _rate_controlled(self, url: str, func: Callable[[], Any]) -> Tuple[Any, Dict]:
+        """
+        rate_limiter가 있으면 속도 제한을 지켜 func()를 호출하고 스로틀링/일시적 오류는 백오프 후 재시도
+
+        Returns:
+            (func() 결과, {'retries', 'wait_ms', 'backoff_ms'})
+        """
+        if self.rate_limiter is None:
+            return func(), {'retries': 0, 'wait_ms': 0.0, 'backoff_ms': 0.0}
+        return self.rate_limiter.call(url, func, log=print)
+
+    @classmethod
+    def build_comment_options(cls, comments: str = 'pinned', max_comments: Optional[int] = None) -> Dict:
+        """
+        댓글 조회 모드에 맞는 yt-dlp 옵션 생성
+
+        Args:
+            comments: 댓글 조회 모드 ('pinned', 'all', 'none')
+            max_comments: 조회할 최대 댓글 스레드 수 (None이면 모드 기본값)
+        """
+        if comments not in cls.COMMENT_MODES:
+            raise ValueError(f"지원하지 않는 댓글 조회 모드입니다: {comments}")
+
+        if comments == 'none':
+            return {'getcomments': False}
+
+        if comments == 'pinned' and max_comments is None:
+            max_comments = cls.PINNED_COMMENT_LIMIT
+
+        if max_comments is None:
+            return {'getcomments': True}
+
+        # max_comments = [전체, 최상위 스레드, 답글, 스레드당 답글, 깊이]
+        # 고정 댓글 판별에는 답글이 필요 없으므로 최상위 댓글만 가져옵니다.
+        limit = str(max(int(max_comments), 1))
+        return {
+            'getcomments': True,
+            'extractor_args': {
+                'youtube': {
+                    'comment_sort': ['top'],
+                    'max_comments': [limit, limit, '0', '0', '1'],
+                }
+            },
+        }
+
+    @classmethod
+    def parse_languages(cls, languages: Union[str, List[str]]) -> List[Tuple[str, Tuple[str, ...]]]:
+        """
+        자막 언어 우선순위를 (언어 패턴, 허용 종류) 목록으로 변환
+
+        항목 형식:
+            'ko'             한국어 수동 자막, 없으면 자동 생성 자막
+            'ko-*'           ko-KR 같은 지역 변형 (fnmatch 패턴)
+            'ko:translated'  다른 언어 자막을 한국어로 자동 번역한 자막
+            'ko:manual', 'ko:auto'  한 종류만 허용
+
+        Args:
+            languages: 'ko,ko-*,en,ko:translated' 같은 쉼표 구분 문자열 또는 목록
+        """
+        if isinstance(languages, str):
+            languages = languages.split(',')
+
+        parsed = []
+        for item in languages:
+            item = item.strip()
+            if not item:
+                continue
+            pattern, _, kind = item.partition(':')
+            if kind and kind not in cls.SUBTITLE_KINDS:
+                raise ValueError(f"지원하지 않는 자막 종류: {kind} (지원: {', '.join(cls.SUBTITLE_KINDS)})")
+            parsed.append((pattern, (kind,) if kind else ('manual', 'auto')))
+
+        if not parsed:
+            raise ValueError("자막 언어를 하나 이상 지정해야 합니다.")
+        return parsed
+
+    @classmethod
+    def resolve_subtitle_tracks(cls, info: Dict, languages: Union[str, List[str]], auto_generated: bool = True,
+                                ext: str = 'vtt') -> List[Dict]:
+        """
+        extract_info 결과 하나에서 우선순위 순서대로 사용할 수 있는 자막 트랙을 모두 찾음
+
+        자동 자막 중 영상 원래 언어는 yt-dlp가 '{lang}-orig' 키를 함께 만들어 주므로 이것으로
+        자동 생성(auto)과 자동 번역(translated)을 구분합니다. '-orig' 표시가 없는 이전 yt-dlp에서는
+        자동 자막을 모두 auto로 봅니다.
+
+        Args:
+            info: extract_info 결과
+            languages: 자막 언어 우선순위 (parse_languages 형식)
+            auto_generated: False면 자동 생성/번역 자막 제외 (':auto', ':translated'로 명시한 항목 포함)
+            ext: 선호 자막 형식
+
+        Returns:
+            [{'lang', 'kind', 'requested', 'ext', 'url' 또는 'data', 'name'}, ...] (우선순위 순, 중복 없음)
+        """
+        manual = info.get('subtitles') or {}
+        automatic = {} if not auto_generated else info.get('automatic_captions') or {}
+        has_orig_labels = any(key.endswith('-orig') for key in automatic)
+
+        def auto_kind(key: str) -> str:
+            if not has_orig_labels or f"{key}-orig" in automatic:
+                return 'auto'
+            return 'translated'
+
+        tracks, seen = [], set()
+        for pattern, kinds in cls.parse_languages(languages):
+            for kind in kinds:
+                source = manual if kind == 'manual' else automatic
+                keys = [key for key in source if not key.endswith('-orig')]
+                if any(ch in pattern for ch in '*?['):
+                    keys = sorted(key for key in keys if fnmatch.fnmatchcase(key, pattern))
+                else:
+                    keys = [pattern] if pattern in source else []
+
+                for key in keys:
+                    if kind != 'manual' and auto_kind(key) != kind:
+                        continue
+                    formats = [f for f in source.get(key) or [] if f.get('url') or f.get('data') is not None]
+                    if not formats or (kind, key) in seen:
+                        continue
+                    seen.add((kind, key))
+                    track = next((f for f in formats if f.get('ext') == ext), formats[0])
+                    tracks.append({**track, 'lang': key, 'kind': kind, 'requested': pattern})
+        return tracks
+
+    @classmethod
+    def select_subtitle_track(cls, info: Dict, lang: Union[str, List[str]], auto_generated: bool = True,
+                              ext: str = 'vtt') -> Optional[Dict]:
+        """
+        extract_info 결과에서 다운로드할 자막 트랙 하나 선택 (우선순위가 가장 높은 트랙)
+
+        Returns:
+            {'lang': ..., 'kind': ..., 'ext': ..., 'url': ... 또는 'data': ...} 또는 None
+        """
+        tracks = cls.resolve_subtitle_tracks(info, lang, auto_generated, ext)
+        return tracks[0] if tracks else None
+
+    @classmethod
+    def _download_tracks(cls, ydl, tracks: List[Dict], all_tracks: bool,
+                         stop_on_error: bool = False) -> Tuple[Optional[Dict], List[Dict]]:
+        """
+        우선순위 순서로 자막을 받아 (실제로 제공한 트랙, 받은 트랙 목록)을 반환
+        트랙 하나를 받지 못하면 다음 후보로 넘어가고, 모든 후보가 실패하면 마지막 오류를 다시 던집니다.
+        all_tracks=False면 첫 트랙을 받는 즉시 멈춥니다.
+        stop_on_error=True면 첫 실패에서 바로 오류를 던집니다 (캐시된 URL이 만료된 경우).
+        """
+        downloaded, last_error = [], None
+        for track in tracks:
+            try:
+                vtt_text = cls.download_subtitle(ydl, track)
+            except Exception as e:
+                if stop_on_error:
+                    raise
+                print(f"⚠️ '{track['lang']}' ({track['kind']}) 자막 다운로드 실패, 다음 후보 시도: {e}")
+                last_error = e
+                continue
+            if not vtt_text:
+                continue
+            downloaded.append({
+                'lang': track['lang'],
+                'kind': track['kind'],
+                'requested': track['requested'],
+                'vtt_text': vtt_text,
+            })
+            if not all_tracks:
+                break
+
+        if not downloaded and last_error is not None:
+            raise last_error
+        return (downloaded[0] if downloaded else None), downloaded
+
+    @staticmethod
+    def download_subtitle(ydl, track: Dict) -> str:
+        """
+        자막 트랙을 yt-dlp의 HTTP 오프너로 메모리에 바로 다운로드
+        (임시 디렉토리에 파일을 쓰지 않습니다.)
+        """
+        if track.get('data') is not None:
+            return track['data']
+
+        with ydl.urlopen(track['url']) as response:
+            return response.read().decode('utf-8')
+
+    def fetch_all_in_one(self, video_url: str, lang: str = 'ko', auto_generated: bool = True, cookies: Optional[str] = None,
+                         comments: str = 'pinned', max_comments: Optional[int] = None, timer=None,
+                         languages: Optional[Union[str, List[str]]] = None, all_tracks: bool = False,
+                         info_cache=None) -> Dict:
         """
         단 한 번의 요청으로 영상 정보, 고정 댓글, 자막을 모두 가져옵니다.
         AWS 람다와 같이 실행 시간을 최소화해야 하는 환경에 최적화되었습니다.
+        같은 옵션 조합(auto_generated, cookies, 댓글 모드)의 YoutubeDL 세션은 풀에서 재사용됩니다.
+        자막 언어 우선순위의 모든 후보를 extract_info 한 번의 결과에서 고르므로,
+        첫 언어가 없어도 다시 조회하지 않습니다.
 
         Args:
             video_url: YouTube 영상 URL 또는 video ID
-            lang: 자막 언어 코드
+            lang: 자막 언어 코드 (languages가 없을 때 [lang, 'lang:translated']로 사용)
             auto_generated: 자동 생성 자막 허용 여부
+            cookies: Netscape 형식의 쿠키 문자열
+            comments: 댓글 조회 모드 ('pinned', 'all', 'none')
+            max_comments: 조회할 최대 댓글 스레드 수
+            timer: src.metrics.StageTimer를 넘기면 ydl_init, extract_info, comment_paging,
+                   subtitle_read 단계 시간을 기록합니다.
+            languages: 자막 언어 우선순위 (예: 'ko,ko-*,en,ko:translated', parse_languages 참고)
+            all_tracks: True면 우선순위의 모든 트랙을 받아 'subtitles'에 담음
+            info_cache: src.info_cache.InfoCache를 넘기면 캐시된 영상 정보로 추출을 건너뛰고 자막만 다운로드
 
         Returns:
             {
                 'video_info': { ... },
                 'pinned_comment': { ... } or None,
-                'vtt_text': '...' or None
+                'vtt_text': '...' or None (우선순위가 가장 높은 트랙),
+                'subtitle_lang': 실제로 받은 자막 언어 코드 or None,
+                'subtitle_kind': 'manual', 'auto', 'translated' or None,
+                'subtitles': [{'lang', 'kind', 'requested', 'vtt_text'}, ...] (all_tracks=True일 때만),
+                'stats': {
+                    'comment_pages': 조회한 댓글 페이지 수,
+                    'session_reused': 세션 재사용 여부,
+                    'info_cache_hit': 캐시된 영상 정보 사용 여부 (extract_info 생략),
+                    'session_init_ms': 이번 호출에서 세션 생성에 쓴 시간,
+                    'session_init_saved_ms': 세션 재사용으로 절약한 생성 시간,
+                    'extract_ms': extract_info 소요 시간 (댓글 조회 포함),
+                    'comment_ms': extract_info 중 댓글 페이지 조회에 쓴 시간,
+                    'subtitle_ms': 자막 다운로드 소요 시간,
+                    'retries': 스로틀링/일시적 오류로 다시 시도한 횟수 (rate_limiter가 있을 때),
+                    'rate_wait_ms': 속도 제한과 백오프로 기다린 시간,
+                    'total_ms': 전체 소요 시간
+                }
             }
+
+        Raises:
+            ValueError: 잘못된 URL 또는 언어 우선순위 (요청 전)
+            YtDlpAuthError: 인증 필요, 쿠키 만료
+            YtDlpThrottledError, YtDlpTransientError: 재시도를 모두 쓴 뒤에도 실패
+            YtDlpUnavailableError: 없거나 접근할 수 없는 영상
         """
+        total_start = time.perf_counter()
+        comment_opts = self.build_comment_options(comments, max_comments)
+        if not languages:
+            languages = [lang, f"{lang}:translated"]
+        elif isinstance(languages, str):
+            languages = languages.split(',')
+        # 잘못된 항목은 YouTube를 조회하기 전에 ValueError로 알림
+        self.parse_languages(languages)
+
         video_id = self.extract_video_id(video_url)
         if not video_id:
             raise ValueError("유효하지 않은 YouTube URL 또는 video ID입니다.")
 
-        if len(video_url) == 11:
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
+        # YouTube 익스트랙터만 등록된 세션이므로 항상 표준 watch URL로 조회
+        watch_url = f"https://www.youtube.com/watch?v={video_id}"
+        result, control = self._rate_controlled(watch_url, lambda: self._fetch_once(
+            video_url, video_id, watch_url, languages, auto_generated, cookies, comment_opts, timer, all_tracks,
+            info_cache
+        ))
+        rate_wait_ms = control['wait_ms'] + control['backoff_ms']
+        if timer is not None and self.rate_limiter is not None:
+            timer.add('rate_wait', rate_wait_ms)
+        result['stats'].update(
+            retries=control['retries'],
+            rate_wait_ms=round(rate_wait_ms, 2),
+            total_ms=round((time.perf_counter() - total_start) * 1000, 2)
+        )
+        return result
+
+    def _fetch_once(self, video_url: str, video_id: str, watch_url: str, languages: List[str], auto_generated: bool,
+                    cookies: Optional[str], comment_opts: Dict, timer, all_tracks: bool, info_cache) -> Dict:
+        """fetch_all_in_one의 조회 한 번 (실패하면 classify_error로 분류한 오류를 던짐)"""
+        total_start = time.perf_counter()
+        key = self._session_key(auto_generated, cookies, comment_opts)
+        ydl_opts = self._build_ydl_opts(auto_generated, comment_opts)
+        session, reused = self._acquire_session(key, ydl_opts, cookies)
+        session.logger.reset()
+        session.uses += 1
+        reusable = True
+
+        with_comments = bool(comment_opts.get('getcomments'))
+        extract_ms = comment_ms = 0.0
+        info = None
+        if info_cache is not None:
+            cache_start = time.perf_counter()
+            info = info_cache.get(video_id, with_comments)
+            if timer is not None:
+                timer.add('info_cache', (time.perf_counter() - cache_start) * 1000)
 
-        cookie_file = None
         try:
-            if cookies:
-                # 쿠키를 임시 파일에 저장
-                cookie_file = '/tmp/cookies.txt'
-                with open(cookie_file, 'w', encoding='utf-8') as f:
-                    # Netscape 쿠키 파일 헤더 추가
-                    f.write("# Netscape HTTP Cookie File\n")
-                    f.write("# http://www.netscape.com/newsref/std/cookie_spec.html\n")
-                    f.write("# This is a generated file! Do not edit.\n\n")
-                    f.write(cookies)
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                ydl_opts = {
-                'outtmpl': os.path.join(temp_dir, '%(id)s.%(ext)s'),
-                'skip_download': True,
-                'writesubtitles': True,
-                'writeautomaticsub': auto_generated,
-                'subtitleslangs': [lang],
-                'subtitlesformat': 'vtt',
-                'getcomments': True,
-                'quiet': True,
-                'no_warnings': True,
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36',
+            # 0. 캐시된 영상 정보가 있으면 추출 없이 자막 트랙만 다운로드
+            subtitle_start = time.perf_counter()
+            if info is not None:
+                try:
+                    tracks = self.resolve_subtitle_tracks(info, languages, auto_generated)
+                    served, subtitles = self._download_tracks(session.ydl, tracks, all_tracks, stop_on_error=True)
+                except Exception as e:
+                    # 스로틀링은 다시 추출해도 같은 결과이므로 그대로 던져 백오프
+                    if self.classify_error(e).throttled:
+                        raise
+                    # 자막 URL이 만료되었거나 거부되면 캐시를 버리고 평소처럼 추출
+                    print(f"♻️ 캐시된 자막 URL을 사용할 수 없어 다시 조회합니다: {e}")
+                    info_cache.invalidate(video_id, with_comments)
+                    info = None
+            info_cache_hit = info is not None
+
+            if info is None:
+                # 자막 파일을 디스크에 쓰지 않고 추출된 정보에서 트랙만 선택
+                extract_start = time.perf_counter()
+                info = session.ydl.extract_info(watch_url, download=False, ie_key=_YtDlpSession.IE_KEY)
+                extract_end = time.perf_counter()
+                extract_ms = (extract_end - extract_start) * 1000
+                comment_started = session.logger.comment_started
+                comment_ms = (extract_end - comment_started) * 1000 if comment_started else 0.0
+                if info_cache is not None:
+                    info_cache.put(video_id, with_comments, info)
+
+                # 3. 자막 내용 다운로드 (메모리, 우선순위 순서로 받을 수 있는 첫 트랙 또는 전체)
+                subtitle_start = time.perf_counter()
+                tracks = self.resolve_subtitle_tracks(info, languages, auto_generated)
+                served, subtitles = self._download_tracks(session.ydl, tracks, all_tracks)
+            vtt_text = served['vtt_text'] if served else None
+            subtitle_ms = (time.perf_counter() - subtitle_start) * 1000
+
+            if timer is not None:
+                timer.add('ydl_init', 0.0 if reused else session.init_ms)
+                if not info_cache_hit:
+                    timer.add('extract_info', extract_ms - comment_ms)
+                    if with_comments:
+                        timer.add('comment_paging', comment_ms)
+                timer.add('subtitle_read', subtitle_ms)
+
+            # 1. 영상 정보 파싱
+            video_type = 'shorts' if 'shorts' in video_url.lower() or info.get('duration', 0) <= 60 else 'watch'
+            duration = info.get('duration', 0)
+            minutes, seconds = divmod(int(duration), 60)
+            duration_string = f"{minutes:02d}:{seconds:02d}"
+
+            video_info = {
+                'video_id': info.get('id', video_id),
+                'title': info.get('title', 'Unknown'),
+                'duration': duration,
+                'duration_string': duration_string,
+                'video_type': video_type,
+                'uploader': info.get('uploader', 'Unknown'),
+                'upload_date': info.get('upload_date', 'Unknown'),
+                'description': info.get('description', 'No description')
             }
 
-            if cookie_file:
-                ydl_opts['cookiefile'] = cookie_file
+            # 2. 고정 댓글 파싱
+            pinned_comment = None
+            if 'comments' in info and info['comments']:
+                for comment in info['comments']:
+                    if comment.get('is_pinned'):
+                        pinned_comment = {
+                            'author': comment.get('author', 'Unknown'),
+                            'text': comment.get('text', 'No content')
+                        }
+                        break
 
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(video_url, download=True) # download=True로 변경하여 자막 다운로드 실행
-
-                    # 1. 영상 정보 파싱
-                video_type = 'shorts' if 'shorts' in video_url.lower() or info.get('duration', 0) <= 60 else 'watch'
-                duration = info.get('duration', 0)
-                minutes, seconds = divmod(int(duration), 60)
-                duration_string = f"{minutes:02d}:{seconds:02d}"
-
-                video_info = {
-                    'video_id': info.get('id', video_id),
-                    'title': info.get('title', 'Unknown'),
-                    'duration': duration,
-                    'duration_string': duration_string,
-                    'video_type': video_type,
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'upload_date': info.get('upload_date', 'Unknown'),
-                    'description': info.get('description', 'No description')
-                }
+            if not vtt_text:
+                print(f"⚠️ '{', '.join(languages)}' 언어의 자막을 찾을 수 없습니다.")
 
-                # 2. 고정 댓글 파싱
-                pinned_comment = None
-                if 'comments' in info and info['comments']:
-                    for comment in info['comments']:
-                        if comment.get('is_pinned'):
-                            pinned_comment = {
-                                'author': comment.get('author', 'Unknown'),
-                                'text': comment.get('text', 'No content')
-                            }
-                            break
-
-                # 3. 자막 내용 파싱
-                vtt_text = None
-                subtitle_path = os.path.join(temp_dir, f"{video_id}.{lang}.vtt")
-                if os.path.exists(subtitle_path):
-                    with open(subtitle_path, 'r', encoding='utf-8') as f:
-                        vtt_text = f.read()
-                else:
-                    # 대체 경로 확인 (자동자막의 경우 lang 코드가 다를 수 있음)
-                    for filename in os.listdir(temp_dir):
-                        if filename.endswith('.vtt'):
-                            with open(os.path.join(temp_dir, filename), 'r', encoding='utf-8') as f:
-                                vtt_text = f.read()
-                            break
-
-                if not vtt_text:
-                    print(f"⚠️ '{lang}' 언어의 자막을 찾을 수 없습니다.")
-
-                return {
-                    'video_info': video_info,
-                    'pinned_comment': pinned_comment,
-                    'vtt_text': vtt_text
+            result = {
+                'video_info': video_info,
+                'pinned_comment': pinned_comment,
+                'vtt_text': vtt_text,
+                'subtitle_lang': served['lang'] if served else None,
+                'subtitle_kind': served['kind'] if served else None,
+                'stats': {
+                    'comment_pages': session.logger.comment_pages,
+                    'session_reused': reused,
+                    'info_cache_hit': info_cache_hit,
+                    'session_init_ms': 0.0 if reused else round(session.init_ms, 2),
+                    'session_init_saved_ms': round(session.init_ms, 2) if reused else 0.0,
+                    'extract_ms': round(extract_ms, 2),
+                    'comment_ms': round(comment_ms, 2),
+                    'subtitle_ms': round(subtitle_ms, 2),
+                    'total_ms': round((time.perf_counter() - total_start) * 1000, 2)
                 }
+            }
+            if all_tracks:
+                result['subtitles'] = subtitles
+            return result
 
-            except yt_dlp.utils.DownloadError as e:
-                raise Exception(f"영상을 찾을 수 없거나 접근할 수 없습니다: {str(e)}")
-            except Exception as e:
-                raise Exception(f"데이터 조회 실패: {str(e)}")
+        except Exception as e:
+            error = self.classify_error(e)
+            # 만료된 쿠키를 가진 세션이나 예상하지 못한 오류가 난 세션은 다시 쓰지 않음
+            reusable = error.kind not in ('auth', 'bot_check', 'error')
+            if error is e:
+                raise
+            raise error from e
+        finally:
+            self._release_session(key, session, reusable)
+
+    def _build_probe_opts(self) -> Dict:
+        """
+        get_available_subtitles에서 사용할 yt-dlp 옵션 생성
+        자막 목록만 필요하므로 댓글을 조회하지 않고 HLS/DASH 매니페스트 요청을 건너뜁니다.
+        """
+        return {
+            'skip_download': True,
+            'quiet': True,
+            'no_warnings': True,
+            'user_agent': self.USER_AGENT,
+            'getcomments': False,
+            'extractor_args': {'youtube': {'skip': ['hls', 'dash']}},
+        }
+
+    @classmethod
+    def list_subtitle_tracks(cls, info: Dict) -> Dict[str, List[Dict]]:
+        """
+        extract_info 결과의 자막 트랙 목록 정리
+
+        Returns:
+            {'manual': [{'name', 'lang', 'formats'}, ...],
+             'automatic': [{'name', 'lang', 'kind', 'formats'}, ...]}
+            (자동 자막의 kind는 resolve_subtitle_tracks와 같은 기준의 'auto' 또는 'translated')
+        """
+        automatic = info.get('automatic_captions') or {}
+        has_orig_labels = any(key.endswith('-orig') for key in automatic)
+
+        def describe(lang: str, formats: List[Dict]) -> Dict:
+            return {
+                'name': next((f['name'] for f in formats if f.get('name')), lang),
+                'lang': lang,
+                'formats': [f['ext'] for f in formats if f.get('ext')],
+            }
+
+        manual = [describe(lang, formats or []) for lang, formats in (info.get('subtitles') or {}).items()]
+        auto = []
+        for lang, formats in automatic.items():
+            if lang.endswith('-orig'):
+                continue
+            kind = 'auto' if not has_orig_labels or f"{lang}-orig" in automatic else 'translated'
+            auto.append({**describe(lang, formats or []), 'kind': kind})
+        return {'manual': manual, 'automatic': auto}
+
+    def get_available_subtitles(self, video_url: str, cookies: Optional[str] = None, info_cache=None,
+                                languages: Optional[Union[str, List[str]]] = None,
+                                auto_generated: bool = True) -> Dict:
+        """
+        자막 트랙 목록만 조회하는 가벼운 확인용 요청 (--list, 일괄 사전 필터링)
+
+        fetch_all_in_one과 같은 세션 풀을 쓰되, 댓글 조회와 yt-dlp의 포맷 처리(process_ie_result)를
+        건너뛰고 익스트랙터 결과만 사용합니다. info_cache를 넘기면 캐시된 정보로 응답하고,
+        새로 조회한 정보는 캐시에 저장해 이어지는 fetch_all_in_one(댓글 없이)이 추출을 생략할 수 있습니다.
+        캐시된 정보에는 vtt 형식만 남아 있으므로 그때 formats에는 vtt만 표시됩니다.
+
+        Args:
+            video_url: YouTube URL 또는 video ID
+            cookies: Netscape 형식의 쿠키 문자열 (선택)
+            info_cache: src.info_cache.InfoCache (선택)
+            languages: 지정하면 이 우선순위로 받을 수 있는 트랙을 'matched'에 담음
+            auto_generated: False면 'matched'에서 자동 생성/번역 자막 제외
+
+        Returns:
+            {
+                'video_id', 'title',
+                'manual': [{'name', 'lang', 'formats'}, ...],
+                'automatic': [{'name', 'lang', 'kind', 'formats'}, ...],
+                'matched': [{'lang', 'kind'}, ...] (languages를 지정한 경우),
+                'stats': {'probe_ms', 'session_reused', 'info_cache_hit', 'retries', 'rate_wait_ms'}
+            }
+        """
+        start = time.perf_counter()
+        if languages is not None:
+            # 잘못된 우선순위는 YouTube 요청 전에 알림
+            self.parse_languages(languages)
+
+        video_id = self.extract_video_id(video_url)
+        if not video_id:
+            raise ValueError("유효하지 않은 YouTube URL 또는 video ID입니다.")
+
+        info = None
+        if info_cache is not None:
+            # 댓글 포함 여부와 관계없이 자막 트랙 목록은 같음
+            info = info_cache.get(video_id, False) or info_cache.get(video_id, True)
+        info_cache_hit = info is not None
+        reused = False
+        control = {'retries': 0, 'wait_ms': 0.0, 'backoff_ms': 0.0}
+
+        if info is None:
+            watch_url = f"https://www.youtube.com/watch?v={video_id}"
+            cookies_digest = hashlib.sha256(cookies.encode('utf-8')).hexdigest() if cookies else None
+            key = ('probe', cookies_digest)
+
+            def probe() -> Tuple[Dict, bool]:
+                session, session_reused = self._acquire_session(key, self._build_probe_opts(), cookies)
+                session.logger.reset()
+                session.uses += 1
+                reusable = True
+                try:
+                    # process=False: 포맷 선택, 자막 처리, post_extract(댓글)를 모두 건너뜀
+                    return session.ydl.extract_info(watch_url, download=False, process=False,
+                                                    ie_key=_YtDlpSession.IE_KEY), session_reused
+                except Exception as e:
+                    error = self.classify_error(e, failure='자막 목록 조회 실패')
+                    reusable = error.kind not in ('auth', 'bot_check', 'error')
+                    raise error from e
+                finally:
+                    self._release_session(key, session, reusable)
+
+            (info, reused), control = self._rate_controlled(watch_url, probe)
+            if info_cache is not None:
+                info_cache.put(video_id, False, info)
+
+        result = {
+            'video_id': info.get('id', video_id),
+            'title': info.get('title', 'Unknown'),
+            **self.list_subtitle_tracks(info),
+        }
+        if languages is not None:
+            result['matched'] = [
+                {'lang': track['lang'], 'kind': track['kind']}
+                for track in self.resolve_subtitle_tracks(info, languages, auto_generated)
+            ]
+        result['stats'] = {
+            'probe_ms': round((time.perf_counter() - start) * 1000, 2),
+            'session_reused': reused,
+            'info_cache_hit': info_cache_hit,
+            'retries': control['retries'],
+            'rate_wait_ms': round(control['wait_ms'] + control['backoff_ms'], 2),
+        }
+        return result
+
+    def list_collection_entries(self, url: str, cookies: Optional[str] = None, max_entries: Optional[int] = None,
+                                known: Optional[Callable[[str], bool]] = None,
+                                stop_after_known: Optional[int] = None) -> Dict:
+        """
+        재생목록/채널의 영상 목록을 평면 추출(영상별 조회 없음)로 가져옴
+
+        YoutubeTab 익스트랙터의 결과를 process=False로 받아 entries를 직접 순회하므로
+        필요한 만큼만 다음 페이지를 요청합니다. 채널 동영상 탭은 최신순이므로 known과 stop_after_known을 주면
+        이미 처리한 영상이 연속으로 나올 때 목록 조회를 멈춥니다 (정기 수집 시 한두 페이지만 요청).
+
+        Args:
+            url: 재생목록 또는 채널 URL
+            cookies: Netscape 형식의 쿠키 문자열 (선택)
+            max_entries: 최대 영상 수
+            known: video ID를 받아 이미 처리했는지 반환하는 함수
+            stop_after_known: 이미 처리한 영상이 이만큼 연속으로 나오면 중단
+
+        Returns:
+            {
+                'id', 'title',
+                'entries': [{'video_id', 'title', 'url', 'known'}, ...] (목록 순서),
+                'stats': {'listed', 'stopped_early', 'list_ms', 'session_reused', 'retries', 'rate_wait_ms'}
+            }
+        """
+        start = time.perf_counter()
+        url = self.normalize_collection_url(url)
+        (result, entries, stopped_early, reused), control = self._rate_controlled(
+            url, lambda: self._list_collection_once(url, cookies, max_entries, known, stop_after_known)
+        )
+
+        return {
+            'id': result.get('id'),
+            'title': result.get('title') or url,
+            'entries': entries,
+            'stats': {
+                'listed': len(entries),
+                'stopped_early': stopped_early,
+                'list_ms': round((time.perf_counter() - start) * 1000, 2),
+                'session_reused': reused,
+                'retries': control['retries'],
+                'rate_wait_ms': round(control['wait_ms'] + control['backoff_ms'], 2),
+            }
+        }
+
+    def _list_collection_once(self, url: str, cookies: Optional[str], max_entries: Optional[int],
+                              known: Optional[Callable[[str], bool]],
+                              stop_after_known: Optional[int]) -> Tuple[Dict, List[Dict], bool, bool]:
+        """list_collection_entries의 조회 한 번 (결과, 영상 목록, 조기 중단 여부, 세션 재사용 여부)"""
+
+        cookies_digest = hashlib.sha256(cookies.encode('utf-8')).hexdigest() if cookies else None
+        key = ('flat', cookies_digest)
+        ydl_opts = {
+            'skip_download': True,
+            'quiet': True,
+            'no_warnings': True,
+            'user_agent': self.USER_AGENT,
+            'extract_flat': 'in_playlist',
+        }
+        ie_keys = (_YtDlpSession.IE_KEY, _YtDlpSession.TAB_IE_KEY)
+        session, reused = self._acquire_session(key, ydl_opts, cookies, ie_keys)
+        session.logger.reset()
+        session.uses += 1
+        reusable = True
+
+        entries, seen, known_streak, stopped_early = [], set(), 0, False
+        try:
+            result = session.ydl.extract_info(url, download=False, process=False,
+                                              ie_key=_YtDlpSession.TAB_IE_KEY)
+            if result.get('_type') == 'url' and result.get('ie_key') == _YtDlpSession.TAB_IE_KEY:
+                # 채널 별칭 URL 등은 정식 URL로 한 번 더 이동
+                result = session.ydl.extract_info(result['url'], download=False, process=False,
+                                                  ie_key=_YtDlpSession.TAB_IE_KEY)
+
+            for entry in result.get('entries') or []:
+                if max_entries is not None and len(entries) >= max_entries:
+                    break
+                video_id = self.extract_video_id(entry.get('url') or '')
+                if not video_id and entry.get('ie_key') == _YtDlpSession.IE_KEY:
+                    video_id = self.extract_video_id(entry.get('id') or '')
+                if not video_id or video_id in seen:
+                    # 하위 재생목록/탭 항목이나 중복 항목은 건너뜀
+                    continue
+                seen.add(video_id)
+                is_known = bool(known and known(video_id))
+                entries.append({
+                    'video_id': video_id,
+                    'title': entry.get('title'),
+                    'url': f"https://www.youtube.com/watch?v={video_id}",
+                    'known': is_known,
+                })
+                known_streak = known_streak + 1 if is_known else 0
+                if stop_after_known and known_streak >= stop_after_known:
+                    stopped_early = True
+                    break
+
+        except Exception as e:
+            error = self.classify_error(e, unavailable='재생목록/채널을 찾을 수 없거나 접근할 수 없습니다',
+                                        failure='재생목록/채널 목록 조회 실패')
+            reusable = error.kind not in ('auth', 'bot_check', 'error')
+            raise error from e
         finally:
-            # 쿠키 파일이 생성되었다면 삭제
-            if cookie_file and os.path.exists(cookie_file):
-                os.remove(cookie_file)
+            self._release_session(key, session, reusable)
+
+        return result, entries, stopped_early, reused
@@ -0,0 +1,37 @@
+"""collect_vtt_files / output_path_for / open_vtt 테스트 (원본 보관 형식 .vtt.gz 포함)"""
+
+import gzip
+from pathlib import Path
+
+from src.bulk_processor import collect_vtt_files, open_vtt, output_path_for
+
+VTT = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\n안녕하세요\n"
+
+
+def test_collect_includes_archived_gzip(tmp_path):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'a' / 'ko.vtt').write_text(VTT, encoding='utf-8')
+    raw_dir = tmp_path / 'dQw4w9WgXcQ' / 'raw'
+    raw_dir.mkdir(parents=True)
+    (raw_dir / 'ko.vtt.gz').write_bytes(gzip.compress(VTT.encode('utf-8')))
+    (tmp_path / 'notes.txt').write_text('무시', encoding='utf-8')
+
+    files = collect_vtt_files(str(tmp_path))
+
+    assert [path.relative_to(tmp_path).as_posix() for path in files] == [
+        'a/ko.vtt', 'dQw4w9WgXcQ/raw/ko.vtt.gz']
+
+
+def test_open_vtt_reads_gzip(tmp_path):
+    path = tmp_path / 'ko.vtt.gz'
+    path.write_bytes(gzip.compress(VTT.encode('utf-8')))
+    with open_vtt(path) as f:
+        assert f.read() == VTT
+
+
+def test_output_path_strips_gzip_suffix(tmp_path):
+    vtt_path = tmp_path / 'dQw4w9WgXcQ' / 'raw' / 'ko.vtt.gz'
+
+    assert output_path_for(vtt_path, tmp_path, None) == tmp_path / 'dQw4w9WgXcQ' / 'raw' / 'ko.txt'
+    assert output_path_for(vtt_path, tmp_path, Path('out'), 'srt') == Path('out/dQw4w9WgXcQ/raw/ko.srt')
+    assert output_path_for(Path('ko.vtt'), None, Path('out')) == Path('out/ko.txt')
@@ -0,0 +1,186 @@
+"""결과 캐시 항목의 처리 설정 비교 테스트 (Lambda _process_video, CLI process_url)"""
+
+import argparse
+
+import pytest
+
+import lambda_function
+from cli import main_ytdlp
+from src.result_cache import LocalDiskCacheBackend, ResultCache
+from src.subtitle_processor import SubtitleProcessor
+
+VIDEO_ID = 'dQw4w9WgXcQ'
+VTT = (
+    "WEBVTT\n\n"
+    "00:00:01.000 --> 00:00:02.000\n구독과 좋아요 부탁드려요\n\n"
+    "00:00:02.000 --> 00:00:03.000\n오늘의 요리는\n\n"
+    "00:00:03.000 --> 00:00:04.000\n구독과 좋아요 부탁드려요\n"
+)
+
+
+def _fetched(comments='pinned'):
+    return {
+        'video_info': {'video_id': VIDEO_ID, 'title': '제목', 'video_type': 'watch', 'duration_string': '0:04',
+                       'duration': 4, 'uploader': '채널', 'upload_date': '20240101'},
+        'pinned_comment': {'author': '채널', 'text': '고정 댓글'} if comments != 'none' else None,
+        'vtt_text': VTT,
+        'subtitle_lang': 'ko',
+        'subtitle_kind': 'auto',
+    }
+
+
+class _Archive:
+    def __init__(self):
+        self.results = []
+
+    def archive(self, *args):
+        pass
+
+    def build_result(self, processor, video_info, pinned_comment, transcript, subtitle):
+        return {'transcript': transcript, 'pinned_comment': pinned_comment}
+
+    def put_result(self, video_id, result):
+        self.results.append(result)
+        return f'{video_id}/scrap_result.json'
+
+    def stats(self):
+        return {}
+
+
+@pytest.fixture
+def lambda_env(monkeypatch, tmp_path):
+    cache = ResultCache(LocalDiskCacheBackend(str(tmp_path)))
+    archive = _Archive()
+    fetches = []
+
+    def fetch(video_url, timer=None, **kwargs):
+        fetches.append(kwargs)
+        data = _fetched(kwargs['comments'])
+        data['stats'] = {'comment_pages': 0, 'session_reused': False, 'session_init_saved_ms': 0.0,
+                         'info_cache_hit': False, 'retries': 0}
+        return data
+
+    monkeypatch.setattr(lambda_function, 'get_result_cache', lambda bucket: cache)
+    monkeypatch.setattr(lambda_function, 'get_info_cache', lambda bucket: None)
+    monkeypatch.setattr(lambda_function, 'get_archive', lambda bucket: archive)
+    monkeypatch.setattr(lambda_function, 'fetch_with_cookie_refresh', fetch)
+    monkeypatch.setattr(lambda_function, 'METRICS_NAMESPACE', '')
+    monkeypatch.setattr(lambda_function, 'DEDUP_WINDOW', 0)
+    return fetches, archive
+
+
+def _run_lambda():
+    return lambda_function.process_video(VIDEO_ID, 'bucket', SubtitleProcessor())
+
+
+def test_lambda_reuses_entry_with_same_settings(lambda_env):
+    fetches, archive = lambda_env
+    _run_lambda()
+    _run_lambda()
+    assert len(fetches) == 1
+    assert archive.results[0] == archive.results[1]
+
+
+def test_lambda_ignores_entry_built_with_other_dedup_window(lambda_env, monkeypatch):
+    fetches, archive = lambda_env
+    _run_lambda()
+    monkeypatch.setattr(lambda_function, 'DEDUP_WINDOW', 4)
+    _run_lambda()
+
+    assert len(fetches) == 2
+    assert archive.results[0]['transcript'] == '구독과 좋아요 부탁드려요 오늘의 요리는 구독과 좋아요 부탁드려요'
+    assert archive.results[1]['transcript'] == '구독과 좋아요 부탁드려요 오늘의 요리는'
+
+    # 새 설정으로 다시 저장했으므로 그다음부터는 적중
+    _run_lambda()
+    assert len(fetches) == 2
+
+
+def test_lambda_ignores_entry_without_settings(lambda_env):
+    fetches, _ = lambda_env
+    # 설정을 기록하기 전에 저장된 항목
+    lambda_function.get_result_cache('bucket').put(VIDEO_ID, 'ko', True, {**_fetched(), 'transcript': 'old'})
+    _run_lambda()
+    assert len(fetches) == 1
+
+
+def test_lambda_ignores_entry_built_with_other_comment_mode(lambda_env, monkeypatch):
+    fetches, archive = lambda_env
+    monkeypatch.setenv('COMMENT_MODE', 'none')
+    _run_lambda()
+    monkeypatch.setenv('COMMENT_MODE', 'pinned')
+    _run_lambda()
+
+    assert [fetch['comments'] for fetch in fetches] == ['none', 'pinned']
+    assert archive.results[1]['pinned_comment']['text'] == '고정 댓글'
+
+
+class _Fetcher:
+    def __init__(self):
+        self.calls = []
+
+    def fetch_all_in_one(self, url, lang, comments='pinned', **kwargs):
+        self.calls.append(comments)
+        return _fetched(comments)
+
+
+def _args(**overrides):
+    values = dict(lang='ko', no_auto=False, all_tracks=False, comments='pinned', max_comments=20, raw=False,
+                  format='txt', merge=3, overlap='prefix', min_overlap=SubtitleProcessor.MIN_OVERLAP_CHARS,
+                  dedup_window=0, no_save=True, output=None)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+@pytest.fixture
+def cli_cache(tmp_path):
+    return ResultCache(LocalDiskCacheBackend(str(tmp_path)))
+
+
+def _run_cli(args, fetcher, cache):
+    logs = []
+    assert main_ytdlp.process_url(1, 1, VIDEO_ID, args, fetcher, cache, log=logs.append)
+    return logs
+
+
+def test_cli_reuses_transcript_with_same_settings(cli_cache, monkeypatch):
+    fetcher = _Fetcher()
+    _run_cli(_args(), fetcher, cli_cache)
+    monkeypatch.setattr(SubtitleProcessor, 'process', lambda *args, **kwargs: pytest.fail('다시 처리함'))
+    logs = _run_cli(_args(), fetcher, cli_cache)
+
+    assert fetcher.calls == ['pinned']
+    assert '🗃️  캐시된 결과 사용 (YouTube 요청 없음)' in logs
+
+
+@pytest.mark.parametrize('overrides', [{'overlap': 'partial'}, {'min_overlap': 3}, {'dedup_window': 4}])
+def test_cli_reprocesses_with_other_settings(cli_cache, monkeypatch, overrides):
+    processed = []
+    process = SubtitleProcessor.process
+
+    def spy(self, vtt_text, *args, **kwargs):
+        processed.append(kwargs)
+        return process(self, vtt_text, *args, **kwargs)
+
+    monkeypatch.setattr(SubtitleProcessor, 'process', spy)
+    fetcher = _Fetcher()
+    _run_cli(_args(), fetcher, cli_cache)
+    _run_cli(_args(**overrides), fetcher, cli_cache)
+
+    # 캐시된 VTT를 새 설정으로 다시 처리하므로 YouTube 요청은 한 번
+    assert fetcher.calls == ['pinned']
+    assert len(processed) == 2
+    assert all(processed[1][key] == value for key, value in overrides.items())
+
+
+def test_cli_ignores_entry_fetched_with_other_comment_mode(cli_cache):
+    fetcher = _Fetcher()
+    _run_cli(_args(comments='none'), fetcher, cli_cache)
+    logs = _run_cli(_args(comments='pinned'), fetcher, cli_cache)
+
+    assert fetcher.calls == ['none', 'pinned']
+    assert '✅ 고정 댓글을 찾았습니다.' in logs
+
+    # 새 댓글 모드로 다시 저장했으므로 그다음부터는 적중
+    _run_cli(_args(comments='pinned'), fetcher, cli_cache)
+    assert fetcher.calls == ['none', 'pinned']
@@ -0,0 +1,91 @@
+"""clean_text/clean_lines 회귀 테스트 (기존 4단계 정규식 방식과 결과가 같아야 함)"""
+
+import random
+import re
+
+import pytest
+
+from src.subtitle_processor import SubtitleProcessor
+
+VTT_TAG_REGEX = re.compile(r'<[^>]*>')
+URL_REGEX = re.compile(r'https?://\S+')
+MUSIC_TAG_REGEX = re.compile(r'\(.*?\)')
+EMOJI_REGEX = re.compile(
+    r'[\U0001F300-\U0001F9FF\U00002600-\U000026FF\U00002700-\U000027BF'
+    r'\U0001F000-\U0001F02F\U0001F0A0-\U0001F0FF\U0001F100-\U0001F64F'
+    r'\U0001F680-\U0001F6FF\U0001F910-\U0001F96B\U0001F980-\U0001F9E0]'
+)
+
+
+def _legacy_clean_text(text: str) -> str:
+    """기존 clean_text (정규식 4회 적용)"""
+    text = VTT_TAG_REGEX.sub('', text)
+    text = URL_REGEX.sub('', text)
+    text = MUSIC_TAG_REGEX.sub('', text)
+    text = EMOJI_REGEX.sub('', text)
+    return text.strip()
+
+
+CASES = [
+    # 평범한 텍스트
+    ('안녕하세요 여러분', '안녕하세요 여러분'),
+    ('  hello world  ', 'hello world'),
+    # VTT 태그
+    ('안녕<00:00:01.000><c> 여러분</c>', '안녕 여러분'),
+    ('<c.colorE5E5E5>hello</c>', 'hello'),
+    ('a < b', 'a < b'),
+    # 태그를 지우면 URL/괄호가 이어 붙음
+    ('http<c>s://example.com</c> 끝', '끝'),
+    ('(<c>음악</c>) 시작', '시작'),
+    # URL과 괄호가 함께 있을 때: URL이 괄호까지 삼킨 뒤 음악 태그를 찾음
+    ('(see https://example.com/a) 끝', '(see  끝'),
+    ('(see https://example.com/a) 끝 (음악)', ''),
+    ('https://example.com/(x) (웃음) 다음', '다음'),
+    ('(링크: https://a.b) 뒤 (박수) 앞', '앞'),
+    ('https://example.com)', ''),
+    ('(음악) 오늘은 http://x.y', '오늘은'),
+    # 음악 태그
+    ('(음악) 오늘은 (웃음) 정말', '오늘은  정말'),
+    ('열린 괄호만 ( 있음', '열린 괄호만 ( 있음'),
+    # 이모지 범위 경계
+    ('좋아요 😀🎉', '좋아요'),
+    ('\u2600 해 \u27bf', '해'),
+    ('\U0001F000\U0001F02F \U0001F0A0\U0001F0FF \U0001F100 끝', '끝'),
+    ('\U0001F9FF 마지막 범위', '마지막 범위'),
+    ('범위 밖 \u25ff \u27c0 \U0001FA70', '범위 밖 \u25ff \u27c0 \U0001FA70'),
+    # 비어 버리는 결과
+    ('', ''),
+    ('   ', ''),
+    ('<c></c>', ''),
+    ('(음악)', ''),
+    ('😀', ''),
+    ('https://example.com', ''),
+]
+
+
+@pytest.mark.parametrize('text, expected', CASES)
+def test_clean_text(text, expected):
+    assert SubtitleProcessor.clean_text(text) == expected
+    assert _legacy_clean_text(text) == expected
+
+
+def test_clean_lines_matches_clean_text():
+    lines = [text for text, _ in CASES]
+    assert SubtitleProcessor.clean_lines(lines) == [expected for _, expected in CASES]
+    assert SubtitleProcessor.clean_lines([]) == []
+
+
+def test_clean_lines_with_embedded_newline():
+    # 줄 안에 개행이 있으면 한 줄씩 처리
+    lines = ['(음악\n) 앞', '<c>뒤</c>']
+    assert SubtitleProcessor.clean_lines(lines) == [_legacy_clean_text(line) for line in lines]
+
+
+def test_matches_legacy_on_random_text():
+    rng = random.Random(0)
+    pieces = ['안녕', 'hi', ' ', '  ', '(', ')', '<', '>', '<c>', '</c>', 'http://', 'https://x.y/', '😀', '\u2600',
+              '\U0001F0A0', '\u27c0', '\n']
+    lines = [''.join(rng.choice(pieces) for _ in range(rng.randint(0, 12))) for _ in range(3000)]
+    for line in lines:
+        assert SubtitleProcessor.clean_text(line) == _legacy_clean_text(line), line
+    assert SubtitleProcessor.clean_lines(lines) == [_legacy_clean_text(line) for line in lines]
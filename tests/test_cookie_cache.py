@@ -0,0 +1,81 @@
+"""Lambda 쿠키 시크릿 캐시 TTL 테스트 (Secrets Manager 호출 없이 가짜 클라이언트 사용)"""
+
+import pytest
+
+import lambda_function
+
+
+class _SecretsClient:
+    def __init__(self, values):
+        self.values = list(values)
+        self.calls = 0
+
+    def get_secret_value(self, SecretId):
+        self.calls += 1
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return {'SecretString': value}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(lambda_function, 'COOKIE_CACHE_TTL', 60.0)
+    monkeypatch.setattr('lambda_function.time.monotonic', lambda: now[0])
+    lambda_function.invalidate_youtube_cookies()
+    yield now
+    lambda_function.invalidate_youtube_cookies()
+
+
+def test_cached_within_ttl(clock):
+    client = _SecretsClient(['first', 'second'])
+    assert lambda_function.get_youtube_cookies(client=client) == 'first'
+
+    clock[0] += 59
+    assert lambda_function.get_youtube_cookies(client=client) == 'first'
+    assert client.calls == 1
+
+    clock[0] += 1
+    assert lambda_function.get_youtube_cookies(client=client) == 'second'
+    assert client.calls == 2
+
+
+def test_force_refresh_ignores_ttl(clock):
+    client = _SecretsClient(['first', 'second'])
+    lambda_function.get_youtube_cookies(client=client)
+    assert lambda_function.get_youtube_cookies(force_refresh=True, client=client) == 'second'
+
+
+def test_failed_fetch_keeps_previous_value(clock, monkeypatch):
+    monkeypatch.setattr(lambda_function, 'COOKIE_RETRY_INTERVAL', 10.0)
+    client = _SecretsClient(['first', RuntimeError('throttled'), 'second'])
+    lambda_function.get_youtube_cookies(client=client)
+
+    clock[0] += 60
+    assert lambda_function.get_youtube_cookies(client=client) == 'first'
+
+    # 실패 후에는 TTL 전체가 아니라 COOKIE_RETRY_INTERVAL 뒤에 다시 조회
+    clock[0] += 9
+    assert lambda_function.get_youtube_cookies(client=client) == 'first'
+    assert client.calls == 2
+
+    clock[0] += 1
+    assert lambda_function.get_youtube_cookies(client=client) == 'second'
+    assert client.calls == 3
+
+
+def test_failed_fetch_without_value_retries_next_call(clock):
+    client = _SecretsClient([RuntimeError('throttled'), 'first'])
+    assert lambda_function.get_youtube_cookies(client=client) is None
+
+    # 캐시된 값이 없으면 실패를 캐시하지 않고 다음 호출에서 바로 다시 조회
+    assert lambda_function.get_youtube_cookies(client=client) == 'first'
+    assert client.calls == 2
+
+
+def test_invalidate(clock):
+    client = _SecretsClient(['first', 'second'])
+    lambda_function.get_youtube_cookies(client=client)
+    lambda_function.invalidate_youtube_cookies()
+    assert lambda_function.get_youtube_cookies(client=client) == 'second'
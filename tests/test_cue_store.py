@@ -0,0 +1,84 @@
+"""CueStore 테스트 (타임스탬프 변환, 슬라이스 뷰, 이진 탐색)"""
+
+import pytest
+
+from src.cue_store import Cue, CueStore
+
+CUES = [(0, 1000, 'a'), (1000, 2500, 'b'), (2500, 4000, 'c'), (4000, 5000, 'd'), (5000, 6000, 'e')]
+
+
+@pytest.mark.parametrize('timestamp, ms', [
+    ('01:02:03.456', 3723456),
+    ('02:03.456', 123456),
+    ('00:00:01.5', 1500),
+    ('00:00:07', 7000),
+])
+def test_parse_timestamp(timestamp, ms):
+    assert CueStore.parse_timestamp(timestamp) == ms
+
+
+def test_format_timestamp():
+    assert CueStore.format_timestamp(83_000) == '01:23'
+    assert CueStore.format_timestamp(3_683_000) == '1:01:23'
+    assert CueStore.format_timestamp(3723456, precise=True) == '01:02:03.456'
+
+
+def test_indexing():
+    store = CueStore(CUES)
+    assert len(store) == 5
+    assert store[0] == Cue(0, 1000, 'a')
+    assert store[-1].text == 'e'
+    assert store[1].time == '00:01'
+    with pytest.raises(IndexError):
+        store[5]
+
+
+def test_slice_is_view():
+    store = CueStore(CUES)
+    view = store[1:4]
+
+    assert [cue.text for cue in view] == ['b', 'c', 'd']
+    assert list(view.starts) == [1000, 2500, 4000]
+    assert view.texts == ['b', 'c', 'd']
+    # 뷰의 뷰, 음수 인덱스
+    assert view[1:][-1] == Cue(4000, 5000, 'd')
+    assert len(store[4:2]) == 0
+    with pytest.raises(ValueError):
+        view.append(7000, 8000, 'f')
+
+    # step이 있으면 복사본
+    assert [cue.text for cue in store[::2]] == ['a', 'c', 'e']
+
+
+def test_index_at():
+    store = CueStore(CUES)
+    assert store.index_at(-1) == -1
+    assert store.index_at(0) == 0
+    assert store.index_at(2499) == 1
+    assert store.index_at(2500) == 2
+    assert store.index_at(10_000) == 4
+
+    # 뷰의 인덱스는 뷰 기준
+    view = store[2:]
+    assert view.index_at(1000) == -1
+    assert view.index_at(4500) == 1
+
+
+def test_between():
+    store = CueStore(CUES)
+    assert [cue.text for cue in store.between(1000, 4000)] == ['b', 'c']
+    assert [cue.text for cue in store.between(1, 1000)] == []
+    assert [cue.text for cue in store[1:4].between(0, 100_000)] == ['b', 'c', 'd']
+
+
+def test_unsorted_store():
+    store = CueStore([(2000, 3000, 'b'), (0, 1000, 'a'), (1000, 2000, 'c')])
+    # 정렬되지 않으면 between은 전체를 훑고, index_at은 거부
+    assert [cue.text for cue in store.between(0, 2000)] == ['a', 'c']
+    with pytest.raises(ValueError):
+        store.index_at(500)
+
+
+def test_to_blocks():
+    store = CueStore(CUES[:2])
+    assert store.to_blocks() == [{'time': '00:00', 'text': 'a'}, {'time': '00:01', 'text': 'b'}]
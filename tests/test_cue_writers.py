@@ -0,0 +1,91 @@
+"""SRT/WebVTT/JSONL 작성기와 시간 단위 큐 병합 테스트"""
+
+import io
+import json
+
+import pytest
+
+from src.cue_writers import format_srt_timestamp, write_cues, write_jsonl, write_srt, write_vtt
+from src.subtitle_processor import SubtitleProcessor
+
+CUES = [(0, 1500, '안녕하세요'), (3723456, 3725000, 'A & B <c>')]
+
+
+def test_format_srt_timestamp():
+    assert format_srt_timestamp(3723456) == '01:02:03,456'
+    assert format_srt_timestamp(0) == '00:00:00,000'
+
+
+def test_write_srt():
+    fp = io.StringIO()
+    assert write_srt(CUES, fp) == 2
+    assert fp.getvalue() == (
+        "1\n00:00:00,000 --> 00:00:01,500\n안녕하세요\n\n"
+        "2\n01:02:03,456 --> 01:02:05,000\nA & B <c>\n\n"
+    )
+
+
+def test_write_vtt_escapes_text():
+    fp = io.StringIO()
+    assert write_vtt(CUES, fp, lang='ko') == 2
+    assert fp.getvalue() == (
+        "WEBVTT\nLanguage: ko\n\n"
+        "00:00:00.000 --> 00:00:01.500\n안녕하세요\n\n"
+        "01:02:03.456 --> 01:02:05.000\nA &amp; B &lt;c>\n\n"
+    )
+
+
+def test_write_jsonl_fields():
+    fp = io.StringIO()
+    assert write_jsonl(CUES, fp, fields={'video_id': 'abc'}) == 2
+    lines = [json.loads(line) for line in fp.getvalue().splitlines()]
+    assert lines[0] == {'video_id': 'abc', 'start_ms': 0, 'end_ms': 1500, 'text': '안녕하세요'}
+    # 한글은 이스케이프하지 않음
+    assert '안녕하세요' in fp.getvalue()
+
+
+def test_write_cues_dispatch():
+    fp = io.StringIO()
+    assert write_cues('srt', iter(CUES), fp) == 2
+    with pytest.raises(ValueError):
+        write_cues('ass', CUES, io.StringIO())
+
+
+MERGE_INPUT = [(0, 1000, 'a'), (1000, 2000, 'b  c'), (5000, 6000, 'd'), (5500, 7000, 'e'), (8000, 9000, ' ')]
+
+
+@pytest.mark.parametrize('options, expected', [
+    # 조건이 없으면 큐 하나씩 (공백 정리, 빈 큐 제거)
+    ({}, [(0, 1000, 'a'), (1000, 2000, 'b c'), (5000, 6000, 'd'), (5500, 7000, 'e')]),
+    ({'window_ms': 2000}, [(0, 2000, 'a b c'), (5000, 7000, 'd e')]),
+    ({'max_chars': 5}, [(0, 2000, 'a b c'), (5000, 7000, 'd e')]),
+    ({'max_chars': 3}, [(0, 1000, 'a'), (1000, 2000, 'b c'), (5000, 7000, 'd e')]),
+    ({'max_count': 3}, [(0, 6000, 'a b c d'), (5500, 7000, 'e')]),
+    # 여러 조건은 하나라도 넘기 직전까지 묶음
+    ({'window_ms': 10_000, 'max_count': 2}, [(0, 2000, 'a b c'), (5000, 7000, 'd e')]),
+])
+def test_iter_merge_cues(options, expected):
+    assert list(SubtitleProcessor.iter_merge_cues(MERGE_INPUT, **options)) == expected
+
+
+def test_iter_merge_cues_keeps_latest_end():
+    cues = [(0, 5000, 'long'), (1000, 2000, 'short')]
+    assert list(SubtitleProcessor.iter_merge_cues(cues, window_ms=3000)) == [(0, 5000, 'long short')]
+
+
+def test_write_cues_from_vtt():
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000\n안녕하세요\n\n"
+        "00:00:02.000 --> 00:00:03.000\n안녕하세요 여러분\n\n"
+        "00:00:09.000 --> 00:00:10.000\n다음 문장\n"
+    )
+    fp = io.StringIO()
+    count = SubtitleProcessor().write_cues(vtt, fp, 'jsonl', window_ms=5000, fields={'lang': 'ko'})
+    lines = [json.loads(line) for line in fp.getvalue().splitlines()]
+
+    assert count == 2
+    assert lines == [
+        {'lang': 'ko', 'start_ms': 1000, 'end_ms': 3000, 'text': '안녕하세요 여러분'},
+        {'lang': 'ko', 'start_ms': 9000, 'end_ms': 10000, 'text': '다음 문장'},
+    ]
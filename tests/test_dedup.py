@@ -0,0 +1,91 @@
+"""슬라이딩 윈도 반복 줄 제거 테스트 (_iter_dedup_texts, dedup_window)"""
+
+import pytest
+
+from src.cue_store import CueStore
+from src.metrics import StageTimer
+from src.subtitle_processor import SubtitleProcessor
+
+
+def _dedup(texts, window, stats=None):
+    return [text for _, text in SubtitleProcessor._iter_dedup_texts(enumerate(texts), window, stats)]
+
+
+def test_removes_repeat_within_window():
+    texts = ['첫 번째 문장', '두 번째 문장', '첫 번째 문장', '세 번째 문장']
+    assert _dedup(texts, 2) == ['첫 번째 문장', '두 번째 문장', '세 번째 문장']
+
+
+def test_window_eviction():
+    texts = ['alpha line', 'beta line', 'gamma line', 'alpha line']
+    # window=2: 'alpha line'은 'gamma line'이 들어올 때 밀려남
+    assert _dedup(texts, 2) == texts
+    assert _dedup(texts, 3) == texts[:3]
+
+
+def test_removed_lines_do_not_take_window_slots():
+    texts = ['alpha line', 'beta line', 'beta line', 'beta line', 'alpha line']
+    # 제거된 'beta line'은 윈도에 다시 들어가지 않으므로 'alpha line'이 밀려나지 않음
+    assert _dedup(texts, 2) == ['alpha line', 'beta line']
+
+
+@pytest.mark.parametrize('repeat', ['Hello, World!', 'hello world', 'HELLO_WORLD', 'Hello   World...'])
+def test_case_and_punctuation_folding(repeat):
+    assert _dedup(['hello world', repeat], 8) == ['hello world']
+
+
+def test_short_lines_are_kept():
+    # 정규화 길이가 DEDUP_MIN_CHARS보다 짧은 맞장구는 비교하지 않음
+    assert SubtitleProcessor.DEDUP_MIN_CHARS == 4
+    texts = ['네', 'ok!', '네', 'ok!', 'abcd', 'a.b.c.d']
+    assert _dedup(texts, 8) == ['네', 'ok!', '네', 'ok!', 'abcd']
+
+
+def test_stats_counter():
+    stats = {'dedup_removed': 99}
+    texts = ['same line', 'other line', 'same line', 'SAME LINE', 'other line']
+    assert _dedup(texts, 8, stats) == ['same line', 'other line']
+    assert stats == {'dedup_removed': 3}
+
+
+VTT = (
+    "WEBVTT\n\n"
+    "00:00:01.000 --> 00:00:02.000\n구독과 좋아요 부탁드려요\n\n"
+    "00:00:02.000 --> 00:00:03.000\n오늘의 요리는\n\n"
+    "00:00:03.000 --> 00:00:04.000\n구독과 좋아요 부탁드려요!\n\n"
+    "00:00:04.000 --> 00:00:05.000\n김치찌개입니다\n"
+)
+
+
+def test_window_zero_is_noop():
+    processor = SubtitleProcessor()
+    stats = {}
+    assert processor.process(VTT, dedup_window=0, stats=stats) == processor.process(VTT)
+    assert stats == {'dedup_removed': 0}
+    assert list(processor.iter_cues(VTT, dedup_window=0)) == list(processor.iter_cues(VTT))
+    assert list(processor.iter_timed_cues(VTT, dedup_window=0)) == list(processor.iter_timed_cues(VTT))
+
+
+def test_process_and_streaming_paths_agree():
+    processor = SubtitleProcessor()
+    expected = '구독과 좋아요 부탁드려요 오늘의 요리는 김치찌개입니다'
+    stats = {}
+    assert processor.process(VTT, dedup_window=4, stats=stats) == expected
+    assert stats == {'dedup_removed': 1}
+    # 단계별 시간을 재는 경로도 같은 결과
+    stats = {}
+    assert processor.process(VTT, dedup_window=4, stats=stats, timer=StageTimer()) == expected
+    assert stats == {'dedup_removed': 1}
+    assert ' '.join(cue['text'] for cue in processor.iter_cues(VTT, dedup_window=4)) == expected
+    assert [cue[0] for cue in processor.iter_timed_cues(VTT, dedup_window=4)] == [1000, 2000, 4000]
+
+
+def test_remove_repeated_lines_keeps_times():
+    processor = SubtitleProcessor()
+    blocks = processor.parse_vtt(VTT)
+    assert [block['time'] for block in processor.remove_repeated_lines(blocks)] == ['00:01', '00:02', '00:04']
+
+    store = processor.remove_repeated_lines(processor.parse_vtt(VTT, as_store=True))
+    assert isinstance(store, CueStore)
+    assert list(store.starts) == [1000, 2000, 4000]
+    assert list(store.ends) == [2000, 3000, 5000]
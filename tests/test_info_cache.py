@@ -0,0 +1,113 @@
+"""InfoCache 만료 시각 계산 테스트 (TTL과 자막 URL expire 중 이른 쪽)"""
+
+import pytest
+
+from src.info_cache import InfoCache
+from src.result_cache import LocalDiskCacheBackend
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [NOW]
+    monkeypatch.setattr('src.info_cache.time.time', lambda: now[0])
+    return now
+
+
+def _info(expire=None):
+    url = 'https://www.youtube.com/api/timedtext?v=abc&lang=ko'
+    if expire is not None:
+        url += f'&expire={int(expire)}'
+    return {
+        'id': 'abc',
+        'title': 'T',
+        'formats': [{'format_id': '18'}],
+        'subtitles': {'ko': [{'ext': 'vtt', 'url': url}, {'ext': 'json3', 'url': url}]},
+        'automatic_captions': {},
+    }
+
+
+def _cache(tmp_path, ttl):
+    return InfoCache(LocalDiskCacheBackend(str(tmp_path)), ttl=ttl)
+
+
+def test_trim_keeps_only_needed_fields():
+    trimmed = InfoCache(backend=None).trim(_info())
+    assert 'formats' not in trimmed
+    assert [fmt['ext'] for fmt in trimmed['subtitles']['ko']] == ['vtt']
+
+
+def test_url_expiry_takes_earliest():
+    info = _info(NOW + 500)
+    info['automatic_captions'] = {'en': [{'ext': 'vtt', 'url': 'https://x/timedtext?expire=1700000100'}]}
+    assert InfoCache.url_expiry(info) == NOW + 100
+
+
+def test_expires_at_ttl(tmp_path, clock):
+    cache = _cache(tmp_path, ttl=60)
+    cache.put('abc', False, _info(NOW + 3600))
+
+    clock[0] = NOW + 59
+    assert cache.get('abc', False) is not None
+
+    clock[0] = NOW + 60
+    assert cache.get('abc', False) is None
+    assert cache.stats()['expired'] == 1
+
+
+def test_expires_before_url_expiry(tmp_path, clock):
+    cache = _cache(tmp_path, ttl=3600)
+    # URL이 TTL보다 먼저 만료되면 EXPIRY_MARGIN만큼 앞당겨 만료
+    cache.put('abc', False, _info(NOW + 1000))
+    deadline = NOW + 1000 - InfoCache.EXPIRY_MARGIN
+
+    clock[0] = deadline - 1
+    assert cache.get('abc', False) is not None
+
+    clock[0] = deadline
+    assert cache.get('abc', False) is None
+
+
+def test_not_stored_when_url_about_to_expire(tmp_path, clock):
+    cache = _cache(tmp_path, ttl=3600)
+    cache.put('abc', False, _info(NOW + InfoCache.EXPIRY_MARGIN - 1))
+    assert cache.get('abc', False) is None
+    assert cache.stats()['expired'] == 0
+
+
+def test_no_ttl_and_no_url_expiry_never_expires(tmp_path, clock):
+    cache = _cache(tmp_path, ttl=None)
+    cache.put('abc', True, _info())
+
+    clock[0] = NOW + 10 * 365 * 24 * 3600
+    assert cache.get('abc', True) is not None
+    # 댓글 조회 여부가 다르면 다른 항목
+    assert cache.get('abc', False) is None
+
+
+@pytest.mark.parametrize('data', [b'{not json', b'[]', b'{"expires_at": null}'])
+def test_corrupt_entry_is_a_miss(tmp_path, data):
+    backend = LocalDiskCacheBackend(str(tmp_path))
+    cache = InfoCache(backend)
+    backend.put(InfoCache.make_key('abc', False), data)
+    assert cache.get('abc', False) is None
+    assert list(tmp_path.glob('*.json')) == []
+
+
+class _ReadOnlyBackend(LocalDiskCacheBackend):
+    def delete(self, key):
+        raise PermissionError('read-only')
+
+
+def test_delete_failure_is_still_a_miss(tmp_path, clock):
+    backend = _ReadOnlyBackend(str(tmp_path))
+    cache = InfoCache(backend, ttl=60)
+    cache.put('abc', False, _info(NOW + 3600))
+    backend.put(InfoCache.make_key('abc', True), b'{not json')
+
+    clock[0] = NOW + 60
+    assert cache.get('abc', False) is None
+    assert cache.get('abc', True) is None
+    cache.invalidate('abc', False)
+    assert cache.stats()['misses'] == 2
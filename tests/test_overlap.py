@@ -0,0 +1,77 @@
+"""롤링 오버랩 제거 테스트 (find_overlap, partial 모드)"""
+
+import random
+
+import pytest
+
+from src.subtitle_processor import SubtitleProcessor
+
+
+def _naive_overlap(prev: str, curr: str, min_overlap: int = 1) -> int:
+    """find_overlap의 기준 구현 (모든 길이를 직접 비교)"""
+    for length in range(min(len(prev), len(curr)), max(min_overlap, 1) - 1, -1):
+        if not prev.endswith(curr[:length]):
+            continue
+        before = len(prev) - length - 1
+        if (before < 0 or prev[before].isspace()) and (length == len(curr) or curr[length].isspace()):
+            return length
+    return 0
+
+
+@pytest.mark.parametrize('prev, curr, min_overlap, expected', [
+    ('오늘은 정말 맛있는 음식을', '맛있는 음식을 먹어 볼게요', 1, 7),
+    ('오늘은 정말 맛있는 음식을', '맛있는 음식을 먹어 볼게요', 8, 0),
+    # 겹침은 단어 경계에서 시작하고 끝나야 함
+    ('abc def', 'ef ghi', 1, 0),
+    ('hello world', 'worlds apart', 1, 0),
+    ('hello world', 'world peace', 1, 5),
+    # 접두사 함수 체인으로 더 짧은 경계 겹침까지 찾음
+    ('a a a', 'a a a b', 1, 5),
+    ('', 'abc', 1, 0),
+    ('abc', '', 1, 0),
+])
+def test_find_overlap(prev, curr, min_overlap, expected):
+    assert SubtitleProcessor.find_overlap(prev, curr, min_overlap) == expected
+
+
+def test_find_overlap_matches_naive():
+    rng = random.Random(0)
+    words = ['a', 'ab', 'ba', 'b', '가', '가나']
+    for _ in range(2000):
+        prev = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        curr = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        min_overlap = rng.randint(1, 4)
+        assert SubtitleProcessor.find_overlap(prev, curr, min_overlap) == _naive_overlap(prev, curr, min_overlap), \
+            (prev, curr, min_overlap)
+
+
+BLOCKS = [
+    {'time': '00:01', 'text': '오늘은 정말 맛있는'},
+    {'time': '00:02', 'text': '정말 맛있는 음식을 먹어'},
+    {'time': '00:03', 'text': '음식을 먹어 볼게요'},
+]
+
+
+def test_partial_mode_removes_partial_overlaps():
+    processor = SubtitleProcessor()
+    result = list(processor.iter_remove_rolling_overlap(BLOCKS, 'partial', min_overlap=3))
+    assert [block['text'] for block in result] == ['오늘은 정말 맛있는', '음식을 먹어', '볼게요']
+    assert [block['time'] for block in result] == ['00:01', '00:02', '00:03']
+
+
+def test_prefix_mode_keeps_partial_overlaps():
+    processor = SubtitleProcessor()
+    result = list(processor.iter_remove_rolling_overlap(BLOCKS, 'prefix'))
+    assert result == BLOCKS
+
+
+def test_partial_mode_respects_min_overlap():
+    processor = SubtitleProcessor()
+    # '음식을 먹어'(6자)는 min_overlap=10보다 짧아 남김
+    result = list(processor.iter_remove_rolling_overlap(BLOCKS[1:], 'partial', min_overlap=10))
+    assert [block['text'] for block in result] == ['정말 맛있는 음식을 먹어', '음식을 먹어 볼게요']
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        list(SubtitleProcessor().iter_remove_rolling_overlap(BLOCKS, 'fuzzy'))
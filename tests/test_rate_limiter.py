@@ -0,0 +1,164 @@
+"""TokenBucket / AdaptiveRateLimiter 테스트 (AIMD 속도 조절, 백오프, 재시도)"""
+
+import time
+
+import pytest
+
+from src.rate_limiter import AdaptiveRateLimiter, HostRateLimiter, TokenBucket
+from src.ytdlp_fetcher import YtDlpBotCheckError
+
+URL = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+
+
+class _Error(Exception):
+    def __init__(self, retryable=False, throttled=False, retry_after=None):
+        super().__init__('error')
+        self.retryable = retryable
+        self.throttled = throttled
+        self.retry_after = retry_after
+
+
+def test_host_of_aliases():
+    assert HostRateLimiter.host_of('https://youtu.be/dQw4w9WgXcQ') == 'youtube.com'
+    assert HostRateLimiter.host_of('https://m.youtube.com/watch?v=dQw4w9WgXcQ') == 'youtube.com'
+    assert HostRateLimiter.host_of('dQw4w9WgXcQ') == 'youtube.com'
+
+
+def test_set_rate_keeps_reserved_wait_time():
+    bucket = TokenBucket(10, burst=1)
+    bucket.penalize(1.0)
+    assert bucket._tokens == pytest.approx(-10, abs=0.1)
+
+    # 속도를 절반으로 낮춰도 이미 예약된 대기 시간(1초)은 그대로
+    bucket.set_rate(5)
+    assert bucket._tokens == pytest.approx(-5, abs=0.1)
+
+
+def test_penalize_does_not_accumulate():
+    bucket = TokenBucket(10, burst=4)
+    bucket.penalize(1.0)
+    bucket.penalize(1.0)
+    assert bucket._tokens == pytest.approx(-10, abs=0.1)
+
+    # 0이면 쌓인 토큰만 비움
+    bucket = TokenBucket(10, burst=4)
+    bucket.penalize(0)
+    assert bucket._tokens == pytest.approx(0, abs=0.1)
+
+
+def test_decrease_once_per_window():
+    limiter = AdaptiveRateLimiter(10, decrease=0.5)
+    started = time.monotonic()
+
+    # 같은 시점에 보낸 요청들이 한꺼번에 스로틀링되어도 한 번만 낮춤
+    assert limiter.on_throttle(URL, started) is True
+    assert limiter.on_throttle(URL, started) is False
+    assert limiter.on_throttle(URL, started) is False
+    assert limiter.current_rate(URL) == pytest.approx(5)
+
+    # 낮춘 뒤에 보낸 요청의 스로틀링은 다시 반영
+    assert limiter.on_throttle(URL, time.monotonic()) is True
+    assert limiter.current_rate(URL) == pytest.approx(2.5)
+
+    stats = limiter.stats()
+    assert stats['throttled'] == 4
+    assert stats['decreases'] == 2
+
+
+def test_decrease_stops_at_min_rate():
+    limiter = AdaptiveRateLimiter(10, min_rate=2, decrease=0.5)
+    for _ in range(10):
+        limiter.on_throttle(URL)
+    assert limiter.current_rate(URL) == pytest.approx(2)
+
+
+def test_additive_increase_up_to_rate():
+    limiter = AdaptiveRateLimiter(10, increase=1.0, decrease=0.5)
+    limiter.on_throttle(URL)
+
+    # 성공 한 번에 increase / 현재 속도만큼 (현재 속도로 1초 동안 성공하면 increase만큼)
+    limiter.on_success(URL)
+    assert limiter.current_rate(URL) == pytest.approx(5 + 1.0 / 5)
+
+    for _ in range(1000):
+        limiter.on_success(URL)
+    assert limiter.current_rate(URL) == pytest.approx(10)
+
+
+def test_backoff_delay_bounds(monkeypatch):
+    limiter = AdaptiveRateLimiter(0, backoff_base=1.0, backoff_max=8.0)
+
+    # full jitter의 상한: min(backoff_max, base * 2^attempt)
+    monkeypatch.setattr('src.rate_limiter.random.uniform', lambda low, high: high)
+    assert [limiter.backoff_delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 8.0, 8.0]
+
+    # Retry-After보다 짧게 기다리지 않되 backoff_max를 넘지 않음
+    monkeypatch.setattr('src.rate_limiter.random.uniform', lambda low, high: low)
+    assert limiter.backoff_delay(0) == 0.0
+    assert limiter.backoff_delay(0, retry_after=3.0) == 3.0
+    assert limiter.backoff_delay(0, retry_after=60.0) == 8.0
+
+
+def _no_wait_limiter(**kwargs) -> AdaptiveRateLimiter:
+    # rate=0: 속도 제한 대기 없음, 백오프 0초
+    return AdaptiveRateLimiter(0, backoff_base=0.0, backoff_max=0.0, **kwargs)
+
+
+def test_call_retries_retryable_errors():
+    limiter = _no_wait_limiter(max_retries=3)
+    errors = [_Error(retryable=True, throttled=True), _Error(retryable=True)]
+
+    def func():
+        if errors:
+            raise errors.pop(0)
+        return 'ok'
+
+    result, info = limiter.call(URL, func)
+
+    assert result == 'ok'
+    assert info['retries'] == 2
+    assert limiter.stats()['requests'] == 3
+
+
+def test_call_fails_fast_on_permanent_errors():
+    limiter = _no_wait_limiter(max_retries=3)
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise _Error(retryable=False)
+
+    with pytest.raises(_Error):
+        limiter.call(URL, func)
+    assert len(calls) == 1
+    assert limiter.stats()['failed'] == 1
+
+
+def test_call_gives_up_after_max_retries():
+    limiter = _no_wait_limiter(max_retries=2)
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise _Error(retryable=True)
+
+    with pytest.raises(_Error):
+        limiter.call(URL, func)
+    assert len(calls) == 3
+    assert limiter.stats()['retries'] == 2
+
+
+def test_call_bot_check_lowers_rate_without_retry():
+    # 봇 확인은 같은 쿠키로 재시도하지 않고(쿠키 갱신은 호출한 쪽에서) 속도만 낮춤
+    limiter = AdaptiveRateLimiter(10, decrease=0.5, backoff_base=0.0, backoff_max=0.0, max_retries=3)
+    calls = []
+
+    def func():
+        calls.append(1)
+        raise YtDlpBotCheckError("Sign in to confirm you're not a bot")
+
+    with pytest.raises(YtDlpBotCheckError):
+        limiter.call(URL, func)
+    assert len(calls) == 1
+    assert limiter.current_rate(URL) == pytest.approx(5)
+    assert limiter.stats()['retries'] == 0
@@ -0,0 +1,127 @@
+"""ResultCache TTL 만료와 캐시 백엔드 정리 주기 테스트"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.result_cache import LocalDiskCacheBackend, ResultCache, S3CacheBackend, _EvictSchedule
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [NOW]
+    monkeypatch.setattr('src.result_cache.time.time', lambda: now[0])
+    return now
+
+
+def test_ttl_expiry(tmp_path, clock):
+    cache = ResultCache(LocalDiskCacheBackend(str(tmp_path)), ttl=60)
+    cache.put('abc', 'ko', True, {'transcript': 'hello'})
+
+    clock[0] = NOW + 60
+    assert cache.get('abc', 'ko', True) == {'transcript': 'hello'}
+    # 자막 종류가 다르면 다른 항목
+    assert cache.get('abc', 'ko', False) is None
+
+    clock[0] = NOW + 61
+    assert cache.get('abc', 'ko', True) is None
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'expired': 1, 'hit_rate': round(1 / 3, 4)}
+    # 만료된 항목은 삭제
+    assert list(tmp_path.glob('*.json')) == []
+
+
+def test_no_ttl(tmp_path, clock):
+    cache = ResultCache(LocalDiskCacheBackend(str(tmp_path)), ttl=None)
+    cache.put('abc', 'ko', True, {'transcript': 'hello'})
+    clock[0] = NOW + 10 * 365 * 24 * 3600
+    assert cache.get('abc', 'ko', True) is not None
+
+
+@pytest.mark.parametrize('data', [b'{not json', b'[1, 2]', b'"text"', b'{"cached_at": 1}'])
+def test_corrupt_entry_is_a_miss(tmp_path, data):
+    backend = LocalDiskCacheBackend(str(tmp_path))
+    cache = ResultCache(backend)
+    backend.put(ResultCache.make_key('abc', 'ko', True), data)
+    assert cache.get('abc', 'ko', True) is None
+    assert cache.stats()['misses'] == 1
+    assert list(tmp_path.glob('*.json')) == []
+
+
+class _ReadOnlyBackend(LocalDiskCacheBackend):
+    def delete(self, key):
+        raise PermissionError('read-only')
+
+
+def test_delete_failure_is_still_a_miss(tmp_path, clock):
+    backend = _ReadOnlyBackend(str(tmp_path))
+    cache = ResultCache(backend, ttl=60)
+    cache.put('abc', 'ko', True, {'transcript': 'hello'})
+    backend.put(ResultCache.make_key('abc', 'ko', False), b'{not json')
+
+    clock[0] = NOW + 61
+    assert cache.get('abc', 'ko', True) is None
+    assert cache.get('abc', 'ko', False) is None
+    assert cache.stats()['misses'] == 2
+
+
+def test_evict_schedule_every_n_puts():
+    schedule = _EvictSchedule(every=3, interval=None)
+    # 프로세스의 첫 저장에서 한 번, 이후 3번마다
+    assert [schedule.due() for _ in range(7)] == [True, False, False, True, False, False, True]
+
+
+def test_evict_schedule_interval(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('src.result_cache.time.monotonic', lambda: now[0])
+    schedule = _EvictSchedule(every=1000, interval=60)
+
+    assert schedule.due() is True
+    now[0] += 59
+    assert schedule.due() is False
+    now[0] += 1
+    assert schedule.due() is True
+
+
+def test_local_disk_evicts_least_recently_used_on_cadence(tmp_path):
+    backend = LocalDiskCacheBackend(str(tmp_path), max_entries=2, evict_every=3, evict_interval=None)
+    for i, key in enumerate(['a', 'b', 'c']):
+        backend.put(key, b'x')
+        os.utime(backend._path(key), (NOW + i, NOW + i))
+    # 정리 주기 사이에는 max_entries를 넘을 수 있음
+    assert len(list(tmp_path.glob('*.json'))) == 3
+
+    # 'a'를 가장 최근에 사용한 항목으로 만든 뒤 정리
+    os.utime(backend._path('a'), (NOW + 10, NOW + 10))
+    backend.put('d', b'x')
+
+    assert backend.get('a') == b'x'
+    assert backend.get('d') == b'x'
+    assert backend.get('b') is None
+    assert backend.get('c') is None
+
+
+def test_local_disk_max_bytes(tmp_path):
+    backend = LocalDiskCacheBackend(str(tmp_path), max_entries=None, max_bytes=25, evict_every=1,
+                                    evict_interval=None)
+    for i, key in enumerate(['a', 'b', 'c']):
+        backend.put(key, b'x' * 10)
+        os.utime(backend._path(key), (NOW + i, NOW + i))
+    assert backend.get('a') is None
+    assert backend.evict() == 0
+
+
+class _S3Client:
+    """S3CacheBackend 생성에 필요한 최소한의 가짜 클라이언트"""
+
+
+@pytest.mark.parametrize('age, touch_interval, expected', [
+    (timedelta(minutes=5), 3600, False),
+    (timedelta(hours=2), 3600, True),
+    (timedelta(days=1), None, False),
+])
+def test_s3_touch_only_stale_objects(age, touch_interval, expected):
+    backend = S3CacheBackend('bucket', client=_S3Client(), touch_interval=touch_interval)
+    assert backend._needs_touch(datetime.now(timezone.utc) - age) is expected
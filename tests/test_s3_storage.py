@@ -0,0 +1,87 @@
+"""ScrapArchive 원본 보관/재처리 테스트 (moto로 만든 가짜 S3 사용)"""
+
+import gzip
+import json
+
+import pytest
+
+moto = pytest.importorskip('moto')
+boto3 = pytest.importorskip('boto3')
+
+from src.s3_storage import ScrapArchive  # noqa: E402
+from src.subtitle_processor import SubtitleProcessor  # noqa: E402
+
+BUCKET = 'scrap-test'
+VIDEO_ID = 'dQw4w9WgXcQ'
+VTT = """WEBVTT
+
+00:00:01.000 --> 00:00:02.000
+안녕하세요 여러분
+
+00:00:02.000 --> 00:00:03.000
+안녕하세요 여러분 오늘은
+
+00:00:03.000 --> 00:00:04.000
+날씨가 좋네요
+"""
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+    monkeypatch.setenv('AWS_ACCESS_KEY_ID', 'testing')
+    monkeypatch.setenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    with moto.mock_aws():
+        client = boto3.client('s3')
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def _archive(s3, **kwargs) -> ScrapArchive:
+    archive = ScrapArchive(BUCKET, client=s3, **kwargs)
+    archive.archive(VIDEO_ID, VTT, {'video_id': VIDEO_ID, 'title': 'T', 'description': '설명  입니다'},
+                    None, 'ko', True, 'auto')
+    return archive
+
+
+def test_archive_layout_and_load(s3):
+    archive = _archive(s3)
+
+    keys = sorted(obj['Key'] for obj in s3.list_objects_v2(Bucket=BUCKET)['Contents'])
+    assert keys == [f'{VIDEO_ID}/info.json.gz', f'{VIDEO_ID}/raw/ko.vtt.gz']
+    raw = s3.get_object(Bucket=BUCKET, Key=f'{VIDEO_ID}/raw/ko.vtt.gz')['Body'].read()
+    assert gzip.decompress(raw).decode('utf-8') == VTT
+
+    data = archive.load(VIDEO_ID)
+    assert data['vtt_text'] == VTT
+    assert (data['lang'], data['kind'], data['auto_generated']) == ('ko', 'auto', True)
+    assert list(archive.iter_archived_video_ids()) == [VIDEO_ID]
+
+
+def test_load_missing_raises(s3):
+    with pytest.raises(FileNotFoundError):
+        ScrapArchive(BUCKET, client=s3).load('missingvideo')
+
+
+def test_reprocess_writes_result_and_skips_unchanged(s3):
+    archive = _archive(s3)
+    processor = SubtitleProcessor()
+
+    key = archive.reprocess(VIDEO_ID, processor)
+    result = json.loads(s3.get_object(Bucket=BUCKET, Key=key)['Body'].read())
+    assert key == f'{VIDEO_ID}/scrap_result.json'
+    assert result['transcript'] == processor.process(VTT)
+    assert result['subtitle'] == {'lang': 'ko', 'kind': 'auto'}
+
+    # 같은 보관본을 같은 설정으로 다시 처리하면 업로드하지 않음
+    uploaded = archive.stats()['uploaded']
+    archive.reprocess(VIDEO_ID, processor)
+    assert archive.stats()['uploaded'] == uploaded
+    assert archive.stats()['skipped'] == 1
+
+
+def test_reprocess_gzip_format(s3):
+    archive = _archive(s3, result_format='gzip')
+    key = archive.reprocess(VIDEO_ID)
+    body = s3.get_object(Bucket=BUCKET, Key=key)['Body'].read()
+    assert json.loads(gzip.decompress(body))['subtitle']['lang'] == 'ko'
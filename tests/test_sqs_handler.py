@@ -0,0 +1,112 @@
+"""SQS 배치 핸들러의 재시도/버림 분류 테스트 (process_video는 가짜로 대체)"""
+
+import json
+
+import pytest
+
+import lambda_function
+from src.ytdlp_fetcher import YtDlpError, YtDlpThrottledError, YtDlpUnavailableError
+
+VIDEO_ID = 'dQw4w9WgXcQ'
+
+
+def _record(message_id, body):
+    return {'messageId': message_id, 'body': body}
+
+
+@pytest.mark.parametrize('body, expected', [
+    (json.dumps({'video_url': f'https://www.youtube.com/watch?v={VIDEO_ID}'}),
+     f'https://www.youtube.com/watch?v={VIDEO_ID}'),
+    (f'  https://youtu.be/{VIDEO_ID}\n', f'https://youtu.be/{VIDEO_ID}'),
+    (VIDEO_ID, VIDEO_ID),
+])
+def test_parse_valid_body(body, expected):
+    assert lambda_function.parse_sqs_video_url(_record('m', body)) == expected
+
+
+@pytest.mark.parametrize('body', [
+    None,
+    '',
+    '   ',
+    '{"video_url": ',
+    '{"url": "https://youtu.be/dQw4w9WgXcQ"}',
+    '{"video_url": 123}',
+    '{"video_url": ""}',
+    'hello world',
+    'https://example.com/watch?v=dQw4w9WgXcQ',
+])
+def test_parse_invalid_body(body):
+    with pytest.raises(ValueError):
+        lambda_function.parse_sqs_video_url(_record('m', body))
+
+
+class _Archive:
+    def stats(self):
+        return {}
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """process_video 대신 URL별로 정한 예외를 던지는 가짜를 넣고 (호출된 URL 목록, 결과 표)를 반환"""
+    outcomes = {}
+    calls = []
+
+    def process_video(video_url, bucket_name, processor, **kwargs):
+        calls.append(video_url)
+        outcome = outcomes.get(video_url)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return f'{video_url}/scrap_result.json'
+
+    monkeypatch.setenv('S3_BUCKET_NAME', 'bucket')
+    monkeypatch.setattr(lambda_function, 'process_video', process_video)
+    monkeypatch.setattr(lambda_function, 'get_result_cache', lambda bucket: None)
+    monkeypatch.setattr(lambda_function, 'get_info_cache', lambda bucket: None)
+    monkeypatch.setattr(lambda_function, 'get_archive', lambda bucket: _Archive())
+    monkeypatch.setattr(lambda_function, 'get_youtube_cookies', lambda: None)
+    return calls, outcomes
+
+
+def _failures(response):
+    return sorted(item['itemIdentifier'] for item in response['batchItemFailures'])
+
+
+def test_retry_and_drop_classification(handler):
+    calls, outcomes = handler
+    outcomes.update({
+        'aaaaaaaaaaa': YtDlpUnavailableError('Video unavailable'),
+        'bbbbbbbbbbb': YtDlpThrottledError('HTTP Error 429'),
+        'ccccccccccc': YtDlpError('Unable to extract initial player response'),
+        'ddddddddddd': RuntimeError('S3 put failed'),
+    })
+    records = [
+        _record('ok', VIDEO_ID),
+        _record('unavailable', 'aaaaaaaaaaa'),
+        _record('throttled', 'bbbbbbbbbbb'),
+        _record('unknown', json.dumps({'video_url': 'ccccccccccc'})),
+        _record('other', 'ddddddddddd'),
+        _record('malformed', '{"video_url": '),
+        _record('not_url', 'hello world'),
+        _record('empty', ''),
+    ]
+    response = lambda_function.sqs_handler({'Records': records}, None)
+
+    # 다시 보내면 성공할 수 있는 실패만 재시도 대상
+    assert _failures(response) == ['other', 'throttled', 'unknown']
+    # 잘못된 메시지는 process_video까지 가지 않음
+    assert sorted(calls) == sorted([VIDEO_ID, 'aaaaaaaaaaa', 'bbbbbbbbbbb', 'ccccccccccc', 'ddddddddddd'])
+
+
+def test_all_succeeded(handler):
+    response = lambda_function.sqs_handler({'Records': [_record('a', VIDEO_ID), _record('b', VIDEO_ID)]}, None)
+    assert response == {'batchItemFailures': []}
+
+
+def test_missing_bucket_fails_whole_batch(handler, monkeypatch):
+    calls, _ = handler
+    monkeypatch.delenv('S3_BUCKET_NAME')
+    records = [_record('a', VIDEO_ID), _record('b', 'not a url')]
+    response = lambda_function.sqs_handler({'Records': records}, None)
+
+    assert _failures(response) == ['a', 'b']
+    assert calls == []
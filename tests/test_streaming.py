@@ -0,0 +1,110 @@
+"""SubtitleProcessor 스트리밍 API 테스트 (process()/parse_vtt()와 같은 결과인지 확인)"""
+
+import io
+
+import pytest
+
+from src.subtitle_processor import SubtitleProcessor
+
+VTT = (
+    "WEBVTT\n"
+    "Kind: captions\n"
+    "Language: ko\n"
+    "\n"
+    "00:00:01.000 --> 00:00:02.000 align:start position:0%\n"
+    "안녕하세요\n"
+    "\n"
+    "00:00:02.000 --> 00:00:03.500\n"
+    "안녕하세요\n"
+    "안녕하세요<00:00:02.500><c> 여러분</c>\n"
+    "\n"
+    "00:00:03.500 --> 00:00:05.000\n"
+    "(음악) 😀\n"
+    "\n"
+    "00:00:05.000 --> 00:00:06.000\n"
+    "오늘은   날씨가 https://example.com 좋네요\n"
+)
+EXPECTED_BLOCKS = [
+    {'time': '00:01', 'text': '안녕하세요'},
+    {'time': '00:02', 'text': '안녕하세요 여러분'},
+    {'time': '00:05', 'text': '오늘은   날씨가  좋네요'},
+]
+EXPECTED_CUES = [
+    {'time': '00:01', 'text': '안녕하세요'},
+    {'time': '00:02', 'text': '여러분'},
+    {'time': '00:05', 'text': '오늘은   날씨가  좋네요'},
+]
+EXPECTED_TRANSCRIPT = '안녕하세요 여러분 오늘은 날씨가 좋네요'
+
+SOURCES = {
+    'str': lambda: VTT,
+    'bytes': lambda: VTT.encode('utf-8'),
+    'crlf': lambda: VTT.replace('\n', '\r\n'),
+    'crlf_bytes': lambda: VTT.replace('\n', '\r\n').encode('utf-8'),
+    'text_file': lambda: io.StringIO(VTT),
+    'binary_file': lambda: io.BytesIO(VTT.encode('utf-8')),
+    'line_list': lambda: VTT.splitlines(keepends=True),
+    'line_list_no_newlines': lambda: VTT.split('\n'),
+}
+
+
+@pytest.fixture
+def processor():
+    return SubtitleProcessor()
+
+
+def test_process_expected(processor):
+    assert processor.parse_vtt(VTT) == EXPECTED_BLOCKS
+    assert processor.process(VTT) == EXPECTED_TRANSCRIPT
+
+
+@pytest.mark.parametrize('source', SOURCES.values(), ids=SOURCES.keys())
+def test_iter_blocks(processor, source):
+    assert list(processor.iter_blocks(source())) == EXPECTED_BLOCKS
+
+
+@pytest.mark.parametrize('source', SOURCES.values(), ids=SOURCES.keys())
+def test_iter_cues_matches_process(processor, source):
+    cues = list(processor.iter_cues(source()))
+    assert cues == EXPECTED_CUES
+    assert ' '.join(word for cue in cues for word in cue['text'].split()) == processor.process(VTT)
+
+
+@pytest.mark.parametrize('source', SOURCES.values(), ids=SOURCES.keys())
+def test_write_transcript_matches_process(processor, source):
+    fp = io.StringIO()
+    written = processor.write_transcript(source(), fp)
+    assert fp.getvalue() == processor.process(VTT)
+    assert written == len(EXPECTED_TRANSCRIPT)
+
+
+def test_iter_lines():
+    assert list(SubtitleProcessor.iter_lines(b'a\r\nb\n')) == ['a\r\n', 'b\n']
+    assert list(SubtitleProcessor.iter_lines([b'a\n', 'b'])) == ['a\n', 'b']
+
+
+def test_iter_cues_is_lazy(processor):
+    def lines():
+        yield 'WEBVTT\n'
+        yield '\n'
+        yield '00:00:01.000 --> 00:00:02.000\n'
+        yield '첫 줄\n'
+        yield '00:00:02.000 --> 00:00:03.000\n'
+        raise AssertionError('첫 큐를 내보내기 전에 입력을 끝까지 읽음')
+
+    # 정리는 묶음 단위로 하므로 묶음 크기를 1로 줄여 다음 큐 시작에서 바로 내보내게 함
+    processor.CLEAN_BATCH_SIZE = 1
+    assert next(processor.iter_cues(lines())) == {'time': '00:01', 'text': '첫 줄'}
+
+
+def test_empty_input(processor):
+    assert list(processor.iter_cues('')) == []
+    assert processor.write_transcript(io.StringIO('WEBVTT\n\n'), io.StringIO()) == 0
+    assert processor.process('WEBVTT\n\n') is None
+
+
+@pytest.mark.parametrize('source', SOURCES.values(), ids=SOURCES.keys())
+def test_iter_timed_cues_matches_iter_cues(processor, source):
+    timed = list(processor.iter_timed_cues(source()))
+    assert timed == [(1000, 2000, '안녕하세요'), (2000, 3500, '여러분'), (5000, 6000, '오늘은   날씨가  좋네요')]
+    assert [text for _, _, text in timed] == [cue['text'] for cue in processor.iter_cues(VTT)]
@@ -0,0 +1,124 @@
+"""TranscriptIndex(SQLite FTS5) 증분 색인, 트랜잭션, 검색어 변환 테스트"""
+
+import sqlite3
+
+import pytest
+
+from src.subtitle_processor import SubtitleProcessor
+from src.transcript_index import TranscriptIndex
+
+CUES = [(0, 1000, '서울 날씨가 좋네요'), (1000, 2000, '부산은 비가 와요'), (65_000, 66_000, '서울에서 만나요')]
+
+
+@pytest.fixture
+def index(tmp_path):
+    with TranscriptIndex(str(tmp_path / 'index.sqlite')) as index:
+        yield index
+
+
+def _fts_rows(index, word):
+    return index._conn.execute('SELECT rowid FROM cues_fts WHERE cues_fts MATCH ?', (f'"{word}"',)).fetchall()
+
+
+def test_search(index):
+    assert index.index_cues('abc', 'ko', CUES, title='제목') == 3
+    results = index.search('서울*')
+
+    assert [(video['video_id'], video['lang'], video['title'], video['matches']) for video in results] == [
+        ('abc', 'ko', '제목', 2)
+    ]
+    # 영상 안의 큐는 시각 순, 일치한 단어는 [ ]로 표시
+    assert results[0]['hits'] == [
+        {'start_ms': 0, 'end_ms': 1000, 'text': '[서울] 날씨가 좋네요'},
+        {'start_ms': 65_000, 'end_ms': 66_000, 'text': '[서울에서] 만나요'},
+    ]
+    assert index.search('서울', lang='en') == []
+
+
+def test_reindex_unchanged_returns_zero(index):
+    assert index.index_cues('abc', 'ko', CUES, title='제목') == 3
+    assert index.index_cues('abc', 'ko', iter(CUES), title='제목') == 0
+    # 제목만 바뀌어도 다시 색인
+    assert index.index_cues('abc', 'ko', CUES, title='새 제목') == 3
+    assert index.stats() == {'documents': 1, 'videos': 1, 'cues': 3}
+
+
+def test_replace_removes_old_fts_rows(index):
+    index.index_cues('abc', 'ko', CUES)
+    assert len(_fts_rows(index, '부산은')) == 1
+
+    index.index_cues('abc', 'ko', [(0, 1000, '대구는 맑아요')])
+    assert _fts_rows(index, '부산은') == []
+    assert index.search('부산은') == []
+    assert [video['hits'][0]['text'] for video in index.search('대구는')] == ['[대구는] 맑아요']
+    # 외부 콘텐츠 FTS 색인과 cues 테이블이 일치
+    index._conn.execute("INSERT INTO cues_fts (cues_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def test_remove(index):
+    index.index_cues('abc', 'ko', CUES)
+    index.index_cues('abc', 'en', [(0, 1000, 'seoul weather')])
+    assert index.remove('abc', 'ko') == 1
+    assert _fts_rows(index, '부산은') == []
+    assert not index.is_indexed('abc', 'ko')
+    assert index.is_indexed('abc', 'en')
+    assert index.remove('abc') == 1
+    assert index.stats() == {'documents': 0, 'videos': 0, 'cues': 0}
+
+
+def test_bulk_commits_together(index):
+    with index.bulk():
+        index.index_cues('abc', 'ko', CUES)
+        index.index_cues('def', 'ko', [(0, 1000, '서울 여행')])
+    assert index.stats() == {'documents': 2, 'videos': 2, 'cues': 4}
+
+
+def test_bulk_rolls_back_on_exception(index):
+    index.index_cues('abc', 'ko', CUES)
+    with pytest.raises(RuntimeError):
+        with index.bulk():
+            index.index_cues('abc', 'ko', [(0, 1000, '대구는 맑아요')])
+            index.index_cues('def', 'ko', [(0, 1000, '서울 여행')])
+            raise RuntimeError('중단')
+
+    assert index.stats() == {'documents': 1, 'videos': 1, 'cues': 3}
+    assert len(_fts_rows(index, '부산은')) == 1
+    assert _fts_rows(index, '대구는') == []
+    # 취소한 뒤에도 다음 색인은 정상 동작
+    assert index.index_cues('def', 'ko', [(0, 1000, '서울 여행')]) == 1
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('서울 날씨', '"서울" "날씨"'),
+    ('서울*', '"서울"*'),
+    ('say "hi"', '"say" """hi"""'),
+    ('AND OR NOT', '"AND" "OR" "NOT"'),
+    ('a-b c:d (e)', '"a-b" "c:d" "(e)"'),
+    ('** *x*', '"*x"*'),
+])
+def test_build_query(text, expected):
+    assert TranscriptIndex.build_query(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', '   ', '* **'])
+def test_build_query_empty(text):
+    with pytest.raises(ValueError):
+        TranscriptIndex.build_query(text)
+
+
+def test_special_characters_are_searchable(index):
+    index.index_cues('abc', 'en', [(0, 1000, 'C++ and "quotes" NOT here')])
+    assert index.search('"quotes"')[0]['matches'] == 1
+    assert index.search('NOT')[0]['matches'] == 1
+    with pytest.raises(sqlite3.OperationalError):
+        index.search('NOT', raw_query=True)
+
+
+def test_index_vtt_uses_processed_cues(index):
+    vtt = (
+        "WEBVTT\n\n"
+        "00:00:01.000 --> 00:00:02.000\n오늘은 서울\n\n"
+        "00:00:02.000 --> 00:00:03.000\n오늘은 서울<00:00:02.500><c> 날씨</c>\n"
+    )
+    assert index.index_vtt('abc', 'ko', vtt, SubtitleProcessor()) == 2
+    assert [hit['text'] for hit in index.search('날씨')[0]['hits']] == ['[날씨]']
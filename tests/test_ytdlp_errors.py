@@ -0,0 +1,97 @@
+"""YtDlpFetcher.classify_error / retry_after_of 오류 분류 테스트"""
+
+import pytest
+from yt_dlp.utils import DownloadError
+
+from src.ytdlp_fetcher import (
+    YtDlpAuthError,
+    YtDlpBotCheckError,
+    YtDlpError,
+    YtDlpFetcher,
+    YtDlpThrottledError,
+    YtDlpTransientError,
+    YtDlpUnavailableError,
+)
+
+
+@pytest.mark.parametrize('message, expected', [
+    # 스로틀링
+    ('ERROR: [youtube] abc: HTTP Error 429: Too Many Requests', YtDlpThrottledError),
+    ("ERROR: [youtube] abc: Video unavailable. This content isn't available, try again later.",
+     YtDlpThrottledError),
+    # 봇 확인 (인증 오류이면서 속도도 낮춤)
+    ("ERROR: [youtube] abc: Sign in to confirm you're not a bot. Use --cookies-from-browser",
+     YtDlpBotCheckError),
+    # 인증
+    ('ERROR: [youtube] abc: Sign in to confirm your age. This video may be inappropriate', YtDlpAuthError),
+    ('ERROR: The provided YouTube account cookies are no longer valid', YtDlpAuthError),
+    ('ERROR: unable to download webpage: HTTP Error 403: Forbidden', YtDlpAuthError),
+    # 일시적 오류
+    ('ERROR: unable to download webpage: HTTP Error 503: Service Unavailable', YtDlpTransientError),
+    ('ERROR: unable to download webpage: The read operation timed out', YtDlpTransientError),
+    ('ERROR: unable to download webpage: [Errno 111] Connection refused', YtDlpTransientError),
+    ('ERROR: unable to download webpage: [Errno 101] Network is unreachable', YtDlpTransientError),
+    # 영구 실패 (메시지가 알려진 경우만)
+    ('ERROR: [youtube] abc: Video unavailable', YtDlpUnavailableError),
+    ("ERROR: [youtube] abc: Private video. Sign in if you've been granted access to this video",
+     YtDlpUnavailableError),
+    ('ERROR: [youtube] abc: This video has been removed by the uploader', YtDlpUnavailableError),
+    ("ERROR: [youtube] abc: Join this channel to get access to members-only content", YtDlpUnavailableError),
+    ('ERROR: [youtube] abc: The uploader has not made this video available in your country',
+     YtDlpUnavailableError),
+    ('ERROR: [youtube:tab] PLx: The playlist does not exist.', YtDlpUnavailableError),
+    # 익스트랙터 오류 등 모르는 오류는 영구 실패로 보지 않음
+    ('ERROR: [youtube] abc: Unable to extract initial player response', YtDlpError),
+    ('ERROR: [youtube] abc: Failed to extract any player response', YtDlpError),
+])
+def test_classify_download_error(message, expected):
+    error = YtDlpFetcher.classify_error(DownloadError(message))
+    assert type(error) is expected
+
+
+def test_classify_attributes():
+    throttled = YtDlpFetcher.classify_error(DownloadError('HTTP Error 429: Too Many Requests'))
+    assert throttled.retryable and throttled.throttled
+
+    bot_check = YtDlpFetcher.classify_error(DownloadError("Sign in to confirm you're not a bot"))
+    # 같은 쿠키로 재시도하지 않고 쿠키 갱신(YtDlpAuthError)으로 처리, 속도는 낮춤
+    assert isinstance(bot_check, YtDlpAuthError)
+    assert bot_check.throttled and not bot_check.retryable
+
+    unknown = YtDlpFetcher.classify_error(DownloadError('Unable to extract initial player response'))
+    assert unknown.kind == 'error' and not unknown.retryable
+
+
+def test_classify_other_exceptions():
+    assert type(YtDlpFetcher.classify_error(TimeoutError('read'))) is YtDlpTransientError
+    assert type(YtDlpFetcher.classify_error(KeyError('title'))) is YtDlpError
+
+    # 이미 분류된 오류는 그대로 반환
+    error = YtDlpUnavailableError('gone')
+    assert YtDlpFetcher.classify_error(error) is error
+
+
+class _Response:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class _HTTPError(Exception):
+    def __init__(self, message, headers):
+        super().__init__(message)
+        self.response = _Response(headers)
+
+
+def test_retry_after_from_download_error_exc_info():
+    cause = _HTTPError('HTTP Error 429: Too Many Requests', {'Retry-After': '7'})
+    error = DownloadError('ERROR: HTTP Error 429: Too Many Requests', exc_info=(type(cause), cause, None))
+
+    classified = YtDlpFetcher.classify_error(error)
+
+    assert type(classified) is YtDlpThrottledError
+    assert classified.retry_after == 7.0
+
+
+def test_retry_after_ignores_http_date():
+    error = _HTTPError('HTTP Error 429', {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert YtDlpFetcher.retry_after_of(error) is None